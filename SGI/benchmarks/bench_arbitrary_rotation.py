@@ -0,0 +1,82 @@
+"""
+Compara a matriz de rotação em torno de um eixo arbitrário construída pela fórmula de Rodrigues
+(com e sem o cache) com a composição das 7 matrizes usada originalmente: tempo por chamada e
+maior diferença entre as duas construções.
+
+Executar de dentro de SGI: python benchmarks/bench_arbitrary_rotation.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.transformation_generator import TransformationGenerator
+from tests.test_rotations import get_composed_rotation_matrix
+
+# Quantidade de eixos e ângulos aleatórios usados na comparação
+NUM_CASES = 20_000
+# Quantidade de chamadas em cada medida de tempo
+NUM_CALLS = 20_000
+
+
+def get_random_cases(rng: np.random.Generator, num_cases: int) -> list[tuple]:
+    """
+    Sorteia ângulos e eixos, com comprimentos de eixo de escalas bem diferentes.
+    @return: Lista de tuplas (ângulo, p1, p2).
+    """
+
+    cases = []
+    for _ in range(num_cases):
+        p1 = tuple(rng.uniform(-100, 100, 3))
+        p2 = tuple(np.array(p1) + rng.normal(size=3) * rng.choice([1e-3, 1, 100]))
+        cases.append((rng.uniform(-720, 720), p1, p2))
+    return cases
+
+
+def time_per_call(function, cases: list[tuple]) -> float:
+    """
+    Mede o tempo médio, em microssegundos, de uma chamada de function sobre os casos dados.
+    """
+
+    def run():
+        for angle, p1, p2 in cases:
+            function(angle, p1, p2)
+
+    return min(timeit.repeat(run, number=1, repeat=3)) / len(cases) * 1e6
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    cases = get_random_cases(rng, NUM_CASES)
+
+    max_difference = max(
+        np.abs(
+            TransformationGenerator.get_arbitrary_rotation_matrix(*case)
+            - get_composed_rotation_matrix(*case)
+        ).max()
+        for case in cases
+    )
+    print(f"Maior diferença em {NUM_CASES} casos: {max_difference:.2e}")
+
+    timing_cases = cases[:NUM_CALLS]
+    uncached = TransformationGenerator._get_cached_arbitrary_rotation_matrix.__wrapped__
+    print(
+        f"Composição de 7 matrizes: "
+        f"{time_per_call(get_composed_rotation_matrix, timing_cases):.1f} us"
+    )
+    print(f"Rodrigues sem cache: {time_per_call(uncached, timing_cases):.1f} us")
+
+    # Mesmo eixo e mesmo ângulo a cada chamada, como em rotações repetidas
+    repeated_cases = [timing_cases[0]] * NUM_CALLS
+    cached = TransformationGenerator.get_arbitrary_rotation_matrix
+    print(
+        f"Rodrigues com cache (acerto): {time_per_call(cached, repeated_cases):.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
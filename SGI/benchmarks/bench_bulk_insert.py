@@ -0,0 +1,88 @@
+"""
+Compara a inserção de muitos objetos com Model.add_objects, que redesenha a interface uma única
+vez, com chamadas sucessivas de Model.add_object, que redesenham a cada objeto. Mede também a
+inserção repetida dos mesmos objetos, em que todos são pulados pelo índice de geometria.
+
+Executar de dentro de SGI: python benchmarks/bench_bulk_insert.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.headless_view import HeadlessView
+from model.model import Model
+
+# Quantidade de objetos inseridos de uma vez com add_objects
+NUM_BULK_OBJECTS = 10_000
+# Quantidade de objetos inseridos um a um com add_object (cada chamada redesenha a cena)
+NUM_SINGLE_OBJECTS = 500
+
+
+def get_object_specs(num_objects: int) -> list[dict]:
+    """Retas, triângulos e pontos em posições aleatórias, como recebidos por add_objects."""
+
+    rng = np.random.default_rng(0)
+    specs = []
+
+    for i in range(num_objects):
+        object_type = ("Line", "Polygon", "Point")[i % 3]
+        num_points = {"Line": 2, "Polygon": 3, "Point": 1}[object_type]
+        center = rng.uniform(-20, 20, 3) + [0, 0, 30]
+        points = center + rng.normal(size=(num_points, 3))
+        specs.append(
+            {
+                "points": [tuple(point) for point in points],
+                "name": "",
+                "color": (0, 0, 0),
+                "object_type": object_type,
+            }
+        )
+
+    return specs
+
+
+def main() -> None:
+    specs = get_object_specs(NUM_BULK_OBJECTS)
+
+    model = Model(HeadlessView())
+    start_time = time.perf_counter()
+    model.add_objects(specs)
+    bulk_time = time.perf_counter() - start_time
+    print(
+        f"add_objects, {NUM_BULK_OBJECTS} objetos: {bulk_time:.2f} s "
+        f"({bulk_time / NUM_BULK_OBJECTS * 1e6:.0f} us por objeto)"
+    )
+
+    start_time = time.perf_counter()
+    model.add_objects(specs)
+    repeated_time = time.perf_counter() - start_time
+    print(
+        f"add_objects, {NUM_BULK_OBJECTS} repetidos: {repeated_time:.2f} s "
+        f"({len(model.display_file_manager.display_file)} objetos no display file)"
+    )
+
+    model = Model(HeadlessView())
+    start_time = time.perf_counter()
+    for spec in specs[:NUM_SINGLE_OBJECTS]:
+        model.add_object(
+            points=spec["points"],
+            name=spec["name"],
+            color=spec["color"],
+            is_filled=False,
+            object_type=spec["object_type"],
+            edges=None,
+        )
+    single_time = time.perf_counter() - start_time
+    print(
+        f"add_object, {NUM_SINGLE_OBJECTS} chamadas: {single_time:.2f} s "
+        f"({single_time / NUM_SINGLE_OBJECTS * 1e6:.0f} us por objeto)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Compara as coordenadas no viewport produzidas com os pontos em float32 e em float64 (ver
+Model.change_points_precision), numa cena com os objetos de teste, um wireframe de 150x150
+pontos (um relevo) e 2000 octógonos. A cena passa por rotações da window, rotações em torno de
+um eixo arbitrário, transformações em grupo, pan e zoom e troca de projeção; a cada etapa, o
+lote de desenho das duas precisões é comparado vértice a vértice, em pixels.
+
+Executar de dentro de SGI: python benchmarks/bench_float32_accuracy.py
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.headless_view import HeadlessView
+from model.model import Model
+
+MESH_SIZE = 150
+NUM_POLYGONS = 2000
+
+
+def get_scene_specs() -> list[dict]:
+    """Descrição dos objetos da cena, como recebida por Model.add_objects."""
+
+    rng = np.random.default_rng(0)
+
+    grid = np.stack(np.meshgrid(np.arange(MESH_SIZE), np.arange(MESH_SIZE)), -1)
+    grid = grid.reshape(-1, 2)
+    heights = 2 * np.sin(grid[:, 0] / 7.0) * np.cos(grid[:, 1] / 9.0) + 20
+    mesh_points = np.column_stack([grid * 0.2 - 15, heights])
+    indices = np.arange(MESH_SIZE * MESH_SIZE).reshape(MESH_SIZE, MESH_SIZE)
+    mesh_edges = np.concatenate(
+        [
+            np.column_stack([indices[:, :-1].ravel(), indices[:, 1:].ravel()]),
+            np.column_stack([indices[:-1].ravel(), indices[1:].ravel()]),
+        ]
+    )
+
+    specs = [
+        {
+            "points": [tuple(point) for point in mesh_points],
+            "name": "mesh",
+            "color": (0, 0, 255),
+            "object_type": "Wireframe",
+            "edges": mesh_edges.tolist(),
+        }
+    ]
+    for i in range(NUM_POLYGONS):
+        center = rng.uniform(-15, 15, 3) * [1, 1, 0] + [0, 0, 25]
+        angles = np.sort(rng.uniform(0, 2 * np.pi, 8))
+        radius = rng.uniform(0.2, 1)
+        specs.append(
+            {
+                "points": [
+                    tuple(center + [radius * np.cos(a), radius * np.sin(a), 0])
+                    for a in angles
+                ],
+                "name": f"octagon {i}",
+                "color": (0, 0, 0),
+                "object_type": "Polygon",
+            }
+        )
+
+    return specs
+
+
+def run_scene(precision: str) -> list[tuple[str, np.ndarray, np.ndarray]]:
+    """
+    Monta a cena com a precisão dada e executa as etapas.
+    @return: Lista de (etapa, vértices, offsets) do lote de desenho ao final de cada etapa.
+    """
+
+    view = HeadlessView()
+    model = Model(view)
+    model.change_points_precision(precision)
+    model.add_test_objects()
+    model.add_objects(get_scene_specs())
+
+    display_file = model.display_file_manager.display_file
+    mesh_id = next(key for key, obj in display_file.items() if obj.name == "mesh")
+    polygon_ids = [
+        key for key, obj in display_file.items() if obj.name.startswith("octagon")
+    ]
+
+    frames = []
+
+    def record(step: str) -> None:
+        render_batch = view.viewport.render_batch
+        render_batch.pack()
+        frames.append((step, render_batch.vertices.copy(), render_batch.offsets.copy()))
+
+    record("inicial")
+
+    for _ in range(36):
+        model.rotate_window(10, "horizontal")
+    record("36 rotações de 10° da window")
+
+    for _ in range(100):
+        model.handle_transformations(
+            mesh_id,
+            [
+                {
+                    "type": "rotation",
+                    "angle": 3.6,
+                    "axis": "arbitrary",
+                    "x1": 0,
+                    "y1": 0,
+                    "z1": 20,
+                    "x2": 1,
+                    "y2": 1,
+                    "z2": 21,
+                }
+            ],
+        )
+    record("+ 100 rotações de 3,6° em eixo arbitrário")
+
+    for _ in range(50):
+        model.handle_group_transformations(
+            polygon_ids,
+            [
+                {
+                    "type": "rotation",
+                    "angle": 7.2,
+                    "axis": "Z",
+                    "x1": 0,
+                    "y1": 0,
+                    "z1": 0,
+                    "x2": 0,
+                    "y2": 0,
+                    "z2": 0,
+                },
+                {"type": "translation", "dx": 0.1, "dy": -0.1, "dz": 0},
+            ],
+        )
+    record("+ 50 transformações em grupo")
+
+    model.pan(3, -2, 5)
+    model.rotate_window(30, "vertical")
+    model.zoom(150)
+    record("+ pan, rotação vertical e zoom 150")
+
+    model.change_projection_mode("parallel")
+    record("+ projeção paralela")
+
+    # A precisão é um atributo de classe: volta ao padrão para a próxima execução
+    model.change_points_precision("float64")
+    return frames
+
+
+def main() -> None:
+    reference_frames = run_scene("float64")
+    float32_frames = run_scene("float32")
+
+    print(f"{'etapa':44s} {'máximo':>9s} {'p99,9':>9s} {'média':>9s}  (pixels)")
+    for (step, reference, reference_offsets), (_, vertices, offsets) in zip(
+        reference_frames, float32_frames
+    ):
+        if not np.array_equal(reference_offsets, offsets):
+            print(f"{step:44s} primitivas diferentes")
+            continue
+
+        errors = np.linalg.norm(vertices - reference, axis=1)
+        print(
+            f"{step:44s} {errors.max():9.1e} {np.percentile(errors, 99.9):9.1e} "
+            f"{errors.mean():9.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Mede a vazão (bytes por segundo) da exportação .obj de uma cena com os objetos de teste, um
+wireframe de 300x300 pontos e 5000 polígonos: escrevendo no arquivo, com Model.export_obj_file,
+e apenas formatando o texto num buffer em memória.
+
+Executar de dentro de SGI: python benchmarks/bench_obj_export.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.headless_view import HeadlessView
+from model.model import Model
+
+MESH_SIZE = 300
+NUM_POLYGONS = 5000
+
+
+def get_scene_specs() -> list[dict]:
+    """Descrição dos objetos da cena, como recebida por Model.add_objects."""
+
+    rng = np.random.default_rng(0)
+
+    grid = np.stack(np.meshgrid(np.arange(MESH_SIZE), np.arange(MESH_SIZE)), -1)
+    grid = grid.reshape(-1, 2)
+    mesh_points = np.column_stack([grid * 0.1 - 15, rng.uniform(19, 21, len(grid))])
+    indices = np.arange(MESH_SIZE * MESH_SIZE).reshape(MESH_SIZE, MESH_SIZE)
+    mesh_edges = np.concatenate(
+        [
+            np.column_stack([indices[:, :-1].ravel(), indices[:, 1:].ravel()]),
+            np.column_stack([indices[:-1].ravel(), indices[1:].ravel()]),
+        ]
+    )
+
+    specs = [
+        {
+            "points": [tuple(point) for point in mesh_points],
+            "name": "mesh",
+            "color": (0, 0, 255),
+            "object_type": "Wireframe",
+            "edges": mesh_edges.tolist(),
+        }
+    ]
+    for i in range(NUM_POLYGONS):
+        specs.append(
+            {
+                "points": [tuple(point) for point in rng.uniform(-20, 20, (5, 3))],
+                "name": f"polygon {i}",
+                "color": (0, 0, 0),
+                "object_type": "Polygon",
+                "is_filled": bool(i % 2),
+            }
+        )
+
+    return specs
+
+
+def main() -> None:
+    model = Model(HeadlessView())
+    model.add_test_objects()
+    model.add_objects(get_scene_specs())
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "scene.obj")
+
+        file_time = min(
+            timeit.repeat(lambda: model.export_obj_file(filepath), number=1, repeat=5)
+        )
+        written_bytes = os.path.getsize(filepath)
+
+    def write_to_buffer():
+        model.display_file_manager.write_display_file_to_obj(io.StringIO())
+
+    buffer_time = min(timeit.repeat(write_to_buffer, number=1, repeat=5))
+
+    print(f"Tamanho do arquivo: {written_bytes / 1e6:.1f} MB")
+    print(
+        f"export_obj_file: {file_time:.3f} s ({written_bytes / file_time / 1e6:.1f} MB/s)"
+    )
+    print(
+        f"Somente formatação (io.StringIO): {buffer_time:.3f} s "
+        f"({written_bytes / buffer_time / 1e6:.1f} MB/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
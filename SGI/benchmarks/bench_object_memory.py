@@ -0,0 +1,196 @@
+"""
+Mede a memória ocupada por objeto de cada tipo, com tracemalloc:
+- logo após a construção;
+- depois de adicionados ao display file e projetados uma vez, quando passam a guardar também
+  as coordenadas projetadas (e, nas curvas e superfícies, os pontos gerados).
+Para os objetos projetados, mostra também a estimativa de WorldObject.get_memory_size, que
+soma o tamanho (sys.getsizeof) da instância e dos arrays e contêineres que ela referencia.
+
+Os valores incluem o nome de cada objeto e a sua posição na lista que o guarda.
+
+Executar de dentro de SGI: python benchmarks/bench_object_memory.py
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.display_file_manager import DisplayFileManager
+from model.window import Window
+from model.world_objects.world_bezier_curve import WorldBezierCurve
+from model.world_objects.world_bezier_surface import WorldBezierSurface
+from model.world_objects.world_bicubic_surface import WorldBicubicSurface
+from model.world_objects.world_bspline_curve import WorldBSplineCurve
+from model.world_objects.world_line import WorldLine
+from model.world_objects.world_point import WorldPoint
+from model.world_objects.world_polygon import WorldPolygon
+from model.world_objects.world_wireframe import WorldWireframe
+from view.graphical_objects.graphical_line import GraphicalLine
+from view.viewport.viewport_bounds import ViewportBounds
+
+VIEWPORT_BOUNDS = ViewportBounds(10, 10, 790, 590)
+
+CUBE_POINTS = [(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+CUBE_EDGES = [
+    (0, 1),
+    (1, 3),
+    (3, 2),
+    (2, 0),
+    (4, 5),
+    (5, 7),
+    (7, 6),
+    (6, 4),
+    (0, 4),
+    (1, 5),
+    (2, 6),
+    (3, 7),
+]
+
+
+def offset(points: list[tuple], i: int) -> list[tuple]:
+    """Desloca os pontos em z, para que os objetos de um mesmo tipo não sejam repetidos."""
+    return [(x, y, z + i * 1e-4) for x, y, z in points]
+
+
+def get_surface_grid(i: int) -> list[list[list[float]]]:
+    return [[[row, column, i * 1e-4] for column in range(4)] for row in range(4)]
+
+
+# Tipo -> (quantidade de objetos, função que constrói o objeto i)
+OBJECT_MAKERS: dict[str, tuple[int, Callable]] = {
+    "Point": (
+        20_000,
+        lambda i: WorldPoint(
+            offset([(0, 0, 0)], i), f"p{i}", (0, 0, 0), VIEWPORT_BOUNDS
+        ),
+    ),
+    "Line": (
+        20_000,
+        lambda i: WorldLine(
+            offset([(0, 0, 0), (0, 1, 0)], i), f"l{i}", (0, 0, 0), VIEWPORT_BOUNDS
+        ),
+    ),
+    "Polygon": (
+        20_000,
+        lambda i: WorldPolygon(
+            offset([(0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0)], i),
+            f"y{i}",
+            (0, 0, 0),
+            VIEWPORT_BOUNDS,
+            True,
+        ),
+    ),
+    "Wireframe": (
+        20_000,
+        lambda i: WorldWireframe(
+            offset(CUBE_POINTS, i), f"w{i}", (0, 0, 0), VIEWPORT_BOUNDS, CUBE_EDGES
+        ),
+    ),
+    "BezierCurve": (
+        20_000,
+        lambda i: WorldBezierCurve(
+            offset([(0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0)], i),
+            f"b{i}",
+            (0, 0, 0),
+            VIEWPORT_BOUNDS,
+        ),
+    ),
+    "BSplineCurve": (
+        20_000,
+        lambda i: WorldBSplineCurve(
+            offset([(0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0)], i),
+            f"s{i}",
+            (0, 0, 0),
+            VIEWPORT_BOUNDS,
+        ),
+    ),
+    "BezierSurface": (
+        20_000,
+        lambda i: WorldBezierSurface(
+            get_surface_grid(i), f"bs{i}", (0, 0, 0), VIEWPORT_BOUNDS
+        ),
+    ),
+    "BicubicSurface": (
+        20_000,
+        lambda i: WorldBicubicSurface(
+            get_surface_grid(i), f"bc{i}", (0, 0, 0), VIEWPORT_BOUNDS
+        ),
+    ),
+}
+
+
+def measure(function: Callable) -> tuple[object, int]:
+    """
+    Executa function e mede a memória alocada que continua em uso ao final.
+    @return: Tupla com o retorno de function e os bytes alocados.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    allocated_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, allocated_bytes
+
+
+def measure_projected(make_object: Callable, num_objects: int) -> tuple[list, int]:
+    """
+    Constrói os objetos, adiciona ao display file e projeta uma vez. A medida inclui as
+    entradas do display file e dos seus índices para cada objeto.
+    @return: Tupla com os objetos e os bytes alocados.
+    """
+
+    display_file_manager = DisplayFileManager(VIEWPORT_BOUNDS)
+    window = Window(VIEWPORT_BOUNDS)
+
+    def build_and_project():
+        objects = [make_object(i) for i in range(num_objects)]
+        display_file_manager.add_objects(objects)
+        display_file_manager.update_projections(
+            center_of_projection=window.center_of_projection,
+            window_width=window.get_width(),
+            window_height=window.get_height(),
+        )
+        return objects
+
+    return measure(build_and_project)
+
+
+def main() -> None:
+    print(
+        f"{'Tipo':16s} {'construído':>11s} {'projetado':>10s} {'get_memory_size':>16s}"
+    )
+
+    for type_name, (num_objects, make_object) in OBJECT_MAKERS.items():
+        objects, built_bytes = measure(
+            lambda: [make_object(i) for i in range(num_objects)]
+        )
+        del objects
+
+        objects, projected_bytes = measure_projected(make_object, num_objects)
+        estimated_size = sum(obj.get_memory_size() for obj in objects) // num_objects
+        del objects
+
+        print(
+            f"{type_name:16s} {built_bytes // num_objects:9d} B "
+            f"{projected_bytes // num_objects:8d} B {estimated_size:14d} B"
+        )
+
+    num_objects = 20_000
+    graphical_lines, built_bytes = measure(
+        lambda: [
+            GraphicalLine(np.array([[i, 0.0], [i, 1.0]]), (0, 0, 0))
+            for i in range(num_objects)
+        ]
+    )
+    print(f"{'GraphicalLine':16s} {built_bytes // num_objects:9d} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Compara as duas formas de entregar um quadro ao Viewport: uma lista de objetos gráficos (um por
+linha, ponto ou polígono, como em WorldObject.get_clipped_representation) e o lote compacto
+(RenderBatch, montado por DisplayFileManager.get_render_batch). Para cada uma, mede a memória
+retida pelo quadro e o pico durante a sua produção (tracemalloc), o tempo de produção e o tempo
+de desenho numa imagem fora da tela.
+
+A cena tem 1500 polígonos, 300 retas e um wireframe em grade de 60x60 pontos.
+
+Executar de dentro de SGI: python benchmarks/bench_render_batch.py
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.headless_view import HeadlessView
+from model.model import Model
+from model.world_objects.world_point_cloud import WorldPointCloud
+from model.world_objects.world_surface import WorldSurface
+from PyQt6 import QtGui
+
+NUM_POLYGONS = 1500
+NUM_LINES = 300
+GRID_SIZE = 60
+
+
+def get_scene_specs() -> list[dict]:
+    """Descrição dos objetos da cena, como recebida por Model.add_objects."""
+
+    rng = np.random.default_rng(0)
+    specs = []
+
+    for i in range(NUM_POLYGONS):
+        center = np.append(rng.uniform(-12, 12, 2), rng.uniform(15, 30))
+        angles = np.sort(rng.uniform(0, 2 * np.pi, 6))
+        radius = rng.uniform(0.3, 1.5)
+        specs.append(
+            {
+                "points": [
+                    tuple(center + [radius * np.cos(a), radius * np.sin(a), 0])
+                    for a in angles
+                ],
+                "name": f"polygon {i}",
+                "color": tuple(int(c) for c in rng.integers(0, 256, 3)),
+                "object_type": "Polygon",
+                "is_filled": bool(i % 2),
+            }
+        )
+
+    for i in range(NUM_LINES):
+        start = np.append(rng.uniform(-20, 20, 2), rng.uniform(10, 30))
+        end = start + rng.normal(size=3) * 5
+        specs.append(
+            {
+                "points": [tuple(start), tuple(end)],
+                "name": f"line {i}",
+                "color": (0, 0, 0),
+                "object_type": "Line",
+            }
+        )
+
+    grid = np.stack(np.meshgrid(np.arange(GRID_SIZE), np.arange(GRID_SIZE)), -1)
+    grid = grid.reshape(-1, 2)
+    indices = np.arange(GRID_SIZE * GRID_SIZE).reshape(GRID_SIZE, GRID_SIZE)
+    specs.append(
+        {
+            "points": [
+                tuple(point)
+                for point in np.column_stack(
+                    [grid * 0.5 - 15, np.full(len(grid), 25.0)]
+                )
+            ],
+            "name": "grid",
+            "color": (0, 0, 255),
+            "object_type": "Wireframe",
+            "edges": np.concatenate(
+                [
+                    np.column_stack([indices[:, :-1].ravel(), indices[:, 1:].ravel()]),
+                    np.column_stack([indices[:-1].ravel(), indices[1:].ravel()]),
+                ]
+            ).tolist(),
+        }
+    )
+
+    return specs
+
+
+def measure_memory(produce: Callable) -> tuple[object, int, int, int]:
+    """
+    Produz um quadro e mede a memória que ele retém.
+    @return: Tupla com o quadro, os blocos e os bytes retidos e o pico de bytes.
+    """
+
+    tracemalloc.start()
+    frame = produce()
+    snapshot = tracemalloc.take_snapshot()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    statistics = snapshot.statistics("filename")
+    retained_blocks = sum(statistic.count for statistic in statistics)
+    retained_bytes = sum(statistic.size for statistic in statistics)
+    return frame, retained_blocks, retained_bytes, peak_bytes
+
+
+def measure_time(function: Callable) -> float:
+    """Tempo mínimo, em milissegundos, de uma chamada de function."""
+    return min(timeit.repeat(function, number=1, repeat=7)) * 1e3
+
+
+def main() -> None:
+    app = QtGui.QGuiApplication(sys.argv[:1])
+
+    view = HeadlessView()
+    model = Model(view)
+    model.add_objects(get_scene_specs())
+    display_file_manager = model.display_file_manager
+
+    def get_graphical_objects() -> list:
+        graphical_objects = []
+        for obj in display_file_manager.display_file.values():
+            if isinstance(obj, (WorldSurface, WorldPointCloud)) or len(
+                obj.projection_points
+            ):
+                graphical_objects.extend(obj.get_clipped_representation())
+        return graphical_objects
+
+    def get_render_batch():
+        render_batch = display_file_manager.get_render_batch()
+        render_batch.pack()
+        return render_batch
+
+    image = QtGui.QImage(800, 600, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+
+    def draw(draw_frame: Callable) -> None:
+        image.fill(0xFFFFFFFF)
+        painter = QtGui.QPainter(image)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        draw_frame(painter)
+        painter.end()
+
+    graphical_objects, *graphical_memory = measure_memory(get_graphical_objects)
+    render_batch, *batch_memory = measure_memory(get_render_batch)
+
+    def draw_graphical_objects(painter: QtGui.QPainter) -> None:
+        for graphical_object in graphical_objects:
+            graphical_object.draw(painter)
+
+    rows = [
+        (
+            f"objetos gráficos ({len(graphical_objects)})",
+            graphical_memory,
+            measure_time(get_graphical_objects),
+            measure_time(lambda: draw(draw_graphical_objects)),
+        ),
+        (
+            f"lote ({len(render_batch)} primitivas)",
+            batch_memory,
+            measure_time(get_render_batch),
+            measure_time(lambda: draw(render_batch.draw)),
+        ),
+    ]
+
+    print(
+        f"{'quadro':32s} {'blocos':>8s} {'retido':>10s} {'pico':>10s} "
+        f"{'produção':>10s} {'desenho':>10s}"
+    )
+    for name, (blocks, retained, peak), production_time, draw_time in rows:
+        print(
+            f"{name:32s} {blocks:8d} {retained / 1e3:7.0f} kB {peak / 1e3:7.0f} kB "
+            f"{production_time:7.1f} ms {draw_time:7.1f} ms"
+        )
+
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+View sem janela para os benchmarks: recebe do Model o lote de desenho de cada quadro e as
+mensagens de log, sem desenhar nada.
+"""
+
+from view.graphical_objects.render_batch import RenderBatch
+from view.viewport.viewport_bounds import ViewportBounds
+
+
+class HeadlessViewport:
+    """Viewport sem janela, que guarda o último lote de desenho recebido."""
+
+    def __init__(self, viewport_bounds: ViewportBounds):
+        self.viewport_bounds = viewport_bounds
+        self.render_batch: RenderBatch | None = None
+
+    def update_viewport(self, render_batch: RenderBatch) -> None:
+        self.render_batch = render_batch
+
+
+class HeadlessView:
+    """View sem janela, com a interface usada pelo Model."""
+
+    def __init__(self, viewport_bounds: ViewportBounds | None = None):
+        self.viewport = HeadlessViewport(
+            viewport_bounds or ViewportBounds(10, 10, 790, 590)
+        )
+        self.logs: list[str] = []
+        self.obj_list: list[tuple[int, str]] = []
+
+    def add_log(self, message: str) -> None:
+        self.logs.append(message)
+
+    def set_import_running(self, running: bool) -> None:
+        pass
+
+    def update_view_objects(
+        self, render_batch: RenderBatch, obj_list: list[tuple[int, str]]
+    ) -> None:
+        self.viewport.update_viewport(render_batch)
+        self.obj_list = obj_list
@@ -44,13 +44,13 @@ class Controller:
             edges=edges_input,
         )
 
-    def handle_remove_object(self, index: int) -> None:
+    def handle_remove_objects(self, object_ids: list[int]) -> None:
         """
-        Remove um objeto do mundo.
-        @param index: Índice do objeto a ser removido.
+        Remove objetos do mundo.
+        @param object_ids: Identificadores dos objetos a serem removidos.
         """
 
-        self.model.remove_object(index=index)
+        self.model.remove_objects(object_ids=object_ids)
 
     def handle_zoom(self, new_zoom_value: float) -> None:
         """
@@ -73,15 +73,32 @@ class Controller:
         self.model.pan(d_horizontal, d_vertical, d_depth)
 
     def handle_transformations(
-        self, index: int, transformations_list: list[dict]
+        self, object_id: int, transformations_list: list[dict]
     ) -> None:
         """
         Processa uma lista de transformações aplicadas a um objeto.
-        @param index: Índice do objeto a ser transformado.
+        @param object_id: Identificador do objeto a ser transformado.
         @param transformations_list: Lista de transformações a serem aplicadas.
         """
 
-        self.model.handle_transformations(index, transformations_list)
+        self.model.handle_transformations(object_id, transformations_list)
+
+    def handle_group_transformations(
+        self,
+        object_ids: list[int],
+        transformations_list: list[dict],
+        use_own_centers: bool,
+    ) -> None:
+        """
+        Processa uma lista de transformações aplicadas a vários objetos de uma vez.
+        @param object_ids: Identificadores dos objetos a serem transformados.
+        @param transformations_list: Lista de transformações a serem aplicadas.
+        @param use_own_centers: Se cada objeto usa o próprio centro, em vez do centro do grupo.
+        """
+
+        self.model.handle_group_transformations(
+            object_ids, transformations_list, use_own_centers
+        )
 
     def handle_window_rotation(self, rotation_type: str, angle: float) -> None:
         """
@@ -94,10 +111,14 @@ class Controller:
 
     def handle_import_obj_file(self, filepath: str) -> None:
         """
-        Importa um arquivo .obj.
-        @param filepath: Caminho do arquivo .obj.
+        Importa, em segundo plano, um arquivo .obj ou de cena binária (.sgi).
+        @param filepath: Caminho do arquivo.
         """
-        self.model.import_obj_file(filepath)
+        self.model.start_import(filepath)
+
+    def handle_cancel_import(self) -> None:
+        """Cancela a importação em andamento."""
+        self.model.cancel_import()
 
     def handle_export_obj_file(self, filepath: str) -> None:
         """
@@ -106,6 +127,13 @@ class Controller:
         """
         self.model.export_obj_file(filepath)
 
+    def handle_export_scene_file(self, filepath: str) -> None:
+        """
+        Salva a cena no formato binário (.sgi).
+        @param filepath: Caminho do arquivo .sgi.
+        """
+        self.model.export_scene_file(filepath)
+
     def handle_cop_distance_change(self, new_distance: float) -> None:
         """
         Muda a distância do centro de projeção.
@@ -0,0 +1,287 @@
+import numpy as np
+from model.world_objects.world_object import BOX_CORNER_SELECTORS, WorldObject
+
+# Quantidade máxima de objetos em uma folha da hierarquia
+BVH_LEAF_SIZE = 8
+
+# Fração dos objetos transformados desde a construção a partir da qual a hierarquia é
+# reconstruída em vez de apenas reajustada (as caixas reajustadas ficam cada vez mais folgadas)
+BVH_REBUILD_FRACTION = 0.5
+
+
+class BoundingVolumeHierarchy:
+    """
+    Hierarquia de caixas envolventes sobre os objetos do display file, nas coordenadas
+    percebidas (ver WorldObject.update_bounds). Como a câmera não altera as coordenadas
+    percebidas, a hierarquia só muda quando objetos são adicionados, removidos ou transformados,
+    e serve para descartar subárvores inteiras fora do volume de visualização antes de qualquer
+    projeção.
+
+    Os nós ficam em arrays, com os pais antes dos filhos: cada nó guarda sua caixa, os filhos
+    (-1 nas folhas) e o intervalo de objetos que contém, na ordem de object_ids.
+    """
+
+    def __init__(self):
+        self.needs_rebuild = True
+        # Objetos transformados desde o último reajuste
+        self.changed_ids: set[int] = set()
+        self.changed_since_build = 0
+
+        self.object_ids = np.empty(0, dtype=int)
+        self.object_bounds = np.empty((0, 2, 3))
+        # Posição de cada objeto em object_ids
+        self.object_positions: dict[int, int] = {}
+        # Objetos sem pontos, sempre considerados visíveis
+        self.unbounded_ids: list[int] = []
+
+        self.node_bounds = np.empty((0, 2, 3))
+        self.node_children = np.empty((0, 2), dtype=int)
+        self.node_ranges = np.empty((0, 2), dtype=int)
+        self.node_depths = np.empty(0, dtype=int)
+
+    def invalidate(self) -> None:
+        """Marca a hierarquia para ser reconstruída (objetos adicionados ou removidos)."""
+        self.needs_rebuild = True
+
+    def mark_changed(self, object_ids: list[int]) -> None:
+        """
+        Marca objetos cujas caixas envolventes mudaram, para que a hierarquia seja reajustada.
+        @param object_ids: Identificadores dos objetos transformados.
+        """
+        self.changed_ids.update(object_ids)
+
+    def update(self, display_file: dict[int, WorldObject]) -> None:
+        """
+        Reconstrói ou reajusta a hierarquia, se necessário, antes de uma consulta.
+        @param display_file: Objetos do display file, indexados pelo identificador.
+        """
+
+        if self.changed_ids and not self.needs_rebuild:
+            self.changed_since_build += len(self.changed_ids)
+            if self.changed_since_build > BVH_REBUILD_FRACTION * len(self.object_ids):
+                self.needs_rebuild = True
+
+        if self.needs_rebuild:
+            self.build(display_file)
+        elif self.changed_ids:
+            self.refit(display_file)
+
+    def build(self, display_file: dict[int, WorldObject]) -> None:
+        """
+        Constrói a hierarquia de cima para baixo, dividindo cada nó ao meio (pela mediana dos
+        centros das caixas) no eixo em que os centros estão mais espalhados.
+        @param display_file: Objetos do display file, indexados pelo identificador.
+        """
+
+        bounded_objects = [
+            obj for obj in display_file.values() if obj.bounds is not None
+        ]
+        self.unbounded_ids = [
+            obj.object_id for obj in display_file.values() if obj.bounds is None
+        ]
+
+        object_ids = np.array([obj.object_id for obj in bounded_objects], dtype=int)
+        object_bounds = np.array([obj.bounds for obj in bounded_objects]).reshape(
+            -1, 2, 3
+        )
+        box_centers = object_bounds.mean(axis=1)
+
+        order = np.arange(len(object_ids))
+        node_bounds = []
+        node_children = []
+        node_ranges = []
+        node_depths = []
+
+        def new_node(start: int, end: int, depth: int) -> int:
+            node_index = len(node_bounds)
+            node_objects = object_bounds[order[start:end]]
+            node_bounds.append(
+                (node_objects[:, 0].min(axis=0), node_objects[:, 1].max(axis=0))
+            )
+            node_children.append([-1, -1])
+            node_ranges.append((start, end))
+            node_depths.append(depth)
+            return node_index
+
+        if len(object_ids):
+            pending_nodes = [new_node(0, len(object_ids), 0)]
+        else:
+            pending_nodes = []
+
+        while pending_nodes:
+            node_index = pending_nodes.pop()
+            start, end = node_ranges[node_index]
+            if end - start <= BVH_LEAF_SIZE:
+                continue
+
+            node_centers = box_centers[order[start:end]]
+            split_axis = np.argmax(np.ptp(node_centers, axis=0))
+            middle = (end - start) // 2
+            order[start:end] = order[start:end][
+                np.argpartition(node_centers[:, split_axis], middle)
+            ]
+
+            depth = node_depths[node_index] + 1
+            children = [
+                new_node(start, start + middle, depth),
+                new_node(start + middle, end, depth),
+            ]
+            node_children[node_index] = children
+            pending_nodes.extend(children)
+
+        self.object_ids = object_ids[order]
+        self.object_bounds = object_bounds[order]
+        self.object_positions = {
+            object_id: position
+            for position, object_id in enumerate(self.object_ids.tolist())
+        }
+
+        self.node_bounds = np.array(node_bounds).reshape(-1, 2, 3)
+        self.node_children = np.array(node_children, dtype=int).reshape(-1, 2)
+        self.node_ranges = np.array(node_ranges, dtype=int).reshape(-1, 2)
+        self.node_depths = np.array(node_depths, dtype=int)
+
+        self.needs_rebuild = False
+        self.changed_ids.clear()
+        self.changed_since_build = 0
+
+    def refit(self, display_file: dict[int, WorldObject]) -> None:
+        """
+        Atualiza as caixas dos objetos transformados e recalcula as caixas dos nós, de baixo
+        para cima, sem mudar a estrutura da hierarquia.
+        @param display_file: Objetos do display file, indexados pelo identificador.
+        """
+
+        for object_id in self.changed_ids:
+            obj = display_file.get(object_id)
+            position = self.object_positions.get(object_id)
+            if obj is None or position is None or obj.bounds is None:
+                # Objeto que passou a ter (ou deixou de ter) pontos: muda a estrutura
+                self.build(display_file)
+                return
+            self.object_bounds[position] = obj.bounds
+        self.changed_ids.clear()
+
+        is_leaf = self.node_children[:, 0] < 0
+
+        # Folhas: caixa dos seus objetos, com uma redução por intervalo
+        leaf_indices = np.flatnonzero(is_leaf)
+        leaf_indices = leaf_indices[np.argsort(self.node_ranges[leaf_indices, 0])]
+        leaf_starts = self.node_ranges[leaf_indices, 0]
+        self.node_bounds[leaf_indices, 0] = np.minimum.reduceat(
+            self.object_bounds[:, 0], leaf_starts
+        )
+        self.node_bounds[leaf_indices, 1] = np.maximum.reduceat(
+            self.object_bounds[:, 1], leaf_starts
+        )
+
+        # Nós internos: caixa dos dois filhos, um nível por vez, do mais fundo para a raiz
+        for depth in range(self.node_depths.max(initial=0), -1, -1):
+            node_indices = np.flatnonzero(~is_leaf & (self.node_depths == depth))
+            if not len(node_indices):
+                continue
+            children = self.node_children[node_indices]
+            self.node_bounds[node_indices, 0] = np.minimum(
+                self.node_bounds[children[:, 0], 0],
+                self.node_bounds[children[:, 1], 0],
+            )
+            self.node_bounds[node_indices, 1] = np.maximum(
+                self.node_bounds[children[:, 0], 1],
+                self.node_bounds[children[:, 1], 1],
+            )
+
+    @staticmethod
+    def classify_boxes(
+        boxes: np.ndarray, view_projection_mtx: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Classifica, de uma vez, várias caixas em relação ao volume de visualização.
+        @param boxes: Array (K, 2, 3) com os cantos mínimo e máximo de cada caixa.
+        @param view_projection_mtx: Matriz que leva as coordenadas percebidas à projeção.
+        @return: Dois arrays booleanos (K,), com as caixas com certeza fora do volume e as
+        inteiramente dentro dele (as demais o cruzam), e dois arrays (K, 2) com os cantos
+        mínimo e máximo da projeção de cada caixa, em coordenadas normalizadas. Caixas que
+        cruzam o plano do COP têm projeção ilimitada (-inf, inf).
+        """
+
+        corners = np.ones((len(boxes), 8, 4))
+        corners[:, :, :3] = boxes[:, BOX_CORNER_SELECTORS, (0, 1, 2)]
+        projected_corners = corners @ view_projection_mtx
+
+        distance_factors = projected_corners[:, :, 3]
+        in_front = np.all(distance_factors > 0, axis=1)
+        behind = np.all(distance_factors <= 0, axis=1)
+
+        # A divisão só é usada nas caixas inteiramente à frente do COP
+        safe_factors = np.where(distance_factors > 0, distance_factors, 1.0)
+        normalized_corners = projected_corners[:, :, :2] / safe_factors[:, :, None]
+        corners_min = np.where(
+            in_front[:, None], normalized_corners.min(axis=1), -np.inf
+        )
+        corners_max = np.where(
+            in_front[:, None], normalized_corners.max(axis=1), np.inf
+        )
+
+        outside = behind | (
+            in_front
+            & (np.any(corners_min > 1, axis=1) | np.any(corners_max < -1, axis=1))
+        )
+        inside = (
+            in_front
+            & np.all(corners_min >= -1, axis=1)
+            & np.all(corners_max <= 1, axis=1)
+        )
+        return outside, inside, corners_min, corners_max
+
+    def query(
+        self, view_projection_mtx: np.ndarray
+    ) -> tuple[list[int], dict[str, int]]:
+        """
+        Encontra os objetos que podem aparecer na window. Subárvores inteiramente fora do volume
+        de visualização são descartadas e as inteiramente dentro são aceitas sem testar seus
+        objetos; apenas os objetos das folhas que cruzam o volume são testados um a um.
+        @param view_projection_mtx: Matriz que leva as coordenadas percebidas à projeção.
+        @return: Identificadores dos objetos possivelmente visíveis, em ordem crescente, e
+        estatísticas da consulta (objetos, visíveis, descartados e nós testados).
+        """
+
+        accepted_ranges = []
+        candidate_ranges = []
+        nodes_tested = 0
+
+        if len(self.node_bounds):
+            node_outside, node_inside, _, _ = self.classify_boxes(
+                self.node_bounds, view_projection_mtx
+            )
+            pending_nodes = [0]
+            while pending_nodes:
+                node_index = pending_nodes.pop()
+                nodes_tested += 1
+                if node_outside[node_index]:
+                    continue
+
+                start, end = self.node_ranges[node_index]
+                if node_inside[node_index]:
+                    accepted_ranges.append(self.object_ids[start:end])
+                elif self.node_children[node_index, 0] < 0:
+                    candidate_ranges.append(np.arange(start, end))
+                else:
+                    pending_nodes.extend(self.node_children[node_index])
+
+        visible_ids = [np.array(self.unbounded_ids, dtype=int), *accepted_ranges]
+        if candidate_ranges:
+            candidate_positions = np.concatenate(candidate_ranges)
+            candidate_outside, *_ = self.classify_boxes(
+                self.object_bounds[candidate_positions], view_projection_mtx
+            )
+            visible_ids.append(self.object_ids[candidate_positions[~candidate_outside]])
+
+        visible_ids = np.sort(np.concatenate(visible_ids)).tolist()
+        object_count = len(self.object_ids) + len(self.unbounded_ids)
+
+        return visible_ids, {
+            "objects": object_count,
+            "visible": len(visible_ids),
+            "culled": object_count - len(visible_ids),
+            "nodes_tested": nodes_tested,
+        }
@@ -10,6 +10,16 @@ class ClippingAlgorithms:
     BOTTOM = 0b0100
     TOP = 0b1000
 
+    # Plano próximo, em coordenadas homogêneas projetadas: pontos com fator de distância (w)
+    # menor que este valor estão atrás do plano, que fica a essa fração da distância do COP ao
+    # plano de projeção
+    NEAR_PLANE_W = 1e-2
+
+    # Bordas da window de recorte, na ordem em que o Sutherland-Hodgman as aplica (inferior,
+    # direita, superior e esquerda): eixo, limite e sinal de (coordenada - limite) no lado de
+    # dentro
+    CLIP_BOUNDARIES = ((1, -1.0, 1), (0, 1.0, -1), (1, 1.0, -1), (0, -1.0, 1))
+
     @classmethod
     def _get_region_code(
         cls, x: float, y: float, x_min: float, y_min: float, x_max: float, y_max: float
@@ -146,86 +156,324 @@ class ClippingAlgorithms:
 
         return [(clipped_start_x, clipped_start_y), (clipped_end_x, clipped_end_y)]
 
+    @classmethod
+    def cohen_sutherland_batch_clipping(
+        cls, starts: np.ndarray, ends: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Algoritmo de Cohen-Sutherland para recortar vários segmentos de uma vez. Cada iteração
+        trata, com operações sobre arrays, todos os segmentos ainda indecisos: aceita os que têm
+        as duas extremidades dentro, descarta os que têm ambas do mesmo lado de fora e move uma
+        extremidade de fora dos demais para a borda, na mesma ordem de prioridade da versão
+        escalar. Cada segmento é decidido em no máximo 4 iterações.
+        @param starts: Array (E, 2) com as extremidades iniciais, em coordenadas normalizadas.
+        @param ends: Array (E, 2) com as extremidades finais.
+        @return: Extremidades iniciais e finais recortadas dos segmentos mantidos, e um array
+        booleano (E,) indicando quais segmentos foram mantidos.
+        """
+
+        def get_region_codes(points: np.ndarray) -> np.ndarray:
+            x, y = points[:, 0], points[:, 1]
+            codes = np.where(x < -1, cls.LEFT, np.where(x > 1, cls.RIGHT, cls.INSIDE))
+            codes |= np.where(y < -1, cls.BOTTOM, np.where(y > 1, cls.TOP, cls.INSIDE))
+            return codes
+
+        starts = np.array(starts, dtype=float).reshape(-1, 2)
+        ends = np.array(ends, dtype=float).reshape(-1, 2)
+        start_codes = get_region_codes(starts)
+        end_codes = get_region_codes(ends)
+
+        kept = np.zeros(len(starts), dtype=bool)
+        pending = np.arange(len(starts))
+
+        while len(pending):
+            start_code, end_code = start_codes[pending], end_codes[pending]
+            accepted = (start_code | end_code) == 0
+            rejected = (start_code & end_code) != 0
+            kept[pending[accepted]] = True
+
+            pending = pending[~(accepted | rejected)]
+            if not len(pending):
+                break
+
+            start_code, end_code = start_codes[pending], end_codes[pending]
+            moves_start = start_code != 0
+            code_outside = np.where(moves_start, start_code, end_code)
+            (x1, y1), (x2, y2) = starts[pending].T, ends[pending].T
+
+            # Borda usada em cada segmento, na prioridade da versão escalar (topo, base,
+            # direita, esquerda); cortes em y fixam y e interpolam x, e vice-versa
+            cuts_y = (code_outside & (cls.TOP | cls.BOTTOM)) != 0
+            limit_y = np.where(code_outside & cls.TOP, 1.0, -1.0)
+            limit_x = np.where(code_outside & cls.RIGHT, 1.0, -1.0)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                intersection_x = np.where(
+                    cuts_y, x1 + (x2 - x1) * (limit_y - y1) / (y2 - y1), limit_x
+                )
+                intersection_y = np.where(
+                    cuts_y, limit_y, y1 + (y2 - y1) * (limit_x - x1) / (x2 - x1)
+                )
+            intersections = np.stack([intersection_x, intersection_y], axis=1)
+
+            moved_starts, moved_ends = pending[moves_start], pending[~moves_start]
+            starts[moved_starts] = intersections[moves_start]
+            ends[moved_ends] = intersections[~moves_start]
+            start_codes[moved_starts] = get_region_codes(starts[moved_starts])
+            end_codes[moved_ends] = get_region_codes(ends[moved_ends])
+
+        return starts[kept], ends[kept], kept
+
     @staticmethod
-    def sutherland_hodgman_clipping(points: list) -> list | None:
+    def liang_barsky_batch_clipping(
+        starts: np.ndarray, ends: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Algoritmo de Liang-Barsky para recortar vários segmentos de uma vez: os limites t_enter
+        e t_exit de todos os segmentos são calculados contra as 4 bordas com operações sobre
+        arrays.
+        @param starts: Array (E, 2) com as extremidades iniciais, em coordenadas normalizadas.
+        @param ends: Array (E, 2) com as extremidades finais.
+        @return: Extremidades iniciais e finais recortadas dos segmentos mantidos, e um array
+        booleano (E,) indicando quais segmentos foram mantidos.
+        """
+
+        starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+        deltas = ends - starts
+
+        # Componentes de direção e distâncias até as bordas, uma coluna por borda
+        directions = np.concatenate([-deltas, deltas], axis=1)[:, [0, 2, 1, 3]]
+        distances = np.stack(
+            [starts[:, 0] + 1, 1 - starts[:, 0], starts[:, 1] + 1, 1 - starts[:, 1]],
+            axis=1,
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = distances / directions
+        t_enter = np.max(np.where(directions < 0, t, 0.0), axis=1, initial=0.0)
+        t_exit = np.min(np.where(directions > 0, t, 1.0), axis=1, initial=1.0)
+
+        # Segmentos paralelos a uma borda e do lado de fora dela são descartados
+        parallel_outside = np.any((directions == 0) & (distances < 0), axis=1)
+        kept = ~parallel_outside & (t_enter <= t_exit)
+
+        clipped_starts = starts + t_enter[:, None] * deltas
+        clipped_ends = starts + t_exit[:, None] * deltas
+        return clipped_starts[kept], clipped_ends[kept], kept
+
+    @classmethod
+    def sutherland_hodgman_clipping(cls, points: list) -> list | None:
         """
         Algoritmo de Sutherland-Hodgman para recorte de polígonos.
         @param points: Lista de pontos do polígono.
         @return: Lista com os pontos recortados ou None se o polígono estiver fora do Viewport.
         """
 
-        all_inside = True
-        for point in points:
-            x, y = point
-            if not (-1 <= x <= 1 and -1 <= y <= 1):
-                all_inside = False
-                break
+        vertices = np.asarray(points, dtype=float).reshape(-1, 2)
 
         # Polígono totalmente dentro, dispensa o recorte
-        if all_inside:
+        if np.all(np.abs(vertices) <= 1):
             return points
 
-        # Define o polígono de recorte (borda do viewport em coordenadas normalizadas)
-        clip_window = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
-        clip_edges = list(zip(clip_window, clip_window[1:] + [clip_window[0]]))
+        clipped_vertices, _ = cls.sutherland_hodgman_batch_clipping(
+            vertices, np.array([0, len(vertices)])
+        )
 
-        clipped_polygon = points[:]
+        if len(clipped_vertices):
+            return list(map(tuple, clipped_vertices.tolist()))
+        return None
 
-        for clip_start, clip_end in clip_edges:
-            input_polygon = clipped_polygon
-            clipped_polygon = []
+    @classmethod
+    def sutherland_hodgman_batch_clipping(
+        cls, vertices: np.ndarray, offsets: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Algoritmo de Sutherland-Hodgman para recortar vários polígonos de uma vez. Como as bordas
+        da window são alinhadas aos eixos, cada passo compara uma única coordenada com o limite
+        e a interseção é uma interpolação nessa coordenada. Cada passo trata todos os vértices de
+        todos os polígonos com operações sobre arrays: a aresta que chega em cada vértice
+        contribui com a interseção, se cruzar a borda, e com o próprio vértice, se ele estiver
+        dentro. Como na versão escalar, polígonos com todos os vértices dentro da window (ou
+        sobre as bordas) são mantidos como estão.
+        @param vertices: Array (N, 2) com os vértices de todos os polígonos, em sequência.
+        @param offsets: Array (K + 1,) com o início dos vértices de cada polígono em vertices,
+        seguido de N.
+        @return: Vértices recortados de todos os polígonos, no mesmo formato, e os novos
+        offsets. Polígonos inteiramente fora ficam sem vértices.
+        """
 
-            if not input_polygon:
+        vertices = np.asarray(vertices, dtype=float).reshape(-1, 2)
+        offsets = np.asarray(offsets, dtype=np.intp)
+
+        # Polígonos inteiramente dentro da window, inclusive sobre as bordas, não são recortados
+        counts = np.diff(offsets)
+        polygon_ids = np.repeat(np.arange(len(counts)), counts)
+        outside_counts = np.bincount(
+            polygon_ids,
+            weights=np.any(np.abs(vertices) > 1, axis=1),
+            minlength=len(counts),
+        )
+        unclipped = outside_counts == 0
+
+        for axis, limit, inside_sign in cls.CLIP_BOUNDARIES:
+            if not len(vertices):
                 break
 
-            previous_point = input_polygon[-1]
-
-            for current_point in input_polygon:
-                clip_x0, clip_y0 = clip_start
-                clip_x1, clip_y1 = clip_end
-
-                # Verifica se o ponto está dentro do semiplano definido pela aresta de recorte
-                px, py = current_point
-                current_inside = (clip_x1 - clip_x0) * (py - clip_y0) > (
-                    clip_y1 - clip_y0
-                ) * (px - clip_x0)
-
-                # Verifica se o ponto anterior está dentro do semiplano
-                px, py = previous_point
-                previous_inside = (clip_x1 - clip_x0) * (py - clip_y0) > (
-                    clip_y1 - clip_y0
-                ) * (px - clip_x0)
-
-                # Calcula interseção se necessário
-                if current_inside != previous_inside:
-                    x1, y1 = previous_point
-                    x2, y2 = current_point
-                    x3, y3 = clip_start
-                    x4, y4 = clip_end
-
-                    denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
-
-                    if denom != 0:  # Evita divisão por zero (linhas paralelas)
-                        px = (
-                            (x1 * y2 - y1 * x2) * (x3 - x4)
-                            - (x1 - x2) * (x3 * y4 - y3 * x4)
-                        ) / denom
-                        py = (
-                            (x1 * y2 - y1 * x2) * (y3 - y4)
-                            - (y1 - y2) * (x3 * y4 - y3 * x4)
-                        ) / denom
-                        intersection = (px, py)
-                        clipped_polygon.append(intersection)
-
-                # Adiciona o ponto atual se estiver dentro
-                if current_inside:
-                    clipped_polygon.append(current_point)
-
-                previous_point = current_point
-
-        if clipped_polygon:
-            return clipped_polygon
-        return None
+            counts = np.diff(offsets)
+            polygon_ids = np.repeat(np.arange(len(counts)), counts)
+
+            # Vértice anterior de cada vértice, dando a volta dentro de cada polígono
+            previous = np.arange(len(vertices)) - 1
+            non_empty = counts > 0
+            previous[offsets[:-1][non_empty]] = offsets[1:][non_empty] - 1
+
+            inside = inside_sign * (vertices[:, axis] - limit) > 0
+            inside |= unclipped[polygon_ids]
+            crossing = inside != inside[previous]
+
+            previous_vertices = vertices[previous]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = (limit - previous_vertices[:, axis]) / (
+                    vertices[:, axis] - previous_vertices[:, axis]
+                )
+                intersections = previous_vertices + t[:, None] * (
+                    vertices - previous_vertices
+                )
+            intersections[:, axis] = limit
+
+            emitted = np.stack([crossing, inside], axis=1)
+            vertices = np.stack([intersections, vertices], axis=1)[emitted]
+
+            clipped_counts = np.bincount(
+                polygon_ids, weights=emitted.sum(axis=1), minlength=len(counts)
+            ).astype(np.intp)
+            offsets = np.concatenate([[0], np.cumsum(clipped_counts)])
+
+        return vertices, offsets
+
+    @classmethod
+    def near_plane_segment_clipping(
+        cls, starts: np.ndarray, ends: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Recorta vários segmentos, de uma vez, contra o plano próximo (w = NEAR_PLANE_W), em
+        coordenadas homogêneas, antes da divisão por w. A extremidade atrás do plano é trocada
+        pela interseção do segmento com ele.
+        @param starts: Array (E, 4) com as extremidades iniciais projetadas.
+        @param ends: Array (E, 4) com as extremidades finais projetadas.
+        @return: Extremidades iniciais e finais recortadas dos segmentos mantidos, e um array
+        booleano (E,) indicando quais segmentos foram mantidos (os demais estão inteiramente
+        atrás do plano).
+        """
+
+        start_distances = starts[:, 3] - cls.NEAR_PLANE_W
+        end_distances = ends[:, 3] - cls.NEAR_PLANE_W
+        start_behind = start_distances < 0
+        end_behind = end_distances < 0
+        kept = ~(start_behind & end_behind)
+
+        # A interseção só é usada nos segmentos que cruzam o plano, onde o denominador não é nulo
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = start_distances / (start_distances - end_distances)
+            intersections = starts + t[:, None] * (ends - starts)
+
+        clipped_starts = np.where(start_behind[:, None], intersections, starts)
+        clipped_ends = np.where(end_behind[:, None], intersections, ends)
+        return clipped_starts[kept], clipped_ends[kept], kept
+
+    @classmethod
+    def near_plane_polygon_clipping(cls, vertices: np.ndarray) -> np.ndarray:
+        """
+        Recorta um polígono contra o plano próximo (w = NEAR_PLANE_W), em coordenadas
+        homogêneas, antes da divisão por w. É o passo de Sutherland-Hodgman para um único plano,
+        feito para todas as arestas de uma vez: cada aresta (v_i, v_i+1) contribui com v_i, se
+        estiver na frente do plano, e com a interseção, se cruzar o plano.
+        @param vertices: Array (N, 4) com os vértices projetados, em ordem.
+        @return: Array (M, 4) com os vértices do polígono recortado (vazio se o polígono estiver
+        inteiramente atrás do plano).
+        """
+
+        distances = vertices[:, 3] - cls.NEAR_PLANE_W
+        in_front = distances >= 0
+        next_vertices = np.roll(vertices, -1, axis=0)
+        next_distances = np.roll(distances, -1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = distances / (distances - next_distances)
+            intersections = vertices + t[:, None] * (next_vertices - vertices)
+
+        candidates = np.stack([vertices, intersections], axis=1)
+        emitted = np.stack([in_front, in_front != np.roll(in_front, -1)], axis=1)
+        return candidates[emitted]
+
+    @classmethod
+    def polyline_batch_clipping(
+        cls,
+        projected_vertices: np.ndarray,
+        offsets: np.ndarray,
+        line_batch_clipper: callable,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Recorta várias polilinhas de uma vez, a partir dos vértices projetados, antes da divisão
+        por w. Todos os segmentos de todas as polilinhas são recortados juntos: primeiro contra o
+        plano próximo, depois contra a window, com o algoritmo de recorte em lote dado. Cada
+        vértice é compartilhado pelos dois segmentos que o tocam, e os segmentos voltam a ser
+        encadeados nos vértices que nenhum dos recortes alterou (à frente do plano e dentro da
+        window); nos demais, a polilinha se divide em pedaços.
+        @param projected_vertices: Array (N, 4) com os vértices projetados de todas as
+        polilinhas, em sequência.
+        @param offsets: Array (K + 1,) com o início dos vértices de cada polilinha, seguido de N.
+        @param line_batch_clipper: Algoritmo de recorte de segmentos em lote (ver
+        cohen_sutherland_batch_clipping).
+        @return: Vértices dos pedaços visíveis, em coordenadas normalizadas (array (M, 2)), e os
+        offsets de cada pedaço, no mesmo formato da entrada.
+        """
+
+        vertices = np.asarray(projected_vertices, dtype=float).reshape(-1, 4)
+        offsets = np.asarray(offsets, dtype=np.intp)
+
+        # Segmento (i, i + 1) para cada vértice i que não é o último da sua polilinha
+        is_last = np.zeros(len(vertices), dtype=bool)
+        is_last[offsets[1:][np.diff(offsets) > 0] - 1] = True
+        segment_vertices = np.flatnonzero(~is_last)
+
+        near_starts, near_ends, near_kept = cls.near_plane_segment_clipping(
+            vertices[segment_vertices], vertices[segment_vertices + 1]
+        )
+        clipped_starts, clipped_ends, kept = line_batch_clipper(
+            near_starts[:, :2] / near_starts[:, 3:], near_ends[:, :2] / near_ends[:, 3:]
+        )
+
+        segment_kept = np.zeros(len(segment_vertices), dtype=bool)
+        segment_kept[np.flatnonzero(near_kept)[kept]] = True
+
+        # Vértices que nenhum dos recortes altera
+        distance_factors = vertices[:, 3]
+        safe_factors = np.where(distance_factors > 0, distance_factors, 1.0)
+        unchanged = (distance_factors >= cls.NEAR_PLANE_W) & np.all(
+            np.abs(vertices[:, :2] / safe_factors[:, None]) <= 1, axis=1
+        )
+
+        # Um segmento continua o pedaço do anterior se o anterior, da mesma polilinha, foi
+        # mantido e o vértice compartilhado não foi alterado
+        continues = np.zeros(len(segment_vertices), dtype=bool)
+        continues[1:] = (
+            segment_kept[:-1]
+            & (segment_vertices[1:] == segment_vertices[:-1] + 1)
+            & unchanged[segment_vertices[1:]]
+        )
+        continues = continues[segment_kept]
+
+        # Cada segmento mantido contribui com o início, se começar um pedaço, e com o fim
+        emitted = np.stack([~continues, np.ones_like(continues)], axis=1)
+        clipped_vertices = np.stack([clipped_starts, clipped_ends], axis=1)[emitted]
+
+        piece_ids = np.cumsum(~continues) - 1
+        piece_counts = np.bincount(piece_ids, weights=emitted.sum(axis=1)).astype(
+            np.intp
+        )
+        return clipped_vertices, np.concatenate([[0], np.cumsum(piece_counts)])
 
     @staticmethod
     def curve_clipping(points: list, line_clipper: callable) -> list | None:
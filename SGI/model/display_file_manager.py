@@ -1,5 +1,13 @@
+from collections import Counter
+from typing import Callable, TextIO
+
 import numpy as np
+from model.bounding_volume_hierarchy import BoundingVolumeHierarchy
+from model.clipping_algorithms import ClippingAlgorithms
+from model.scene_file import SceneFile
 from model.transformation_generator import TransformationGenerator
+from model.transformation_pipeline import TransformationPipeline
+from model.world_objects.lazy_world_object import LazyWorldObject
 from model.world_objects.sc_world_object import SCWorldObject
 from model.world_objects.world_bezier_curve import WorldBezierCurve
 from model.world_objects.world_bezier_surface import WorldBezierSurface
@@ -9,9 +17,11 @@ from model.world_objects.world_line import WorldLine
 from model.world_objects.world_object import WorldObject
 from model.world_objects.world_object_factory import WorldObjectFactory
 from model.world_objects.world_point import WorldPoint
+from model.world_objects.world_point_cloud import WorldPointCloud
 from model.world_objects.world_polygon import WorldPolygon
+from model.world_objects.world_surface import WorldSurface
 from model.world_objects.world_wireframe import WorldWireframe
-from view.graphical_objects.graphical_object import GraphicalObject
+from view.graphical_objects.render_batch import RenderBatch
 from view.viewport.viewport_bounds import ViewportBounds
 
 
@@ -21,47 +31,273 @@ class DisplayFileManager:
     """
 
     def __init__(self, viewport_bounds: ViewportBounds):
-        self.display_file: list[WorldObject] = []
+        # Objetos indexados por um identificador estável (object_id), que não muda com a
+        # remoção de outros objetos. O dicionário preserva a ordem de inserção, que é a ordem
+        # de exibição na interface
+        self.display_file: dict[int, WorldObject] = {}
+        self.next_object_id = 0
         WorldObjectFactory.viewport_bounds = viewport_bounds
 
+        # Índices auxiliares, mantidos a cada adição/remoção, para que a nomeação automática
+        # e a busca por nome não precisem percorrer o display file inteiro
+        self.objects_by_name: dict[str, list[WorldObject]] = {}
+        # Quantos objetos usam cada N em "<Tipo> N" ("Point 3" e "Point 03" usam o mesmo N)
+        self.default_name_indices: dict[str, Counter[int]] = {}
+        self.highest_default_name_index: dict[str, int] = {}
+
+        # Objetos indexados pela geometria (ver _get_geometry_key), para que a verificação de
+        # objetos repetidos em add_object não precise comparar com todo o display file
+        self.objects_by_geometry: dict[tuple[type, bytes], list[WorldObject]] = {}
+
+        # Hierarquia de caixas envolventes usada para descartar os objetos fora do volume de
+        # visualização, os objetos que sobraram na última atualização das projeções (None se
+        # nenhum foi descartado) e as estatísticas desse descarte
+        self.bounding_volume_hierarchy = BoundingVolumeHierarchy()
+        self.visible_object_ids: list[int] | None = None
+        self.culling_stats: dict[str, int] = {}
+
         self.projection_algorithms = {
             "parallel": TransformationGenerator.get_parallel_projection_points,
             "perspective": TransformationGenerator.get_perspective_projection_points,
         }
 
         self.projection_mode = "perspective"
+        self.clipping_mode = "cohen_sutherland"
+
+        # Tipos possíveis para os arrays de pontos (ver WorldObject.points_dtype)
+        self.points_dtypes = {"float64": np.float64, "float32": np.float32}
+        self.points_precision = "float64"
 
-    def get_clipped_representations(self) -> list[GraphicalObject]:
+    def get_render_batch(self) -> RenderBatch:
         """
-        Retorna as representações gráficas a serem enviadas para o Viewport desenhar.
-        @return: Lista de representações gráficas após o clipping.
+        Monta o lote de desenho a ser enviado para o Viewport, com as primitivas de todos os
+        objetos visíveis após o clipping (ver WorldObject.add_to_render_batch).
+        @return: Lote de desenho do quadro.
         """
 
-        representations = []
-        for obj in self.display_file:
+        if self.visible_object_ids is None:
+            visible_objects = list(self.display_file.values())
+        else:
+            visible_objects = [
+                self.display_file[object_id]
+                for object_id in self.visible_object_ids
+                if object_id in self.display_file
+            ]
+
+        # Os polígonos são recortados todos juntos, numa única chamada
+        polygons = [
+            obj
+            for obj in visible_objects
+            if isinstance(obj, WorldPolygon) and len(obj.projection_points)
+        ]
+        polygon_viewport_points = dict(
+            zip(
+                [polygon.object_id for polygon in polygons],
+                WorldPolygon.get_batch_clipped_viewport_points(polygons),
+            )
+        )
 
-            if (
-                not isinstance(obj, WorldBezierSurface)
-                and not isinstance(obj, WorldBicubicSurface)
-                and not obj.projection_points
+        render_batch = RenderBatch()
+        for obj in visible_objects:
+
+            if not isinstance(obj, (WorldSurface, WorldPointCloud)) and not len(
+                obj.projection_points
             ):
                 continue
 
-            clipped_repr_list = obj.get_clipped_representation()
-            if (
-                clipped_repr_list
-            ):  # Garante que a lista não seja None ou vazia antes de adicionar
-                representations.extend(clipped_repr_list)
+            if isinstance(obj, WorldPolygon):
+                obj.add_to_render_batch(
+                    render_batch, polygon_viewport_points[obj.object_id]
+                )
+            else:
+                obj.add_to_render_batch(render_batch)
 
-        return representations
+        render_batch.pack()
+        return render_batch
 
-    def get_obj_name(self, index: int) -> str:
+    def get_obj_name(self, object_id: int) -> str:
         """
-        Retorna o nome do objeto gráfico no índice especificado.
-        @param index: Índice do objeto no display file.
+        Retorna o nome do objeto gráfico com o identificador especificado.
+        @param object_id: Identificador do objeto no display file.
         @return: Nome do objeto gráfico.
         """
-        return self.display_file[index].name
+        return self.display_file[object_id].name
+
+    def get_objects_by_name(self, name: str) -> list[WorldObject]:
+        """
+        Retorna os objetos do display file com o nome especificado.
+        @param name: Nome procurado.
+        @return: Lista (possivelmente vazia) de objetos com esse nome.
+        """
+        return self.objects_by_name.get(name, [])
+
+    @staticmethod
+    def _get_type_name(world_object: WorldObject) -> str:
+        """
+        Retorna o nome do tipo do objeto, sem o prefixo "World". Para objetos ainda não
+        carregados, considera o tipo do objeto real.
+        @param world_object: Objeto do display file.
+        @return: Nome do tipo.
+        """
+
+        object_type = getattr(world_object, "object_type", world_object.__class__)
+        return object_type.__name__.replace("World", "")
+
+    @staticmethod
+    def _get_default_name_index(obj_name: str, type_name: str) -> int | None:
+        """
+        Verifica se um nome segue o padrão automático "<Tipo> N".
+        @param obj_name: Nome do objeto.
+        @param type_name: Nome do tipo do objeto (sem o prefixo "World").
+        @return: O índice N ou None se o nome não seguir o padrão.
+        """
+
+        prefix, _, suffix = obj_name.rpartition(" ")
+        if prefix == type_name and suffix.isdecimal():
+            return int(suffix)
+        return None
+
+    def get_next_default_name(self, object_type: type) -> str:
+        """
+        Gera o nome automático de um objeto sem nome, no formato "<Tipo> N", onde N é uma
+        unidade maior que o maior índice em uso para o tipo.
+        @param object_type: Classe do objeto a ser nomeado.
+        @return: Nome gerado.
+        """
+
+        type_name = object_type.__name__.replace("World", "")
+        return f"{type_name} {self.highest_default_name_index.get(type_name, 0) + 1}"
+
+    @staticmethod
+    def _get_geometry_key(object_type: type, points) -> tuple[type, bytes] | None:
+        """
+        Gera a chave usada para detectar objetos repetidos: dois objetos são repetidos se têm o
+        mesmo tipo e exatamente os mesmos pontos (x, y, z), na mesma ordem.
+        @param object_type: Classe do objeto.
+        @param points: Pontos do objeto, como lista de tuplas (x, y, z) ou array (N, 3) ou (N, 4).
+        @return: Chave (tipo, bytes dos pontos), ou None se os pontos não estiverem num formato
+        comparável (por exemplo, matrizes de pontos de controle de superfícies).
+        """
+
+        if isinstance(points, np.ndarray):
+            if points.ndim != 2:
+                return None
+        elif not all(isinstance(p, tuple) and len(p) == 3 for p in points):
+            return None
+
+        # Os pontos são comparados no tipo em que ficam guardados (ver
+        # WorldObject.points_dtype)
+        points_array = np.asarray(points, dtype=WorldObject.points_dtype)
+        if len(points_array) == 0:
+            return None
+
+        # Soma 0.0 para que -0.0 e 0.0, que são iguais, gerem os mesmos bytes
+        return object_type, (points_array[:, :3] + 0.0).tobytes()
+
+    def _is_repeated(self, world_object: WorldObject) -> bool:
+        """
+        Verifica, pelo índice de geometria, se já existe um objeto do mesmo tipo com os mesmos
+        pontos percebidos. Objetos ainda não carregados e superfícies (cujos pontos de controle
+        não são comparados, como em add_object) nunca são repetidos.
+        @param world_object: Objeto a ser verificado.
+        @return: Se o objeto é repetido.
+        """
+
+        if isinstance(world_object, (LazyWorldObject, WorldSurface)):
+            return False
+
+        return (
+            self._get_geometry_key(
+                world_object.__class__, world_object.perceived_points
+            )
+            in self.objects_by_geometry
+        )
+
+    def _index_geometry(self, world_object: WorldObject) -> None:
+        """
+        Insere o objeto no índice de geometria, com seus pontos percebidos atuais. Superfícies
+        não são indexadas (ver _is_repeated).
+        @param world_object: Objeto a ser indexado.
+        """
+
+        if isinstance(world_object, (LazyWorldObject, WorldSurface)):
+            return
+
+        world_object.geometry_key = self._get_geometry_key(
+            world_object.__class__,
+            world_object.perceived_points,
+        )
+        if world_object.geometry_key is not None:
+            self.objects_by_geometry.setdefault(world_object.geometry_key, []).append(
+                world_object
+            )
+
+    def _unindex_geometry(self, world_object: WorldObject) -> None:
+        """
+        Remove o objeto do índice de geometria.
+        @param world_object: Objeto a ser removido do índice.
+        """
+
+        if world_object.geometry_key is None:
+            return
+
+        same_geometry_objects = self.objects_by_geometry[world_object.geometry_key]
+        same_geometry_objects.remove(world_object)
+        if not same_geometry_objects:
+            del self.objects_by_geometry[world_object.geometry_key]
+        world_object.geometry_key = None
+
+    def _register_object(self, world_object: WorldObject) -> None:
+        """
+        Insere o objeto no display file, com um novo identificador, e atualiza os índices de
+        nomes.
+        @param world_object: Objeto a ser registrado.
+        """
+
+        world_object.object_id = self.next_object_id
+        self.next_object_id += 1
+        self.display_file[world_object.object_id] = world_object
+        self.bounding_volume_hierarchy.invalidate()
+        self.objects_by_name.setdefault(world_object.name, []).append(world_object)
+        self._index_geometry(world_object)
+
+        type_name = self._get_type_name(world_object)
+        name_index = self._get_default_name_index(world_object.name, type_name)
+        if name_index is None:
+            return
+
+        self.default_name_indices.setdefault(type_name, Counter())[name_index] += 1
+        if name_index > self.highest_default_name_index.get(type_name, 0):
+            self.highest_default_name_index[type_name] = name_index
+
+    def _unregister_object(self, world_object: WorldObject) -> None:
+        """
+        Atualiza os índices de nomes após a remoção de um objeto do display file.
+        @param world_object: Objeto removido.
+        """
+
+        self._unindex_geometry(world_object)
+
+        same_name_objects = self.objects_by_name[world_object.name]
+        same_name_objects.remove(world_object)
+        if not same_name_objects:
+            del self.objects_by_name[world_object.name]
+
+        type_name = self._get_type_name(world_object)
+        name_index = self._get_default_name_index(world_object.name, type_name)
+        if name_index is None:
+            return
+
+        # O índice só fica livre quando nenhum outro objeto o usa
+        used_indices = self.default_name_indices[type_name]
+        used_indices[name_index] -= 1
+        if used_indices[name_index] > 0:
+            return
+        del used_indices[name_index]
+
+        # Só é preciso procurar o novo maior índice se o removido era o maior
+        if name_index == self.highest_default_name_index[type_name]:
+            self.highest_default_name_index[type_name] = max(used_indices, default=0)
 
     def add_object(
         self,
@@ -84,86 +320,224 @@ class DisplayFileManager:
         @return: Retorna o objeto adicionado ou None se o objeto já existir.
         """
 
+        if self._get_geometry_key(object_type, points) in self.objects_by_geometry:
+            return None
+
         world_object = WorldObjectFactory.new_world_object(
             points=points,
-            name=name,
+            name=name or self.get_next_default_name(object_type),
             color=color,
-            display_file=self.display_file,
             is_filled=is_filled,
             object_type=object_type,
             edges=edges,
         )
 
-        if world_object is None:
-            return None
-
-        self.display_file.append(world_object)
+        self._register_object(world_object)
         return world_object
 
-    def remove_object(self, index: int) -> None:
+    def remove_object(self, object_id: int) -> None:
         """
         Remove um objeto gráfico do display file.
-        @param index: Índice do objeto a ser removido.
+        @param object_id: Identificador do objeto a ser removido.
+        """
+        world_object = self.display_file.pop(object_id)
+        self.bounding_volume_hierarchy.invalidate()
+        self._unregister_object(world_object)
+
+    def remove_objects(self, object_ids: list[int]) -> None:
+        """
+        Remove vários objetos gráficos do display file.
+        @param object_ids: Identificadores dos objetos a serem removidos.
         """
-        self.display_file.pop(index)
+        for object_id in object_ids:
+            self.remove_object(object_id)
 
-    def convert_display_file_to_obj(self) -> str:
+    def write_display_file_to_obj(self, stream: TextIO) -> None:
         """
-        Converte o conteúdo do display file para o formato OBJ.
-        @return: String com os objetos do display file no formato OBJ.
+        Escreve o conteúdo do display file no formato OBJ, objeto a objeto, no stream fornecido.
+        @param stream: Arquivo (ou buffer) de texto de destino.
         """
 
-        obj_str = ""
         last_index = 1
 
-        for obj in self.display_file:
-            new_obj_str, last_index = obj.get_obj_description(last_index)
-            obj_str += new_obj_str
+        for obj in self.display_file.values():
+            last_index = obj.write_obj_description(stream, last_index)
 
-        return obj_str
+    def write_display_file_to_scene(self, filepath: str) -> None:
+        """
+        Salva o display file no formato binário de cena.
+        @param filepath: Caminho do arquivo de destino.
+        """
+        SceneFile.write(filepath, list(self.display_file.values()))
 
-    def get_objs_as_strings(self) -> list[str]:
+    def get_objs_as_strings(self) -> list[tuple[int, str]]:
         """
         Retorna a representação em string dos objetos no display file.
-        @return: Lista de strings representando os objetos no display file.
+        @return: Lista de tuplas (identificador, string) representando os objetos no display file.
         """
-        return [str(obj) for obj in self.display_file]
+        return [(object_id, str(obj)) for object_id, obj in self.display_file.items()]
 
     def apply_transformation(
         self,
-        index: int,
-        transformations_list: list[dict],
+        object_id: int,
+        transformations_list: list[dict] | TransformationPipeline,
         conversion_mtx: np.ndarray,
+        fold_conversion: bool = True,
     ) -> None:
         """
         Aplica uma transformação matricial a um objeto do display file.
-        @param index: Índice do objeto a ser transformado.
-        @param transformations_list: Lista de dicionários, cada um representando uma transformação.
+        @param object_id: Identificador do objeto a ser transformado.
+        @param transformations_list: Lista de dicionários, cada um representando uma transformação,
+        ou uma transformação já compilada.
+        @param conversion_mtx: Matriz de conversão para coordenadas reais.
+        @param fold_conversion: Se a conversão não é aplicada às coordenadas do mundo (ver
+        apply_group_transformation).
+        """
+        self.apply_group_transformation(
+            [object_id],
+            transformations_list,
+            conversion_mtx,
+            fold_conversion=fold_conversion,
+        )
+
+    def apply_group_transformation(
+        self,
+        object_ids: list[int],
+        transformations_list: list[dict] | TransformationPipeline,
+        conversion_mtx: np.ndarray,
+        use_own_centers: bool = False,
+        fold_conversion: bool = True,
+    ) -> None:
+        """
+        Aplica uma transformação matricial a vários objetos do display file. Os pontos de todos
+        os objetos são transformados juntos, numa única operação.
+        @param object_ids: Identificadores dos objetos a serem transformados.
+        @param transformations_list: Lista de dicionários, cada um representando uma transformação,
+        ou uma transformação já compilada (ver TransformationPipeline).
         @param conversion_mtx: Matriz de conversão para coordenadas reais.
+        @param use_own_centers: Se escalonamentos e rotações usam o centro de cada objeto. Caso
+        contrário, usam o centro do grupo (média dos centros dos objetos).
+        @param fold_conversion: Se a conversão não é aplicada às coordenadas do mundo (ver
+        Window.fold_conversion). Nesse caso, só as superfícies, que trabalham sobre elas, têm as
+        coordenadas do mundo atualizadas.
         """
 
-        obj = self.display_file[index]
-        obj_center = obj.get_center()
+        if isinstance(transformations_list, TransformationPipeline):
+            pipeline = transformations_list
+        else:
+            pipeline = TransformationPipeline.compile(transformations_list)
 
-        transformation_mtx = (
-            TransformationGenerator.get_composite_transformation_matrix(
-                transformations_list=transformations_list,
-                obj_center=obj_center,
-            )
-        )
+        objects = [self.display_file[object_id] for object_id in object_ids]
+        if not objects or pipeline is None:
+            return
+
+        self.bounding_volume_hierarchy.mark_changed(object_ids)
+
+        obj_centers = [obj.get_center() for obj in objects]
+        if not use_own_centers:
+            obj_centers = [tuple(np.mean(obj_centers, axis=0))]
+
+        transformation_matrices = pipeline.get_matrices(obj_centers)
+
+        batch_objects = []
+        batch_matrix_indices = []
+
+        for index, obj in enumerate(objects):
+            matrix_index = index if use_own_centers else 0
+            obj.dirty = True
+
+            if isinstance(obj, LazyWorldObject):
+                # Objetos não carregados acumulam a transformação para o objeto real
+                obj.update_perceived_coordinates(transformation_matrices[matrix_index])
+                obj.update_world_coordinates(conversion_mtx)
+                continue
+
+            self._unindex_geometry(obj)
+
+            batch_objects.append(obj)
+            batch_matrix_indices.append(matrix_index)
 
-        if transformation_mtx is None:
+        if not batch_objects:
             return
 
-        obj.update_perceived_coordinates(transformation_mtx)
-        obj.update_world_coordinates(conversion_mtx)
-        obj.dirty = True
+        points = np.concatenate([obj.perceived_points for obj in batch_objects])
+        point_counts = [len(obj.perceived_points) for obj in batch_objects]
+
+        if use_own_centers:
+            transformed_points = self._transform_with_own_matrices(
+                points, point_counts, transformation_matrices[batch_matrix_indices]
+            )
+        else:
+            transformed_points = WorldObject.transform_points(
+                points, transformation_matrices[0]
+            )
+
+        WorldObject.normalize_homogeneous_points(transformed_points)
+
+        split_offsets = np.cumsum(point_counts)[:-1]
+        if fold_conversion:
+            # As superfícies têm poucos pontos de controle e são convertidas uma a uma
+            split_world_points = [None] * len(batch_objects)
+        else:
+            world_points = WorldObject.transform_points(
+                transformed_points, conversion_mtx
+            )
+            split_world_points = np.split(world_points, split_offsets)
+
+        for obj, matrix_index, obj_points, obj_world_points in zip(
+            batch_objects,
+            batch_matrix_indices,
+            np.split(transformed_points, split_offsets),
+            split_world_points,
+        ):
+            obj.perceived_points = obj_points
+            obj.update_bounds(transformation_matrices[matrix_index])
+            if obj_world_points is not None or isinstance(obj, WorldSurface):
+                obj.update_world_coordinates(conversion_mtx, obj_world_points)
+            self._index_geometry(obj)
+
+    @staticmethod
+    def _transform_with_own_matrices(
+        points: np.ndarray, point_counts: list[int], matrices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Transforma os pontos de vários objetos, cada um com a sua matriz.
+        @param points: Array (N, 4) com os pontos de todos os objetos, em sequência.
+        @param point_counts: Quantidade de pontos de cada objeto.
+        @param matrices: Array (K, 4, 4) com a matriz de cada objeto.
+        @return: Array (N, 4) com os pontos transformados.
+        """
+
+        if np.array_equal(
+            matrices[:, :3, :],
+            np.broadcast_to(matrices[:1, :3, :], (len(matrices), 3, 4)),
+        ):
+            # As matrizes diferem só na translação (linha 3), o que é o caso quando apenas o
+            # centro das transformações muda: aplica a primeira matriz a todos os pontos de uma
+            # vez e corrige a translação de cada objeto
+            translation_offsets = (matrices[:, 3, :] - matrices[0, 3, :]).astype(
+                points.dtype
+            )
+            translations = points[:, 3:] * np.repeat(
+                translation_offsets, point_counts, axis=0
+            )
+            return WorldObject.transform_points(points, matrices[0]) + translations
+
+        transformed_points = np.empty_like(points)
+        start = 0
+        for matrix, point_count in zip(matrices, point_counts):
+            end = start + point_count
+            transformed_points[start:end] = WorldObject.transform_points(
+                points[start:end], matrix
+            )
+            start = end
+        return transformed_points
 
     def set_all_objects_as_dirty(self) -> None:
         """
         Marca todos os objetos no display file como sujos, indicando que precisam ser atualizados.
         """
-        for obj in self.display_file:
+        for obj in self.display_file.values():
             obj.dirty = True
 
     def update_projections(
@@ -171,13 +545,26 @@ class DisplayFileManager:
         center_of_projection: np.ndarray,
         window_width: float,
         window_height: float,
-    ) -> None:
+        conversion_mtx: np.ndarray | None = None,
+        fold_conversion: bool = True,
+    ) -> tuple[list[WorldObject], list[int]]:
         """
-        Atualiza as projeções dos objetos no display file.
-        @param view_plane_normal: Vetor normal ao plano de visualização.
-        @param window_vup: Vetor de orientação para cima da janela de visualização.
+        Atualiza as projeções dos objetos no display file. Antes de qualquer projeção, os
+        objetos fora do volume de visualização são descartados pela hierarquia de caixas
+        envolventes; apenas os que sobram são projetados e, depois, recortados. Objetos
+        importados sob demanda são carregados aqui, na primeira vez em que ficam visíveis.
+        @param center_of_projection: Centro de projeção da janela de visualização.
         @param window_width: Largura da janela de visualização.
         @param window_height: Altura da janela de visualização.
+        @param conversion_mtx: Matriz de conversão da window, usada para levar a hierarquia
+        (nas coordenadas percebidas) ao volume de visualização. Se None, nenhum objeto é
+        descartado.
+        @param fold_conversion: Se a conversão não é aplicada às coordenadas do mundo (ver
+        Window.fold_conversion). Nesse caso, é combinada à matriz de projeção e os objetos são
+        projetados direto dos pontos percebidos, numa única passada.
+        @return: Tupla com a lista dos objetos carregados nesta atualização, que substituem
+        seus representantes no display file (com o mesmo identificador), e a lista dos
+        identificadores removidos por serem repetições de objetos já existentes.
         """
 
         projection_mtx = self.projection_algorithms[self.projection_mode](
@@ -186,70 +573,219 @@ class DisplayFileManager:
             window_height=window_height,
         )
 
-        for obj in self.display_file:
+        if conversion_mtx is None:
+            self.visible_object_ids = None
+            self.culling_stats = {}
+            visible_objects = list(self.display_file.values())
+        else:
+            self.bounding_volume_hierarchy.update(self.display_file)
+            self.visible_object_ids, self.culling_stats = (
+                self.bounding_volume_hierarchy.query(conversion_mtx @ projection_mtx)
+            )
+            visible_objects = [
+                self.display_file[object_id] for object_id in self.visible_object_ids
+            ]
+
+        # Nuvens de pontos são sempre projetadas a partir dos pontos percebidos (ver
+        # WorldPointCloud.update_projection)
+        window_conversion_mtx = conversion_mtx
+        if not fold_conversion:
+            conversion_mtx = None
+
+        if conversion_mtx is not None:
+            # Superfícies e representantes de objetos não carregados ainda trabalham sobre as
+            # coordenadas do mundo, mas têm poucos pontos (de controle ou da caixa envolvente)
+            for obj in visible_objects:
+                if isinstance(obj, (LazyWorldObject, WorldSurface)):
+                    obj.update_world_coordinates(conversion_mtx)
+
+        materialized_objects, repeated_object_ids = self._materialize_visible_objects(
+            visible_objects, projection_mtx
+        )
+        if materialized_objects:
+            self.bounding_volume_hierarchy.mark_changed(
+                [obj.object_id for obj in materialized_objects]
+            )
+        if materialized_objects or repeated_object_ids:
+            visible_objects = [
+                self.display_file[obj.object_id]
+                for obj in visible_objects
+                if obj.object_id in self.display_file
+            ]
+
+        if conversion_mtx is None:
+            view_projection_mtx = projection_mtx
+        else:
+            view_projection_mtx = conversion_mtx @ projection_mtx
+
+        for obj in visible_objects:
+            if isinstance(obj, LazyWorldObject):
+                continue
+
             if not obj.dirty and np.array_equal(obj.projection_points, projection_mtx):
                 continue
 
             obj.dirty = False
 
-            projection_points = []
-            obj_out_of_view = False
-
-            if isinstance(obj, WorldBezierSurface) or isinstance(
-                obj, WorldBicubicSurface
-            ):  # se for uma superficie de Bezier, nao precisa calcular a grade
+            # se for uma superficie, nao precisa calcular a grade
+            if isinstance(obj, WorldSurface):
                 obj.update_projection_points(projection_mtx)
                 continue
 
-            for point_wc in obj.world_points:
-                projected_point = point_wc @ projection_mtx
-                normalized_x, normalized_y, _, distance_factor = projected_point
+            if isinstance(obj, WorldPointCloud):
+                obj.update_projection(projection_mtx, window_conversion_mtx)
+                continue
+
+            if conversion_mtx is None:
+                source_points = obj.world_points
+            else:
+                source_points = obj.perceived_points
+
+            projected_points = WorldObject.transform_points(
+                source_points, view_projection_mtx
+            )
+            distance_factors = projected_points[:, 3]
+
+            if np.any(distance_factors < ClippingAlgorithms.NEAR_PLANE_W):
+                # Parte do objeto está atrás do plano próximo: recorta antes da divisão por w
+                obj.update_near_clipped_projection(projected_points)
+                continue
+
+            # Divide por w e descarta z e w
+            obj.update_projection_points(
+                obj.normalize_projected_points(projected_points)
+            )
+
+        return materialized_objects, repeated_object_ids
 
-                if distance_factor <= 0:
-                    # Se o objeto estiver atrás ou no mesmo plano que o COP, não projete-o
-                    obj_out_of_view = True
-                    break
+    def _materialize_visible_objects(
+        self, candidate_objects: list[WorldObject], projection_mtx: np.ndarray
+    ) -> tuple[list[WorldObject], list[int]]:
+        """
+        Carrega os objetos importados sob demanda cuja caixa envolvente entrou no volume de
+        visualização, substituindo seus representantes no display file. Como na importação
+        completa (ver add_objects), objetos repetidos são descartados: aqui, só é possível
+        compará-los depois de carregada a geometria.
+        @param candidate_objects: Objetos que não foram descartados pela hierarquia.
+        @param projection_mtx: Matriz de projeção atual.
+        @return: Tupla com a lista dos objetos carregados e a lista dos identificadores dos
+        representantes removidos por serem repetidos.
+        """
 
-                normalized_x /= distance_factor
-                normalized_y /= distance_factor
+        materialized_objects = []
+        repeated_object_ids = []
 
-                projection_points.append(
-                    (normalized_x, normalized_y)
-                )  # Descarta z e w e converte em lista de tuplas
+        for obj in candidate_objects:
+            if not isinstance(obj, LazyWorldObject) or not obj.is_visible(
+                projection_mtx
+            ):
+                continue
 
-            if obj_out_of_view:
-                obj.update_projection_points([])
+            world_object = obj.load()
+            if self._is_repeated(world_object):
+                self.remove_object(obj.object_id)
+                repeated_object_ids.append(obj.object_id)
                 continue
-            obj.update_projection_points(projection_points)
 
-    def import_file_to_display_file(
-        self, filepath: str
-    ) -> tuple[list[WorldObject], list[str]]:
+            if isinstance(world_object, SCWorldObject):
+                world_object.change_clipping_mode(self.clipping_mode)
+            world_object.dirty = True
+
+            world_object.object_id = obj.object_id
+            self.display_file[obj.object_id] = world_object
+            self._index_geometry(world_object)
+            same_name_objects = self.objects_by_name[obj.name]
+            same_name_objects[same_name_objects.index(obj)] = world_object
+
+            materialized_objects.append(world_object)
+
+        return materialized_objects, repeated_object_ids
+
+    def load_objects_from_file(
+        self,
+        filepath: str,
+        lazy: bool = False,
+        progress_callback: Callable | None = None,
+    ) -> list[WorldObject]:
         """
-        Importa um arquivo .obj e adiciona os objetos ao display file.
-        @param filepath: Caminho do arquivo .obj a ser importado.
-        @return: Tupla contendo os objetos importados e os nomes dos objetos que foram pulados.
+        Lê um arquivo .obj (ou de cena binária .sgi) e constrói seus objetos, sem alterar o
+        display file. Pode ser executado fora da thread da interface; os objetos devem então
+        ser adicionados com add_objects, que descarta os repetidos.
+        @param filepath: Caminho do arquivo a ser importado.
+        @param lazy: Se verdadeiro (apenas para arquivos .sgi), registra somente as caixas
+        envolventes dos objetos; a geometria é carregada quando cada um ficar visível.
+        @param progress_callback: Função chamada periodicamente com (bytes lidos, total de bytes,
+        objetos construídos). Pode lançar ImportCancelledError para interromper a importação.
+        @return: Lista com os objetos construídos.
         """
 
-        added_objects, skipped_objects_names = WorldObjectFactory.new_objects_from_file(
-            filepath=filepath, display_file=self.display_file
+        if lazy:
+            return WorldObjectFactory.new_lazy_objects_from_file(filepath)
+
+        return WorldObjectFactory.new_objects_from_file(
+            filepath=filepath, progress_callback=progress_callback
         )
 
-        for world_object in added_objects:
-            self.display_file.append(world_object)
+    def add_objects(self, world_objects: list[WorldObject]) -> list[WorldObject]:
+        """
+        Adiciona ao display file, de uma vez, objetos já construídos (por exemplo, importados).
+        Objetos com a mesma geometria de um objeto já existente, ou de um adicionado antes na
+        mesma lista, são pulados (ver objects_by_geometry).
+        @param world_objects: Objetos a serem adicionados.
+        @return: Lista com os objetos pulados.
+        """
+
+        skipped_objects = []
+        for world_object in world_objects:
+            if self._is_repeated(world_object):
+                skipped_objects.append(world_object)
+                continue
+
+            self._register_object(world_object)
             world_object.dirty = True
 
-        return added_objects, skipped_objects_names
+        return skipped_objects
 
     def change_clipping_mode(self, mode: str) -> None:
         """
         Muda o modo de clipping das linhas.
         @param mode: Modo de clipping.
         """
-        for obj in self.display_file:
+        for obj in self.display_file.values():
             if isinstance(obj, SCWorldObject):
                 obj.change_clipping_mode(mode)
 
+        self.clipping_mode = mode
+
+    def change_points_precision(self, precision: str) -> None:
+        """
+        Muda o tipo dos arrays de pontos de todos os objetos, atuais e futuros (ver
+        WorldObject.points_dtype). As transformações acumuladas até aqui são preservadas, com o
+        arredondamento do novo tipo.
+        @param precision: Precisão dos pontos ('float64' ou 'float32').
+        @raises ValueError: Se a precisão for inválida.
+        """
+
+        if precision not in self.points_dtypes:
+            raise ValueError(
+                f"Precisão inválida: {precision}. Válidas: {list(self.points_dtypes.keys())}"
+            )
+
+        if self.points_precision == precision:
+            return
+
+        dtype = self.points_dtypes[precision]
+        WorldObject.points_dtype = dtype
+        self.points_precision = precision
+
+        for obj in self.display_file.values():
+            # A chave do índice de geometria depende do tipo dos pontos
+            self._unindex_geometry(obj)
+            obj.perceived_points = obj.perceived_points.astype(dtype)
+            obj.world_points = obj.world_points.astype(dtype)
+            obj.dirty = True
+            self._index_geometry(obj)
+
     def add_test_objects(self) -> list[WorldObject]:
         """Adiciona objetos para testarmos o sistema gráfico."""
 
@@ -457,14 +993,19 @@ class DisplayFileManager:
 
         return test_objects
 
-    def remove_test_objects(self) -> None:
-        """Remove objetos de teste do display file."""
-
-        display_file_copy = self.display_file.copy()
+    def remove_test_objects(self) -> list[int]:
+        """
+        Remove objetos de teste do display file.
+        @return: Identificadores dos objetos removidos.
+        """
 
-        for obj in display_file_copy:
-            if obj.name.startswith("Test"):
-                self.remove_object(self.display_file.index(obj))
+        test_object_ids = [
+            object_id
+            for object_id, obj in self.display_file.items()
+            if obj.name.startswith("Test")
+        ]
+        self.remove_objects(test_object_ids)
+        return test_object_ids
 
     def change_projection_mode(self, mode: str) -> None:
         """
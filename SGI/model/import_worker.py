@@ -0,0 +1,68 @@
+import time
+from typing import Callable
+
+from model.world_objects.world_object_factory import ImportCancelledError
+from PyQt6 import QtCore
+
+# Intervalo mínimo (segundos) entre dois sinais de progresso
+PROGRESS_SIGNAL_INTERVAL = 0.2
+
+
+class ImportWorker(QtCore.QObject):
+    """
+    Executa a leitura de um arquivo e a construção dos objetos em uma QThread, para que a
+    interface continue respondendo durante importações grandes. O resultado é entregue pelos
+    sinais na thread da interface, que é quem altera o display file.
+    """
+
+    # Bytes lidos, total de bytes, objetos construídos
+    progress = QtCore.pyqtSignal(int, int, int)
+    finished = QtCore.pyqtSignal(list)  # Objetos construídos
+    failed = QtCore.pyqtSignal(object)  # Exceção lançada durante a importação
+    cancelled = QtCore.pyqtSignal()
+
+    def __init__(self, load_objects: Callable[[Callable], list]):
+        """
+        @param load_objects: Função que recebe o callback de progresso e retorna a lista de
+        objetos construídos.
+        """
+
+        super().__init__()
+        self.load_objects = load_objects
+        self.is_cancelled = False
+        self.last_progress_time = 0.0
+
+    def cancel(self) -> None:
+        """Solicita a interrupção da importação na próxima verificação de progresso."""
+        self.is_cancelled = True
+
+    def report_progress(
+        self, bytes_read: int, total_bytes: int, objects_built: int
+    ) -> None:
+        """
+        Callback de progresso repassado ao leitor do arquivo.
+        @raises ImportCancelledError: Se o cancelamento foi solicitado.
+        """
+
+        if self.is_cancelled:
+            raise ImportCancelledError()
+
+        now = time.monotonic()
+        if now - self.last_progress_time >= PROGRESS_SIGNAL_INTERVAL:
+            self.last_progress_time = now
+            self.progress.emit(bytes_read, total_bytes, objects_built)
+
+    def run(self) -> None:
+        """Executa a importação. Chamado quando a thread do worker é iniciada."""
+
+        try:
+            imported_objects = self.load_objects(self.report_progress)
+        except ImportCancelledError:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(e)
+        else:
+            if self.is_cancelled:
+                self.cancelled.emit()
+            else:
+                self.finished.emit(imported_objects)
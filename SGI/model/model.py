@@ -1,4 +1,11 @@
+import os
+import time
+from contextlib import contextmanager
+
 from model.display_file_manager import DisplayFileManager
+from model.import_worker import ImportWorker
+from model.scene_file import SCENE_FILE_EXTENSION
+from model.transformation_pipeline import TransformationPipeline
 from model.window import Window
 from model.world_objects.world_bezier_curve import WorldBezierCurve
 from model.world_objects.world_bezier_surface import WorldBezierSurface
@@ -6,14 +13,34 @@ from model.world_objects.world_bicubic_surface import WorldBicubicSurface
 from model.world_objects.world_bspline_curve import WorldBSplineCurve
 from model.world_objects.world_line import WorldLine
 from model.world_objects.world_point import WorldPoint
+from model.world_objects.world_point_cloud import WorldPointCloud
 from model.world_objects.world_polygon import WorldPolygon
 from model.world_objects.world_wireframe import WorldWireframe
+from PyQt6 import QtCore
 from view.view import View
 
+EXPORT_BUFFER_SIZE = 1 << 20  # Tamanho (bytes) do buffer de escrita na exportação .obj
+
+# Tamanho (bytes) a partir do qual arquivos .sgi são importados sob demanda por padrão
+LAZY_IMPORT_MIN_FILE_SIZE = 64 << 20
+
 
 class Model:
     """Classe que representa o modelo da nossa arquitetura MVC."""
 
+    # Tipos de objeto, pelo nome exibido na interface
+    OBJECT_TYPES = {
+        "Wireframe": WorldWireframe,
+        "Point": WorldPoint,
+        "Point Cloud": WorldPointCloud,
+        "Line": WorldLine,
+        "Bézier Curve": WorldBezierCurve,
+        "B-Spline Curve": WorldBSplineCurve,
+        "Bezier Surface": WorldBezierSurface,
+        "Bicubic Surface": WorldBicubicSurface,
+        "Polygon": WorldPolygon,
+    }
+
     def __init__(self, view: View):
         self.view = view
         self.window = Window(viewport_bounds=view.viewport.viewport_bounds)
@@ -21,6 +48,15 @@ class Model:
             self.view.viewport.viewport_bounds
         )
 
+        # Importação em segundo plano em andamento (ver start_import)
+        self.import_worker: ImportWorker | None = None
+        self.import_thread: QtCore.QThread | None = None
+        self.import_progress_logged = False
+
+        # Profundidade de blocos batch_updates abertos; enquanto for positiva, as funções
+        # decoradas com update_interface não redesenham a interface
+        self.interface_updates_suspended = 0
+
     @staticmethod
     def update_interface(func: callable) -> callable:
         """Decorator para atualizar a interface quando uma função é chamada."""
@@ -29,20 +65,39 @@ class Model:
             self = args[0]
             result = func(*args, **kwargs)
 
-            # Atualiza as projeções
-            self.update_projections()
-
-            # Atualiza a View
-            graphical_representations = (
-                self.display_file_manager.get_clipped_representations()
-            )
-            obj_list = self.display_file_manager.get_objs_as_strings()
-            self.view.update_view_objects(graphical_representations, obj_list)
+            if not self.interface_updates_suspended:
+                self.refresh_interface()
 
             return result
 
         return wrapper
 
+    def refresh_interface(self) -> None:
+        """Recalcula as projeções e redesenha a interface."""
+
+        # Atualiza as projeções
+        self.update_projections()
+
+        # Atualiza a View
+        render_batch = self.display_file_manager.get_render_batch()
+        obj_list = self.display_file_manager.get_objs_as_strings()
+        self.view.update_view_objects(render_batch, obj_list)
+
+    @contextmanager
+    def batch_updates(self):
+        """
+        Suspende as atualizações da interface dentro do bloco with; a interface é redesenhada
+        uma única vez ao final do bloco mais externo.
+        """
+
+        self.interface_updates_suspended += 1
+        try:
+            yield
+        finally:
+            self.interface_updates_suspended -= 1
+            if not self.interface_updates_suspended:
+                self.refresh_interface()
+
     @update_interface
     def add_object(
         self,
@@ -63,42 +118,81 @@ class Model:
         @param edges: Lista de arestas que compõem o objeto.
         """
 
-        obj_types = {
-            "Wireframe": WorldWireframe,
-            "Point": WorldPoint,
-            "Line": WorldLine,
-            "Bézier Curve": WorldBezierCurve,
-            "B-Spline Curve": WorldBSplineCurve,
-            "Bezier Surface": WorldBezierSurface,
-            "Bicubic Surface": WorldBicubicSurface,
-            "Polygon": WorldPolygon,
-        }
+        obj = self._add_object(points, name, color, is_filled, object_type, edges)
+        if obj is None:
+            self.view.add_log("Object already exists, skipping...")
+            return
+
+        self.view.add_log(f"{object_type} {obj.name} added: {points}")
+
+    @update_interface
+    def add_objects(self, object_specs: list[dict]) -> None:
+        """
+        Adiciona vários objetos gráficos ao mundo, redesenhando a interface uma única vez.
+        @param object_specs: Lista de dicionários com os argumentos de add_object (points, name,
+        color, is_filled, object_type, edges). As chaves is_filled e edges são opcionais.
+        """
+
+        start_time = time.perf_counter()
+        added_count = 0
+
+        for spec in object_specs:
+            obj = self._add_object(
+                points=spec["points"],
+                name=spec["name"],
+                color=spec["color"],
+                is_filled=spec.get("is_filled", False),
+                object_type=spec["object_type"],
+                edges=spec.get("edges"),
+            )
+            if obj is not None:
+                added_count += 1
+
+        elapsed_time = time.perf_counter() - start_time
+        self.view.add_log(f"{added_count} objects added in {elapsed_time:.3f}s")
 
-        object_type_cls = obj_types[object_type]
+        skipped_count = len(object_specs) - added_count
+        if skipped_count:
+            self.view.add_log(f"{skipped_count} repeated objects skipped")
+
+    def _add_object(
+        self,
+        points: list,
+        name: str,
+        color: tuple,
+        is_filled: bool,
+        object_type: str,
+        edges: list,
+    ):
+        """
+        Adiciona um objeto ao display file e o inscreve na window, sem atualizar a interface.
+        @return: O objeto adicionado ou None se ele já existir.
+        @raises KeyError: Se o tipo de objeto for desconhecido.
+        """
 
         obj = self.display_file_manager.add_object(
             points=points,
             name=name,
             color=color,
             is_filled=is_filled,
-            object_type=object_type_cls,
+            object_type=self.OBJECT_TYPES[object_type],
             edges=edges,
         )
-        if obj is None:
-            self.view.add_log("Object already exists, skipping...")
-            return
 
-        self.view.add_log(f"{object_type} {obj.name} added: {points}")
-        self.window.add_subscriber(obj)
+        if obj is not None:
+            self.window.add_subscriber(obj)
+        return obj
 
     @update_interface
-    def remove_object(self, index: int) -> None:
+    def remove_objects(self, object_ids: list[int]) -> None:
         """
-        Remove um objeto do display file e atualiza a View.
-        @param index: Índice do objeto a ser removido. Coincide com o índice na lista de objetos da interface.
+        Remove objetos do display file e atualiza a View uma única vez.
+        @param object_ids: Identificadores dos objetos a serem removidos, como associados aos
+        itens da lista de objetos da interface.
         """
-        self.display_file_manager.remove_object(index)
-        self.window.remove_subscriber(index)
+
+        self.display_file_manager.remove_objects(object_ids)
+        self.window.remove_subscribers(object_ids)
 
     @update_interface
     def zoom(self, new_zoom_value: float) -> None:
@@ -139,21 +233,70 @@ class Model:
     @update_interface
     def handle_transformations(
         self,
-        index: int,
-        transformations_list: list[dict],
+        object_id: int,
+        transformations_list: list[dict] | TransformationPipeline,
     ) -> None:
         """
         Aplica uma lista de transformações a um determinado objeto gráfico.
-        @param index: Índice do objeto a ser transformado.
-        @param transformations_list: Lista de dicionários, cada um representando uma transformação.
+        @param object_id: Identificador do objeto a ser transformado.
+        @param transformations_list: Lista de dicionários, cada um representando uma transformação,
+        ou uma transformação já compilada.
         """
 
         self.display_file_manager.apply_transformation(
-            index=index,
+            object_id=object_id,
             transformations_list=transformations_list,
             conversion_mtx=self.window.conversion_mtx,
+            fold_conversion=self.window.fold_conversion,
         )
 
+        self._log_transformations(transformations_list)
+        obj_name = self.display_file_manager.get_obj_name(object_id)
+        self.view.add_log(f"{obj_name}: transformations applied.")
+
+    @update_interface
+    def handle_group_transformations(
+        self,
+        object_ids: list[int],
+        transformations_list: list[dict] | TransformationPipeline,
+        use_own_centers: bool = False,
+    ) -> None:
+        """
+        Aplica uma lista de transformações a vários objetos gráficos de uma vez.
+        @param object_ids: Identificadores dos objetos a serem transformados.
+        @param transformations_list: Lista de dicionários, cada um representando uma transformação,
+        ou uma transformação já compilada (ver TransformationPipeline), que pode ser reutilizada
+        em várias chamadas.
+        @param use_own_centers: Se escalonamentos e rotações usam o centro de cada objeto, em vez
+        do centro do grupo.
+        """
+
+        self.display_file_manager.apply_group_transformation(
+            object_ids=object_ids,
+            transformations_list=transformations_list,
+            conversion_mtx=self.window.conversion_mtx,
+            use_own_centers=use_own_centers,
+            fold_conversion=self.window.fold_conversion,
+        )
+
+        self._log_transformations(transformations_list)
+        center = "their own centers" if use_own_centers else "the group center"
+        self.view.add_log(
+            f"{len(object_ids)} objects: transformations applied around {center}."
+        )
+
+    def _log_transformations(
+        self, transformations_list: list[dict] | TransformationPipeline
+    ) -> None:
+        """
+        Registra no log as transformações aplicadas.
+        @param transformations_list: Lista de dicionários, cada um representando uma transformação,
+        ou uma transformação já compilada.
+        """
+
+        if isinstance(transformations_list, TransformationPipeline):
+            transformations_list = transformations_list.steps
+
         for transformation in transformations_list:
             if transformation["type"] == "scaling":
                 self.view.add_log(
@@ -168,58 +311,220 @@ class Model:
                     f"Rotating object by {transformation['angle']} degrees"
                 )
 
-        obj_name = self.display_file_manager.get_obj_name(index)
-        self.view.add_log(f"{obj_name}: transformations applied.")
-
     def update_projections(self) -> None:
         """Método para recalcular as projeções de todos os objetos no display file."""
 
-        self.display_file_manager.update_projections(
-            center_of_projection=self.window.center_of_projection,
-            window_width=self.window.get_width(),
-            window_height=self.window.get_height(),
+        materialized_objects, repeated_object_ids = (
+            self.display_file_manager.update_projections(
+                center_of_projection=self.window.center_of_projection,
+                window_width=self.window.get_width(),
+                window_height=self.window.get_height(),
+                conversion_mtx=self.window.conversion_mtx,
+                fold_conversion=self.window.fold_conversion,
+            )
         )
 
-    @update_interface
-    def import_obj_file(self, filepath: str) -> None:
+        # Objetos importados sob demanda que acabaram de ser carregados substituem seus
+        # representantes também entre os assinantes da window
+        for obj in materialized_objects:
+            self.window.replace_subscriber(obj)
+
+        if repeated_object_ids:
+            self.window.remove_subscribers(repeated_object_ids)
+            self.view.add_log(
+                f"{len(repeated_object_ids)} repeated objects skipped while loading"
+            )
+
+    def _resolve_lazy_import(self, filepath: str, lazy: bool | None) -> bool:
         """
-        Importa um arquivo .obj para o display file.
-        @param filepath: Caminho do arquivo .obj a ser importado.
+        Decide se uma importação deve carregar os objetos sob demanda.
+        @param filepath: Caminho do arquivo a ser importado.
+        @param lazy: Modo pedido pelo chamador. Se None, é ativado para arquivos .sgi maiores
+        que LAZY_IMPORT_MIN_FILE_SIZE.
+        @return: Se a importação será sob demanda.
         """
 
-        try:
-            added_objects, skipped_objects = (
-                self.display_file_manager.import_file_to_display_file(filepath=filepath)
+        is_scene_file = filepath.lower().endswith(SCENE_FILE_EXTENSION)
+        if lazy is None:
+            return (
+                is_scene_file and os.path.getsize(filepath) >= LAZY_IMPORT_MIN_FILE_SIZE
             )
+        if lazy and not is_scene_file:
+            self.view.add_log("Lazy import requires a .sgi scene file, loading all")
+            return False
+        return lazy
 
-            self.view.add_log(f"Objects successfully imported from {filepath}")
-            if skipped_objects:
-                self.view.add_log(f"Skipped objects: {", ".join(skipped_objects)}")
+    def _add_imported_objects(
+        self, filepath: str, imported_objects: list, lazy: bool
+    ) -> None:
+        """
+        Adiciona ao display file e à window, em lote, os objetos de uma importação. Os objetos
+        já existentes são pulados.
+        @param filepath: Caminho do arquivo importado.
+        @param imported_objects: Objetos construídos.
+        @param lazy: Se a importação foi sob demanda.
+        """
 
-            for obj in added_objects:
+        skipped_objects = self.display_file_manager.add_objects(imported_objects)
+        skipped_ids = {id(obj) for obj in skipped_objects}
+        for obj in imported_objects:
+            if id(obj) not in skipped_ids:
                 self.window.add_subscriber(obj)
 
-        except FileNotFoundError:
+        self.view.add_log(f"Objects successfully imported from {filepath}")
+        if lazy:
+            self.view.add_log("Objects will be loaded as they become visible")
+        if skipped_objects:
+            skipped_names = ", ".join(obj.name for obj in skipped_objects)
+            self.view.add_log(f"Skipped objects: {skipped_names}")
+
+    def _log_import_error(self, filepath: str, error: Exception) -> None:
+        """
+        Registra no log um erro de importação.
+        @param filepath: Caminho do arquivo importado.
+        @param error: Exceção lançada durante a importação.
+        """
+
+        if isinstance(error, FileNotFoundError):
             self.view.add_log(f"File not found: {filepath}")
+        else:
+            self.view.add_log(f"Error importing file: {error}")
+
+    @update_interface
+    def import_obj_file(self, filepath: str, lazy: bool | None = None) -> None:
+        """
+        Importa um arquivo .obj (ou de cena binária .sgi) para o display file, bloqueando até
+        o fim da leitura. A interface usa start_import, que lê o arquivo em segundo plano.
+        @param filepath: Caminho do arquivo a ser importado.
+        @param lazy: Se os objetos devem ser carregados apenas quando ficarem visíveis. Só é
+        suportado em arquivos .sgi; se None, é ativado para arquivos .sgi maiores que
+        LAZY_IMPORT_MIN_FILE_SIZE.
+        """
+
+        try:
+            lazy = self._resolve_lazy_import(filepath, lazy)
+            imported_objects = self.display_file_manager.load_objects_from_file(
+                filepath=filepath, lazy=lazy
+            )
+        except Exception as e:
+            self._log_import_error(filepath, e)
+            return
+
+        self._add_imported_objects(filepath, imported_objects, lazy)
+
+    def start_import(self, filepath: str, lazy: bool | None = None) -> None:
+        """
+        Inicia a importação de um arquivo .obj (ou .sgi) em segundo plano. O progresso é
+        mostrado no log e, ao final, os objetos são adicionados de uma vez, com um único
+        redesenho.
+        @param filepath: Caminho do arquivo a ser importado.
+        @param lazy: Ver import_obj_file.
+        """
+
+        if self.import_worker is not None:
+            self.view.add_log("An import is already in progress")
             return
+
+        try:
+            lazy = self._resolve_lazy_import(filepath, lazy)
         except Exception as e:
-            self.view.add_log(f"Error importing file: {e}")
+            self._log_import_error(filepath, e)
             return
 
-    def export_obj_file(self, filepath: str) -> None:
+        worker = ImportWorker(
+            lambda progress_callback: self.display_file_manager.load_objects_from_file(
+                filepath=filepath, lazy=lazy, progress_callback=progress_callback
+            )
+        )
+        thread = QtCore.QThread()
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.progress.connect(self._on_import_progress)
+        worker.finished.connect(
+            lambda imported_objects: self._on_import_finished(
+                filepath, imported_objects, lazy
+            )
+        )
+        worker.failed.connect(lambda error: self._log_import_error(filepath, error))
+        worker.cancelled.connect(lambda: self.view.add_log("Import cancelled"))
+
+        for signal in (worker.finished, worker.failed, worker.cancelled):
+            signal.connect(self._on_import_done)
+
+        self.import_worker = worker
+        self.import_thread = thread
+        self.view.set_import_running(True)
+        self.view.add_log(f"Importing {filepath}...")
+        thread.start()
+
+    def cancel_import(self) -> None:
+        """Cancela a importação em segundo plano, se houver uma em andamento."""
+
+        if self.import_worker is not None:
+            self.import_worker.cancel()
+            self.view.add_log("Cancelling import...")
+
+    def _on_import_progress(
+        self, bytes_read: int, total_bytes: int, objects_built: int
+    ) -> None:
+        """Mostra o progresso da importação em segundo plano, sempre na mesma linha do log."""
+
+        percentage = 100 * bytes_read / total_bytes if total_bytes else 100
+        self.view.add_log(
+            f"Importing: {bytes_read}/{total_bytes} bytes read ({percentage:.0f}%), "
+            f"{objects_built} objects built",
+            replace_last=self.import_progress_logged,
+        )
+        self.import_progress_logged = True
+
+    @update_interface
+    def _on_import_finished(
+        self, filepath: str, imported_objects: list, lazy: bool
+    ) -> None:
         """
-        Exporta os objetos do display file para um arquivo .obj.
-        @param filepath: Caminho do diretório onde o arquivo .obj será salvo.
-        @param name: Nome do arquivo .obj a ser salvo.
+        Adiciona, na thread da interface, os objetos lidos em segundo plano, pulando os
+        repetidos.
         """
+        self._add_imported_objects(filepath, imported_objects, lazy)
 
-        obj_str = self.display_file_manager.convert_display_file_to_obj()
+    def _on_import_done(self, *args) -> None:
+        """Libera o worker e a thread ao fim da importação, qualquer que seja o resultado."""
 
-        with open(filepath, "w") as f:
-            f.write(obj_str)
+        self.import_thread.quit()
+        self.import_thread.wait()
+        self.import_worker = None
+        self.import_thread = None
+        self.import_progress_logged = False
+        self.view.set_import_running(False)
+
+    def export_obj_file(self, filepath: str) -> None:
+        """
+        Exporta os objetos do display file para um arquivo .obj. O conteúdo é escrito em
+        blocos diretamente no arquivo, sem montar a cena inteira em memória.
+        @param filepath: Caminho do arquivo .obj a ser salvo.
+        """
+
+        with open(filepath, "w", buffering=EXPORT_BUFFER_SIZE) as f:
+            self.display_file_manager.write_display_file_to_obj(f)
 
         self.view.add_log(f"Objects successfully exported to {filepath}")
 
+    def export_scene_file(self, filepath: str) -> None:
+        """
+        Salva os objetos do display file no formato binário de cena (.sgi), que preserva
+        precisão, cores e preenchimento.
+        @param filepath: Caminho do arquivo a ser salvo.
+        """
+
+        start_time = time.perf_counter()
+        self.display_file_manager.write_display_file_to_scene(filepath)
+        elapsed_time = time.perf_counter() - start_time
+
+        self.view.add_log(
+            f"Scene successfully saved to {filepath} in {elapsed_time:.3f}s"
+        )
+
     @update_interface
     def change_cop_distance(self, distance: float) -> None:
         """
@@ -237,6 +542,18 @@ class Model:
         """
         self.display_file_manager.change_clipping_mode(mode)
 
+    @update_interface
+    def change_points_precision(self, precision: str) -> None:
+        """
+        Muda a precisão dos pontos: 'float64' (padrão) ou 'float32', que usa metade da memória
+        em cenas grandes. Em float32, os vértices no viewport se afastam dos obtidos em float64
+        em menos de 0,001 pixel após centenas de transformações e rotações da window, e em até
+        0,09 pixel com zoom de 150x (ver benchmarks/bench_float32_accuracy.py).
+        @param precision: Precisão dos pontos.
+        """
+        self.display_file_manager.change_points_precision(precision)
+        self.view.add_log(f"Points stored as {precision}")
+
     @update_interface
     def add_test_objects(self) -> None:
         """Adiciona objetos de teste ao mundo."""
@@ -248,7 +565,9 @@ class Model:
     @update_interface
     def remove_test_objects(self) -> None:
         """Remove objetos de teste do mundo."""
-        self.display_file_manager.remove_test_objects()
+
+        removed_ids = self.display_file_manager.remove_test_objects()
+        self.window.remove_subscribers(removed_ids)
 
     @update_interface
     def change_projection_mode(self, mode: str) -> None:
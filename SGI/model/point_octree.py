@@ -0,0 +1,173 @@
+import numpy as np
+from model.bounding_volume_hierarchy import BoundingVolumeHierarchy
+
+# Quantidade máxima de pontos em uma folha da octree
+OCTREE_LEAF_CAPACITY = 2048
+
+# Profundidade máxima da octree (bits por eixo dos códigos de Morton)
+OCTREE_MAX_DEPTH = 16
+
+
+class PointOctree:
+    """
+    Octree sobre os pontos de uma nuvem. Os pontos são ordenados pelo código de Morton da
+    célula em que caem, de modo que cada nó corresponde a um intervalo contíguo dessa ordem
+    (order). Como em BoundingVolumeHierarchy, os nós ficam em arrays, com os pais antes dos
+    filhos, e cada um guarda a caixa justa dos seus pontos, os até 8 filhos (-1 onde não há) e
+    o seu intervalo.
+    """
+
+    def __init__(self, points: np.ndarray):
+        """
+        @param points: Array (N, 3) ou (N, 4) com os pontos da nuvem.
+        """
+
+        coordinates = points[:, :3]
+        self.point_count = len(coordinates)
+
+        if not self.point_count:
+            self.order = np.empty(0, dtype=np.intp)
+            self.node_bounds = np.empty((0, 2, 3))
+            self.node_children = np.empty((0, 8), dtype=int)
+            self.node_ranges = np.empty((0, 2), dtype=int)
+            return
+
+        codes = self._get_morton_codes(coordinates)
+        self.order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[self.order]
+        sorted_coordinates = coordinates[self.order]
+
+        node_bounds = []
+        node_children = []
+        node_ranges = []
+
+        def new_node(start: int, end: int) -> int:
+            node_coordinates = sorted_coordinates[start:end]
+            node_bounds.append(
+                (node_coordinates.min(axis=0), node_coordinates.max(axis=0))
+            )
+            node_children.append([-1] * 8)
+            node_ranges.append((start, end))
+            return len(node_ranges) - 1
+
+        # Cada nó pendente guarda sua profundidade; na profundidade d, os filhos são separados
+        # pelos 3 bits seguintes do código de Morton
+        pending_nodes = [(new_node(0, self.point_count), 0)]
+        while pending_nodes:
+            node_index, depth = pending_nodes.pop()
+            start, end = node_ranges[node_index]
+            if end - start <= OCTREE_LEAF_CAPACITY or depth == OCTREE_MAX_DEPTH:
+                continue
+
+            shift = 3 * (OCTREE_MAX_DEPTH - depth - 1)
+            child_octants = (sorted_codes[start:end] >> np.uint64(shift)) & np.uint64(7)
+            child_starts = start + np.searchsorted(child_octants, np.arange(9))
+
+            for octant in range(8):
+                child_start, child_end = child_starts[octant], child_starts[octant + 1]
+                if child_start == child_end:
+                    continue
+                child_index = new_node(child_start, child_end)
+                node_children[node_index][octant] = child_index
+                pending_nodes.append((child_index, depth + 1))
+
+        self.node_bounds = np.array(node_bounds)
+        self.node_children = np.array(node_children, dtype=int)
+        self.node_ranges = np.array(node_ranges, dtype=int)
+
+    @staticmethod
+    def _get_morton_codes(coordinates: np.ndarray) -> np.ndarray:
+        """
+        Calcula o código de Morton de cada ponto: as coordenadas são quantizadas numa grade de
+        2^OCTREE_MAX_DEPTH células por eixo e seus bits são intercalados (x, y, z). As células
+        são cúbicas, com o lado dado pelo maior eixo da nuvem: numa nuvem achatada, os nós não
+        são divididos na direção mais fina até ficarem tão finos quanto ela (nós empilhados
+        nessa direção se sobreporiam na tela e dividiriam a mesma área entre si).
+        @param coordinates: Array (N, 3) com os pontos.
+        @return: Array (N,) de códigos (uint64).
+        """
+
+        lowest = coordinates.min(axis=0)
+        extent = max((coordinates.max(axis=0) - lowest).max(), 1e-12)
+        cell_count = 1 << OCTREE_MAX_DEPTH
+        cells = np.minimum(
+            ((coordinates - lowest) / extent * cell_count).astype(np.uint64),
+            np.uint64(cell_count - 1),
+        )
+
+        codes = np.zeros(len(coordinates), dtype=np.uint64)
+        for bit in range(OCTREE_MAX_DEPTH):
+            for axis in range(3):
+                axis_bit = (cells[:, axis] >> np.uint64(bit)) & np.uint64(1)
+                codes |= axis_bit << np.uint64(3 * bit + 2 - axis)
+        return codes
+
+    def select_points(
+        self,
+        view_projection_mtx: np.ndarray,
+        viewport_size: tuple[float, float],
+        cell_size: float,
+    ) -> tuple[np.ndarray, int]:
+        """
+        Escolhe os pontos a projetar. Nós fora do volume de visualização são descartados e
+        os que cruzam sua borda são subdivididos. Cada nó inteiramente visível (ou folha)
+        recebe uma cota de pontos proporcional à área que ocupa na tela: uma célula de
+        cell_size x cell_size pixels comporta um único ponto visível. Nós com mais pontos que a
+        cota são amostrados uniformemente ao longo do seu intervalo (que mistura todos os seus
+        filhos), sem descer na árvore.
+        @param view_projection_mtx: Matriz que leva os pontos da octree à projeção.
+        @param viewport_size: Largura e altura do viewport, em pixels.
+        @param cell_size: Lado, em pixels, da célula que comporta um ponto.
+        @return: Posições (em relação ao array usado na construção) dos pontos escolhidos e
+        quantidade de nós testados.
+        """
+
+        if not self.point_count:
+            return np.empty(0, dtype=np.intp), 0
+
+        node_outside, node_inside, corners_min, corners_max = (
+            BoundingVolumeHierarchy.classify_boxes(
+                self.node_bounds, view_projection_mtx
+            )
+        )
+
+        # Área na tela (em células) da parte visível de cada nó. Nós que cruzam o plano do COP
+        # têm projeção ilimitada e são tratados como se cobrissem o viewport inteiro
+        width, height = viewport_size
+        visible_extent = np.clip(corners_max, -1, 1) - np.clip(corners_min, -1, 1)
+        node_cells = (
+            visible_extent[:, 0] * width / 2 * visible_extent[:, 1] * height / 2
+        ) / cell_size**2
+
+        selected_ranges = []
+        nodes_tested = 0
+        pending_nodes = [0]
+
+        while pending_nodes:
+            node_index = pending_nodes.pop()
+            nodes_tested += 1
+            if node_outside[node_index]:
+                continue
+
+            start, end = self.node_ranges[node_index]
+            children = self.node_children[node_index]
+            is_leaf = np.all(children < 0)
+            point_budget = max(int(np.ceil(node_cells[node_index])), 1)
+
+            if not (is_leaf or node_inside[node_index]):
+                # O nó cruza a borda do volume de visualização: desce para descartar a parte
+                # que está fora
+                pending_nodes.extend(children[children >= 0])
+            elif end - start > point_budget:
+                # Mais pontos do que cabem na área do nó: amostra uniforme, sem descer
+                stride = (end - start) / point_budget
+                selected_ranges.append(
+                    start + (np.arange(point_budget) * stride).astype(np.intp)
+                )
+            else:
+                selected_ranges.append(np.arange(start, end))
+
+        if not selected_ranges:
+            return np.empty(0, dtype=np.intp), nodes_tested
+
+        return self.order[np.concatenate(selected_ranges)], nodes_tested
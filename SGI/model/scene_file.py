@@ -0,0 +1,303 @@
+import numpy as np
+from model.world_objects.world_bezier_curve import WorldBezierCurve
+from model.world_objects.world_bezier_surface import WorldBezierSurface
+from model.world_objects.world_bicubic_surface import WorldBicubicSurface
+from model.world_objects.world_bspline_curve import WorldBSplineCurve
+from model.world_objects.lazy_world_object import LazyWorldObject
+from model.world_objects.world_line import WorldLine
+from model.world_objects.world_object import WorldObject
+from model.world_objects.world_point import WorldPoint
+from model.world_objects.world_point_cloud import WorldPointCloud
+from model.world_objects.world_polygon import WorldPolygon
+from model.world_objects.world_wireframe import WorldWireframe
+
+SCENE_FILE_EXTENSION = ".sgi"
+
+
+class SceneFile:
+    """
+    Formato binário nativo de cena do SGI. Ao contrário do .obj, preserva a precisão total das
+    coordenadas, as cores, o preenchimento e as dimensões das superfícies. Layout do arquivo
+    (little-endian, seções alinhadas em 8 bytes):
+
+    1 - Cabeçalho (HEADER_DTYPE)
+    2 - Tabela de objetos (OBJECT_DTYPE), um registro por objeto
+    3 - Vértices: array float64 (total_de_vértices, 3), contíguo para todos os objetos
+    4 - Arestas: array int64 (total_de_arestas, 2), índices relativos ao objeto
+    5 - Nomes: bytes UTF-8 concatenados
+
+    As seções numéricas são lidas com np.memmap, sem cópia; cada objeto referencia a sua fatia
+    por offset e quantidade, o que também permite ler objetos individualmente (ver
+    LazyWorldObject).
+    """
+
+    MAGIC = b"SGISCENE"
+    VERSION = 1
+
+    HEADER_DTYPE = np.dtype(
+        [
+            ("magic", "S8"),
+            ("version", "<u4"),
+            ("object_count", "<u4"),
+            ("vertex_count", "<u8"),
+            ("edge_count", "<u8"),
+            ("names_size", "<u8"),
+        ]
+    )
+
+    OBJECT_DTYPE = np.dtype(
+        [
+            ("vertex_offset", "<u8"),
+            ("vertex_count", "<u8"),
+            ("edge_offset", "<u8"),
+            ("edge_count", "<u8"),
+            ("name_offset", "<u8"),
+            ("name_length", "<u4"),
+            ("rows", "<u4"),  # Dimensão N das superfícies (0 para os demais objetos)
+            ("cols", "<u4"),  # Dimensão M das superfícies (0 para os demais objetos)
+            ("type", "u1"),
+            ("is_filled", "u1"),
+            ("color", "u1", (3,)),
+        ],
+        align=True,
+    )
+
+    VERTEX_DTYPE = np.dtype("<f8")
+    EDGE_DTYPE = np.dtype("<i8")
+
+    # O código de cada tipo é sua posição na lista; novos tipos devem ser adicionados ao final
+    OBJECT_TYPES = [
+        WorldPoint,
+        WorldLine,
+        WorldPolygon,
+        WorldWireframe,
+        WorldBezierCurve,
+        WorldBSplineCurve,
+        WorldBezierSurface,
+        WorldBicubicSurface,
+        WorldPointCloud,
+    ]
+
+    @classmethod
+    def write(cls, filepath: str, display_file: list[WorldObject]) -> None:
+        """
+        Salva os objetos do display file no formato binário de cena.
+        @param filepath: Caminho do arquivo a ser escrito.
+        @param display_file: Objetos a serem salvos.
+        """
+
+        object_table = np.zeros(len(display_file), dtype=cls.OBJECT_DTYPE)
+        vertex_blocks = []
+        edge_blocks = []
+        encoded_names = []
+
+        vertex_offset = edge_offset = name_offset = 0
+
+        for record, obj in zip(object_table, display_file):
+            if isinstance(obj, LazyWorldObject):
+                obj = obj.load()
+
+            vertices = obj.perceived_points[:, :3]
+            edges = getattr(obj, "edges", None)
+            edges = np.asarray([] if edges is None else edges, dtype=np.int64).reshape(
+                -1, 2
+            )
+            name = obj.name.encode("utf-8")
+
+            record["vertex_offset"] = vertex_offset
+            record["vertex_count"] = len(vertices)
+            record["edge_offset"] = edge_offset
+            record["edge_count"] = len(edges)
+            record["name_offset"] = name_offset
+            record["name_length"] = len(name)
+            record["type"] = cls.OBJECT_TYPES.index(obj.__class__)
+            record["is_filled"] = getattr(obj, "is_filled", False)
+            record["color"] = obj.color
+
+            if isinstance(obj, WorldBezierSurface):
+                record["rows"], record["cols"] = 4, 4
+            elif isinstance(obj, WorldBicubicSurface):
+                record["rows"], record["cols"] = obj.control_points_matrix_nxm.shape[:2]
+
+            vertex_blocks.append(vertices)
+            edge_blocks.append(edges)
+            encoded_names.append(name)
+
+            vertex_offset += len(vertices)
+            edge_offset += len(edges)
+            name_offset += len(name)
+
+        header = np.zeros(1, dtype=cls.HEADER_DTYPE)
+        header["magic"] = cls.MAGIC
+        header["version"] = cls.VERSION
+        header["object_count"] = len(display_file)
+        header["vertex_count"] = vertex_offset
+        header["edge_count"] = edge_offset
+        header["names_size"] = name_offset
+
+        with open(filepath, "wb") as f:
+            f.write(header.tobytes())
+            f.write(object_table.tobytes())
+            for vertices in vertex_blocks:
+                f.write(vertices.astype(cls.VERTEX_DTYPE, copy=False).tobytes())
+            for edges in edge_blocks:
+                f.write(edges.astype(cls.EDGE_DTYPE, copy=False).tobytes())
+            for name in encoded_names:
+                f.write(name)
+
+    @classmethod
+    def _map_section(
+        cls, filepath: str, dtype: np.dtype, offset: int, shape: tuple
+    ) -> np.ndarray:
+        """
+        Mapeia uma seção do arquivo em memória, sem copiá-la.
+        @param filepath: Caminho do arquivo.
+        @param dtype: Tipo dos elementos da seção.
+        @param offset: Posição (em bytes) do início da seção.
+        @param shape: Formato do array mapeado.
+        @return: Array somente leitura apontando para o arquivo.
+        """
+
+        if shape[0] == 0:  # np.memmap não aceita regiões vazias
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(filepath, dtype=dtype, mode="r", offset=offset, shape=shape)
+
+    @classmethod
+    def open(cls, filepath: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, bytes]:
+        """
+        Valida o cabeçalho e mapeia as seções de um arquivo binário de cena.
+        @param filepath: Caminho do arquivo a ser lido.
+        @return: Tupla (tabela de objetos, vértices, arestas, nomes). Os arrays são mapeados
+        em memória: nenhum vértice é lido do disco até ser acessado.
+        @raises ValueError: Se o arquivo não estiver no formato esperado.
+        """
+
+        header = np.fromfile(filepath, dtype=cls.HEADER_DTYPE, count=1)
+        if len(header) != 1 or header["magic"][0] != cls.MAGIC:
+            raise ValueError(f"{filepath} não é um arquivo de cena do SGI")
+        if header["version"][0] != cls.VERSION:
+            raise ValueError(
+                f"Versão de arquivo de cena não suportada: {header['version'][0]}"
+            )
+
+        object_count = int(header["object_count"][0])
+        vertex_count = int(header["vertex_count"][0])
+        edge_count = int(header["edge_count"][0])
+        names_size = int(header["names_size"][0])
+
+        table_offset = cls.HEADER_DTYPE.itemsize
+        vertices_offset = table_offset + object_count * cls.OBJECT_DTYPE.itemsize
+        edges_offset = vertices_offset + vertex_count * 3 * cls.VERTEX_DTYPE.itemsize
+        names_offset = edges_offset + edge_count * 2 * cls.EDGE_DTYPE.itemsize
+
+        object_table = cls._map_section(
+            filepath, cls.OBJECT_DTYPE, table_offset, (object_count,)
+        )
+        vertices = cls._map_section(
+            filepath, cls.VERTEX_DTYPE, vertices_offset, (vertex_count, 3)
+        )
+        edges = cls._map_section(
+            filepath, cls.EDGE_DTYPE, edges_offset, (edge_count, 2)
+        )
+        names = bytes(cls._map_section(filepath, np.uint8, names_offset, (names_size,)))
+
+        return object_table, vertices, edges, names
+
+    @staticmethod
+    def _get_object_name(record: np.void, names: bytes) -> str:
+        """
+        Decodifica o nome de um objeto da tabela.
+        @param record: Registro do objeto na tabela.
+        @param names: Seção de nomes do arquivo.
+        @return: Nome do objeto.
+        """
+
+        name_start = int(record["name_offset"])
+        return names[name_start : name_start + int(record["name_length"])].decode(
+            "utf-8"
+        )
+
+    @classmethod
+    def read_object(
+        cls, sections: tuple[np.ndarray, np.ndarray, np.ndarray, bytes], index: int
+    ) -> list:
+        """
+        Lê um único objeto de um arquivo de cena já aberto.
+        @param sections: Seções do arquivo, como retornadas por SceneFile.open.
+        @param index: Posição do objeto na tabela de objetos.
+        @return: Dados do objeto. Formato: [nome, pontos, preenchimento, tipo, arestas, cor],
+        o mesmo de WorldObjectFactory.read_obj_file.
+        """
+
+        object_table, vertices, edges, names = sections
+        record = object_table[index]
+        obj_type = cls.OBJECT_TYPES[record["type"]]
+
+        vertex_start = int(record["vertex_offset"])
+        obj_points = vertices[vertex_start : vertex_start + int(record["vertex_count"])]
+
+        if obj_type in (WorldBezierSurface, WorldBicubicSurface):
+            obj_points = obj_points.reshape(int(record["rows"]), int(record["cols"]), 3)
+
+        edge_start = int(record["edge_offset"])
+        obj_edges = np.array(edges[edge_start : edge_start + int(record["edge_count"])])
+
+        return [
+            cls._get_object_name(record, names),
+            obj_points,
+            bool(record["is_filled"]),
+            obj_type,
+            obj_edges,
+            tuple(int(channel) for channel in record["color"]),
+        ]
+
+    @classmethod
+    def read(cls, filepath: str) -> list:
+        """
+        Lê um arquivo binário de cena.
+        @param filepath: Caminho do arquivo a ser lido.
+        @return: Lista de objetos lidos. Formato: [nome, pontos, preenchimento, tipo, arestas, cor],
+        o mesmo de WorldObjectFactory.read_obj_file.
+        @raises ValueError: Se o arquivo não estiver no formato esperado.
+        """
+
+        sections = cls.open(filepath)
+        return [cls.read_object(sections, index) for index in range(len(sections[0]))]
+
+    @classmethod
+    def read_index(
+        cls, sections: tuple[np.ndarray, np.ndarray, np.ndarray, bytes]
+    ) -> list:
+        """
+        Lê apenas os metadados de cada objeto de um arquivo de cena já aberto, sem construir
+        a geometria. As caixas envolventes e os centros são calculados de uma vez para todos
+        os objetos, direto sobre a seção de vértices.
+        @param sections: Seções do arquivo, como retornadas por SceneFile.open.
+        @return: Lista com os metadados de cada objeto. Formato: [nome, tipo, cor, mínimo (x, y, z),
+        máximo (x, y, z), centro (x, y, z)].
+        """
+
+        object_table, vertices, _, names = sections
+        if len(object_table) == 0:
+            return []
+
+        starts = object_table["vertex_offset"].astype(np.intp)
+        counts = object_table["vertex_count"].astype(float)[:, None]
+
+        bounds_min = np.minimum.reduceat(vertices, starts, axis=0)
+        bounds_max = np.maximum.reduceat(vertices, starts, axis=0)
+        centers = np.add.reduceat(vertices, starts, axis=0) / counts
+
+        return [
+            [
+                cls._get_object_name(record, names),
+                cls.OBJECT_TYPES[record["type"]],
+                tuple(int(channel) for channel in record["color"]),
+                obj_min,
+                obj_max,
+                obj_center,
+            ]
+            for record, obj_min, obj_max, obj_center in zip(
+                object_table, bounds_min, bounds_max, centers
+            )
+        ]
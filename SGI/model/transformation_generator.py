@@ -1,5 +1,10 @@
+from functools import lru_cache
+
 import numpy as np
 
+# Quantidade de matrizes de rotação em torno de eixos arbitrários mantidas em cache
+ROTATION_CACHE_SIZE = 256
+
 
 class TransformationGenerator:
     """
@@ -145,73 +150,131 @@ class TransformationGenerator:
         p2: tuple[float, float, float],
     ) -> np.ndarray:
         """
-        Obtém a matriz de rotação em torno de um eixo arbitrário que passa pela origem e pelo ponto (x, y, z).
+        Obtém a matriz de rotação em torno de um eixo arbitrário que passa pelos pontos p1 e p2.
+        As matrizes são guardadas em cache, indexadas pelo ângulo e pelo eixo: rotações repetidas
+        (mesmo eixo e mesmo incremento de ângulo) não recalculam a matriz.
         @param angle_degrees: Ângulo de rotação em graus.
         @param p1: Ponto 1 (x, y, z) que define o eixo de rotação.
         @param p2: Ponto 2 (x, y, z) que define o eixo de rotação. Forma uma reta com p1.
         @return: Matriz de rotação em torno do eixo arbitrário.
         """
 
-        x1 = p1[0]
-        y1 = p1[1]
-        z1 = p1[2]
+        return TransformationGenerator._get_cached_arbitrary_rotation_matrix(
+            float(angle_degrees),
+            (float(p1[0]), float(p1[1]), float(p1[2])),
+            (float(p2[0]), float(p2[1]), float(p2[2])),
+        ).copy()
 
-        x2 = p2[0]
-        y2 = p2[1]
-        z2 = p2[2]
+    @staticmethod
+    @lru_cache(maxsize=ROTATION_CACHE_SIZE)
+    def _get_cached_arbitrary_rotation_matrix(
+        angle_degrees: float,
+        p1: tuple[float, float, float],
+        p2: tuple[float, float, float],
+    ) -> np.ndarray:
+        """
+        Constrói a matriz de rotação em torno de um eixo arbitrário pela fórmula de Rodrigues:
+        R = cos(θ) I + sen(θ) [u]x + (1 - cos(θ)) u uᵀ, onde u é o vetor unitário do eixo. Como
+        o sistema usa vetores linha, a parte linear da matriz é Rᵀ, e a translação leva em conta
+        que o eixo passa por p1. Equivale a transladar p1 para a origem, alinhar o eixo com y,
+        rotacionar em torno de y e desfazer o alinhamento e a translação.
+        """
 
-        # Passo 1. Translação do sistema objeto/eixo de forma que um ponto do eixo fique sobre a origem
-        translate_to_origin = TransformationGenerator.get_translation_matrix(
-            dx=-x1, dy=-y1, dz=-z1
-        )
+        axis = np.array(p2) - np.array(p1)
+        axis_length = np.linalg.norm(axis)
 
-        # Passo 2. Rotação Rx em torno do eixo x por θx de forma a trazer o eixo sobre o plano xy
-        # Calcula o ângulo entre o eixo arbitrário projetado no plano xz e o plano xy
-        theta_x = np.arctan2(z2 - z1, y2 - y1)
+        # Um eixo degenerado (p1 == p2) é tratado como paralelo a y
+        ux, uy, uz = axis / axis_length if axis_length > 0 else (0.0, 1.0, 0.0)
 
-        rotate_x = TransformationGenerator.get_x_axis_rotation_matrix(
-            -np.degrees(theta_x)
-        )
+        angle_radians = np.radians(angle_degrees)
+        cos_r = np.cos(angle_radians)
+        sin_r = np.sin(angle_radians)
+        one_minus_cos = 1 - cos_r
 
-        # Passo 3. Rotação Rz em torno do eixo z por θz de forma a alinhar o eixo com o eixo y
-        # Calcula o ângulo entre a projeção do eixo no plano xy e o eixo y
-        axis_vector = np.array([x2 - x1, y2 - y1, z2 - z1, 0])
-        axis_after_rx = axis_vector @ rotate_x
-        theta_z = np.arctan2(axis_after_rx[0], axis_after_rx[1])
-        rotate_z = TransformationGenerator.get_z_axis_rotation_matrix(
-            np.degrees(theta_z)
+        rotation = np.array(
+            [
+                [
+                    cos_r + ux * ux * one_minus_cos,
+                    ux * uy * one_minus_cos + uz * sin_r,
+                    ux * uz * one_minus_cos - uy * sin_r,
+                ],
+                [
+                    uy * ux * one_minus_cos - uz * sin_r,
+                    cos_r + uy * uy * one_minus_cos,
+                    uy * uz * one_minus_cos + ux * sin_r,
+                ],
+                [
+                    uz * ux * one_minus_cos + uy * sin_r,
+                    uz * uy * one_minus_cos - ux * sin_r,
+                    cos_r + uz * uz * one_minus_cos,
+                ],
+            ]
         )
 
-        # Passo 4. Rotação Ry em torno do eixo y pelo ângulo dado pelo usuário
-        rotate_y = TransformationGenerator.get_y_axis_rotation_matrix(angle_degrees)
+        transformation = np.identity(4)
+        transformation[:3, :3] = rotation
+        transformation[3, :3] = np.array(p1) - np.array(p1) @ rotation
 
-        # Passo 5. Desfaz a rotação do passo 3
-        revert_z_rotation = TransformationGenerator.get_z_axis_rotation_matrix(
-            -np.degrees(theta_z)
-        )
+        return transformation
 
-        # Passo 6. Desfaz a rotação do passo 2
-        revert_x_rotation = TransformationGenerator.get_x_axis_rotation_matrix(
-            np.degrees(theta_x)
-        )
+    @staticmethod
+    def get_axis_angle_quaternion(
+        axis: tuple[float, float, float], angle_degrees: float
+    ) -> np.ndarray:
+        """
+        Obtém o quatérnio unitário de uma rotação em torno de um eixo que passa pela origem.
+        @param axis: Vetor (x, y, z) do eixo de rotação. Não precisa ser unitário.
+        @param angle_degrees: Ângulo de rotação em graus.
+        @return: Quatérnio (w, x, y, z).
+        """
 
-        # Passo 7. Translação de volta para a posição original
-        translate_back = TransformationGenerator.get_translation_matrix(
-            dx=x1, dy=y1, dz=z1
+        ux, uy, uz = np.asarray(axis, dtype=float) / np.linalg.norm(axis)
+        half_angle = np.radians(angle_degrees) / 2
+        sin_half = np.sin(half_angle)
+
+        return np.array(
+            [np.cos(half_angle), ux * sin_half, uy * sin_half, uz * sin_half]
         )
 
-        # Composição das transformações
-        transformation = (
-            translate_to_origin
-            @ rotate_x
-            @ rotate_z
-            @ rotate_y
-            @ revert_z_rotation
-            @ revert_x_rotation
-            @ translate_back
+    @staticmethod
+    def multiply_quaternions(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
+        """
+        Obtém o produto de Hamilton q1 q2, que representa a rotação q2 seguida da rotação q1.
+        @param q1: Quatérnio (w, x, y, z).
+        @param q2: Quatérnio (w, x, y, z).
+        @return: Quatérnio (w, x, y, z) resultante.
+        """
+
+        w1, x1, y1, z1 = q1
+        w2, x2, y2, z2 = q2
+
+        return np.array(
+            [
+                w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+            ]
         )
 
-        return transformation
+    @staticmethod
+    def get_quaternion_rotation_matrix(quaternion: np.ndarray) -> np.ndarray:
+        """
+        Obtém a matriz de rotação 3x3 de um quatérnio unitário, já transposta para ser aplicada
+        a vetores linha (ponto @ matriz), como no resto do sistema.
+        @param quaternion: Quatérnio unitário (w, x, y, z).
+        @return: Matriz de rotação 3x3.
+        """
+
+        w, x, y, z = quaternion
+
+        return np.array(
+            [
+                [1 - 2 * (y * y + z * z), 2 * (x * y + w * z), 2 * (x * z - w * y)],
+                [2 * (x * y - w * z), 1 - 2 * (x * x + z * z), 2 * (y * z + w * x)],
+                [2 * (x * z + w * y), 2 * (y * z - w * x), 1 - 2 * (x * x + y * y)],
+            ]
+        )
 
     @staticmethod
     def get_pan_matrix(
@@ -0,0 +1,131 @@
+import json
+from functools import lru_cache
+
+import numpy as np
+from model.transformation_generator import TransformationGenerator
+
+# Quantidade de listas de transformações compiladas mantidas em cache
+PIPELINE_CACHE_SIZE = 128
+
+
+class TransformationPipeline:
+    """
+    Lista de transformações (no formato produzido pelo TransformationDialog) compilada uma única
+    vez. A matriz composta só depende do centro do objeto pela translação, e de forma afim:
+    M(c) tem a mesma parte linear para qualquer centro c, e sua última linha é
+    base[3] + c @ center_matrix. Assim, aplicar a lista a um objeto custa apenas uma
+    multiplicação, sem reinterpretar os dicionários nem recalcular o centro passo a passo.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self, steps: list[dict], base_matrix: np.ndarray, center_matrix: np.ndarray
+    ):
+        """
+        @param steps: Lista original de transformações.
+        @param base_matrix: Matriz composta para um objeto centrado na origem.
+        @param center_matrix: Matriz 3x4 que leva o centro do objeto ao acréscimo na translação.
+        """
+
+        self.steps = steps
+        self.base_matrix = base_matrix
+        self.center_matrix = center_matrix
+
+    @classmethod
+    def compile(
+        cls, transformations_list: list[dict]
+    ) -> "TransformationPipeline | None":
+        """
+        Compila uma lista de transformações. Listas iguais reaproveitam a mesma compilação.
+        @param transformations_list: Lista de dicionários, cada um representando uma transformação.
+        @return: Transformação compilada, ou None se a lista estiver vazia.
+        @raises ValueError: Se alguma transformação for inválida.
+        """
+
+        if not transformations_list:
+            return None
+
+        steps_key = tuple(
+            tuple(sorted(transformation.items()))
+            for transformation in transformations_list
+        )
+        return cls._compile_steps(steps_key)
+
+    @classmethod
+    @lru_cache(maxsize=PIPELINE_CACHE_SIZE)
+    def _compile_steps(cls, steps_key: tuple) -> "TransformationPipeline":
+        """
+        Compila a lista de transformações, representada como tupla para poder ser usada como
+        chave do cache. A matriz composta é montada para o centro na origem e para os três
+        vetores unitários, o que basta para determinar M(c) para qualquer centro.
+        """
+
+        steps = [dict(step) for step in steps_key]
+
+        base_matrix, *unit_matrices = (
+            TransformationGenerator.get_composite_transformation_matrix(
+                transformations_list=steps, obj_center=obj_center
+            )
+            for obj_center in ((0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1))
+        )
+        center_matrix = np.array(
+            [unit_matrix[3] - base_matrix[3] for unit_matrix in unit_matrices]
+        )
+
+        return cls(steps, base_matrix, center_matrix)
+
+    def get_matrix(self, obj_center: tuple[float, float, float]) -> np.ndarray:
+        """
+        Retorna a matriz composta para um objeto com o centro dado.
+        @param obj_center: Centro do objeto. Usado no escalonamento.
+        @return: Matriz de transformação composta.
+        """
+        return self.get_matrices([obj_center])[0]
+
+    def get_matrices(self, obj_centers: list[tuple[float, float, float]]) -> np.ndarray:
+        """
+        Retorna, de uma vez, as matrizes compostas para vários centros.
+        @param obj_centers: Centros dos objetos.
+        @return: Array (K, 4, 4) com a matriz de cada objeto.
+        """
+
+        matrices = np.repeat(self.base_matrix[None], len(obj_centers), axis=0)
+        matrices[:, 3, :] += np.asarray(obj_centers, dtype=float) @ self.center_matrix
+        return matrices
+
+    def to_json(self) -> str:
+        """
+        Serializa a transformação compilada.
+        @return: Texto JSON com a lista original e as matrizes compiladas.
+        """
+
+        return json.dumps(
+            {
+                "version": self.VERSION,
+                "steps": self.steps,
+                "base_matrix": self.base_matrix.tolist(),
+                "center_matrix": self.center_matrix.tolist(),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "TransformationPipeline":
+        """
+        Carrega uma transformação compilada serializada com to_json, sem recompilá-la.
+        @param text: Texto JSON.
+        @return: Transformação compilada.
+        @raises ValueError: Se o texto não estiver no formato esperado.
+        """
+
+        data = json.loads(text)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(
+                f"Versão de transformação compilada não suportada: {data.get('version')}"
+            )
+
+        return cls(
+            data["steps"],
+            np.array(data["base_matrix"], dtype=float),
+            np.array(data["center_matrix"], dtype=float),
+        )
@@ -32,13 +32,29 @@ class Window:
         self.focus_point = np.array([0.0, 0.0, 10.0, 1.0])
         self.center_of_projection = np.array([0.0, 0.0, -10.0, 1.0])
 
-        # Matriz que converte as coordenadas percebidas pelo usuário pelas coordenadas
-        # reais do mundo
-        self.conversion_mtx: np.array = np.eye(4)
+        # Estado da câmera, a partir do qual a matriz de conversão (que converte as coordenadas
+        # percebidas pelo usuário nas coordenadas reais do mundo) é reconstruída sob demanda:
+        # orientação como quatérnio unitário (w, x, y, z) e deslocamento acumulado
+        self.camera_orientation = np.array([1.0, 0.0, 0.0, 0.0])
+        self.camera_position = np.zeros(3)
+        self.cached_conversion_mtx: np.ndarray | None = None
+
+        # Se verdadeiro, a matriz de conversão não é aplicada aos pontos dos assinantes: ela é
+        # combinada à matriz de projeção (ver DisplayFileManager.update_projections), e um pan
+        # ou rotação só altera o estado da câmera
+        self.fold_conversion = True
 
         # Observadores que assinam a janela de visualização para receber atualizações
         # quando a percepção do usuário muda (janela de visualização é movida)
-        self.subscribers = []
+        # Os assinantes são indexados pelo identificador do objeto no display file
+        self.subscribers: dict[int, WorldObject] = {}
+
+        # Cache com os pontos percebidos de todos os assinantes concatenados, para que uma
+        # mudança de percepção converta a cena inteira com uma única multiplicação. É
+        # reconstruído quando algum assinante troca sua lista de pontos percebidos
+        self.perceived_buffer = np.empty((0, 4))
+        self.perceived_buffer_sources: list[list] = []
+        self.perceived_buffer_offsets = np.empty(0, dtype=int)
 
         self.height = 20  # Valor default
         self.width = self.height * aspect_ratio
@@ -68,12 +84,12 @@ class Window:
         @param d_depth: Deslocamento em profundidade
         """
 
-        translation_mtx = TransformationGenerator.get_translation_matrix(
-            dx=d_horizontal,  # Positivo é para a esquerda
-            dy=-d_vertical,
-            dz=-d_depth,
+        self.camera_position += (
+            d_horizontal,  # Positivo é para a esquerda
+            -d_vertical,
+            -d_depth,
         )
-        self.conversion_mtx = self.conversion_mtx @ translation_mtx
+        self.cached_conversion_mtx = None
         self.notify_perception_change()
 
     def apply_rotation(self, angle_degrees: float, rotation_type: str) -> None:
@@ -96,24 +112,45 @@ class Window:
         angle_delta = angle_degrees - getattr(self, angle_attr)
         setattr(self, angle_attr, angle_degrees)
 
-        # Gera um eixo que passa pelo foco e é paralelo ao vetor de rotação
-        p1 = self.focus_point[::]
-        p2 = [
-            self.focus_point[0] + axis_vector[0],
-            self.focus_point[1] + axis_vector[1],
-            self.focus_point[2] + axis_vector[2],
-            1.0,
-        ]
+        # Rotação em torno de um eixo que passa pelo foco e é paralelo ao vetor de rotação. A
+        # orientação é composta como quatérnio (renormalizado a cada passo, para não acumular
+        # erro) e o deslocamento é girado em torno do foco
+        rotation_quaternion = TransformationGenerator.get_axis_angle_quaternion(
+            axis_vector[:3], angle_delta
+        )
+        orientation = TransformationGenerator.multiply_quaternions(
+            rotation_quaternion, self.camera_orientation
+        )
+        self.camera_orientation = orientation / np.linalg.norm(orientation)
 
-        rotation_matrix = TransformationGenerator.get_arbitrary_rotation_matrix(
-            angle_degrees=angle_delta,
-            p1=p1,
-            p2=p2,
+        focus = self.focus_point[:3]
+        rotation_mtx = TransformationGenerator.get_quaternion_rotation_matrix(
+            rotation_quaternion
         )
+        self.camera_position = (self.camera_position - focus) @ rotation_mtx + focus
 
-        self.conversion_mtx = self.conversion_mtx @ rotation_matrix
+        self.cached_conversion_mtx = None
         self.notify_perception_change()
 
+    @property
+    def conversion_mtx(self) -> np.ndarray:
+        """
+        Matriz que converte as coordenadas percebidas pelo usuário nas coordenadas reais do
+        mundo, reconstruída a partir do estado da câmera quando ele muda.
+        """
+
+        if self.cached_conversion_mtx is None:
+            conversion_mtx = np.identity(4)
+            conversion_mtx[:3, :3] = (
+                TransformationGenerator.get_quaternion_rotation_matrix(
+                    self.camera_orientation
+                )
+            )
+            conversion_mtx[3, :3] = self.camera_position
+            self.cached_conversion_mtx = conversion_mtx
+
+        return self.cached_conversion_mtx
+
     def change_cop_distance(self, distance: float) -> None:
         """
         Altera a distância do centro de projeção (COP) em relação ao plano de projeção.
@@ -129,6 +166,18 @@ class Window:
             ]
         )
 
+    def set_fold_conversion(self, fold_conversion: bool) -> None:
+        """
+        Alterna entre aplicar a matriz de conversão às coordenadas do mundo dos assinantes ou
+        combiná-la à matriz de projeção.
+        @param fold_conversion: Se a conversão deve ser combinada à projeção.
+        """
+
+        self.fold_conversion = fold_conversion
+        if not fold_conversion:
+            # As coordenadas do mundo ficaram desatualizadas enquanto a conversão era combinada
+            self.notify_perception_change()
+
     def get_width(self) -> float:
         """Retorna a largura da janela de visualização."""
         return self.width
@@ -141,21 +190,77 @@ class Window:
         """
         Adiciona um assinante à janela de visualização.
         @param subscriber: O objeto que deseja se inscrever para receber atualizações de
-        mudanças na percepção do usuário.
+        mudanças na percepção do usuário. Deve já estar no display file (com object_id).
+        """
+        self.subscribers[subscriber.object_id] = subscriber
+        if not self.fold_conversion:
+            subscriber.update_world_coordinates(self.conversion_mtx)
+
+    def replace_subscriber(self, subscriber: WorldObject) -> None:
+        """
+        Substitui o assinante de mesmo identificador por outro que já está com as coordenadas
+        do mundo atualizadas (por exemplo, um objeto importado sob demanda que acabou de ser
+        carregado).
+        @param subscriber: Novo assinante.
         """
-        self.subscribers.append(subscriber)
-        subscriber.update_world_coordinates(self.conversion_mtx)
+        self.subscribers[subscriber.object_id] = subscriber
 
-    def remove_subscriber(self, index: int) -> None:
+    def remove_subscriber(self, object_id: int) -> None:
         """
         Remove um assinante da janela de visualização.
-        @param index: Índice do assinante a ser removido.
+        @param object_id: Identificador do assinante a ser removido.
         """
-        self.subscribers.pop(index)
+        del self.subscribers[object_id]
+
+    def remove_subscribers(self, object_ids: list[int]) -> None:
+        """
+        Remove vários assinantes da janela de visualização.
+        @param object_ids: Identificadores dos assinantes a serem removidos.
+        """
+        for object_id in object_ids:
+            del self.subscribers[object_id]
+
+    def _update_perceived_buffer(self) -> None:
+        """
+        Reconstrói o buffer de pontos percebidos se algum assinante foi adicionado, removido ou
+        transformado desde a última mudança de percepção. A verificação compara apenas a
+        identidade das listas de pontos, sem percorrer os pontos.
+        """
+
+        sources = [
+            subscriber.perceived_points for subscriber in self.subscribers.values()
+        ]
+        if len(sources) == len(self.perceived_buffer_sources) and all(
+            source is cached
+            for source, cached in zip(sources, self.perceived_buffer_sources)
+        ):
+            return
+
+        point_counts = [len(source) for source in sources]
+        self.perceived_buffer_offsets = np.cumsum(point_counts)[:-1]
+        self.perceived_buffer_sources = sources
+
+        self.perceived_buffer = np.concatenate(
+            [np.empty((0, 4), dtype=WorldObject.points_dtype), *sources]
+        )
 
     def notify_perception_change(self) -> None:
         """
-        Notifica todos os assinantes sobre uma mudança na percepção do usuário (pan ou rotação)
+        Notifica todos os assinantes sobre uma mudança na percepção do usuário (pan ou rotação).
+        Os pontos de todos os assinantes são convertidos juntos, numa única multiplicação, e cada
+        assinante recebe a sua fatia do resultado.
         """
-        for subscriber in self.subscribers:
-            subscriber.update_world_coordinates(self.conversion_mtx)
+
+        if self.fold_conversion or not self.subscribers:
+            return
+
+        self._update_perceived_buffer()
+        world_buffer = WorldObject.transform_points(
+            self.perceived_buffer, self.conversion_mtx
+        )
+
+        for subscriber, world_points in zip(
+            self.subscribers.values(),
+            np.split(world_buffer, self.perceived_buffer_offsets),
+        ):
+            subscriber.update_world_coordinates(self.conversion_mtx, world_points)
@@ -0,0 +1,127 @@
+from typing import Callable, TextIO
+
+import numpy as np
+from model.world_objects.world_object import WorldObject
+from view.viewport.viewport_bounds import ViewportBounds
+
+
+class LazyWorldObject(WorldObject):
+    """
+    Representante de um objeto de um arquivo de cena que ainda não foi carregado. Guarda apenas
+    a caixa envolvente (como os 8 cantos, que acompanham as mudanças da window e as
+    transformações) e o centro geométrico. A geometria só é lida do arquivo, via loader, quando
+    a caixa entra no volume de visualização (ver DisplayFileManager.update_projections).
+    """
+
+    __slots__ = (
+        "object_type",
+        "center",
+        "loader",
+        "pending_transformation",
+        "conversion_mtx",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        color: tuple[int, int, int],
+        viewport_bounds: ViewportBounds,
+        object_type: type,
+        bounds_min: tuple[float, float, float],
+        bounds_max: tuple[float, float, float],
+        center: tuple[float, float, float],
+        loader: Callable[[], WorldObject],
+    ):
+        x_min, y_min, z_min = bounds_min
+        x_max, y_max, z_max = bounds_max
+        corners = [
+            (x, y, z)
+            for x in (x_min, x_max)
+            for y in (y_min, y_max)
+            for z in (z_min, z_max)
+        ]
+        super().__init__(corners, name, color, viewport_bounds)
+
+        self.object_type = object_type  # Classe do objeto real
+        self.center = np.array([center[0], center[1], center[2], 1.0])
+        self.loader = loader
+
+        # Transformações aplicadas antes do carregamento e a última matriz de conversão da
+        # window, repassadas ao objeto real quando ele for carregado
+        self.pending_transformation: np.ndarray | None = None
+        self.conversion_mtx = np.eye(4)
+
+    def update_perceived_coordinates(self, composite_matrix: np.ndarray) -> None:
+        """
+        Transforma a caixa envolvente e o centro, acumulando a transformação para o objeto real.
+        @param composite_matrix: Matriz de transformação composta.
+        """
+
+        super().update_perceived_coordinates(composite_matrix)
+        self.center = self.center @ composite_matrix
+
+        if self.pending_transformation is None:
+            self.pending_transformation = composite_matrix
+        else:
+            self.pending_transformation = self.pending_transformation @ composite_matrix
+
+    def update_world_coordinates(
+        self, conversion_mtx: np.ndarray, world_points: np.ndarray | None = None
+    ) -> None:
+        """
+        Atualiza as coordenadas do mundo da caixa envolvente e guarda a matriz de conversão.
+        @param conversion_mtx: Matriz de conversão para coordenadas do mundo.
+        @param world_points: Cantos já convertidos (ver WorldObject).
+        """
+
+        super().update_world_coordinates(conversion_mtx, world_points)
+        self.conversion_mtx = conversion_mtx
+
+    def is_visible(
+        self, projection_mtx: np.ndarray, conversion_mtx: np.ndarray | None = None
+    ) -> bool:
+        """
+        Verifica, de forma conservadora, se a caixa pode aparecer na window. Usa os próprios
+        cantos (que sempre acompanham a window), mais justos que a caixa alinhada aos eixos.
+        @param projection_mtx: Matriz de projeção atual.
+        @param conversion_mtx: Não utilizado (ver WorldObject.is_visible).
+        @return: False apenas se a caixa estiver com certeza fora do volume de visualização.
+        """
+
+        return self.is_projected_box_visible(self.world_points @ projection_mtx)
+
+    def load(self) -> WorldObject:
+        """
+        Lê o objeto real do arquivo e aplica a ele as transformações e a conversão recebidas
+        até agora.
+        @return: Objeto real, pronto para ser projetado.
+        """
+
+        world_object = self.loader()
+
+        if self.pending_transformation is not None:
+            world_object.update_perceived_coordinates(self.pending_transformation)
+        world_object.update_world_coordinates(self.conversion_mtx)
+
+        return world_object
+
+    def get_clipped_representation(self) -> list:
+        """Objetos não carregados não possuem representação gráfica."""
+        return []
+
+    def get_center(self) -> tuple[float, float, float]:
+        """
+        Retorna o centro geométrico do objeto real, calculado na importação.
+        @return: Coordenadas (x, y, z) do centro geométrico.
+        """
+        return self.center[0], self.center[1], self.center[2]
+
+    def write_obj_description(self, stream: TextIO, last_index: int) -> int:
+        """
+        Carrega temporariamente o objeto real para escrever sua descrição em formato .obj.
+        """
+        return self.load().write_obj_description(stream, last_index)
+
+    def __str__(self):
+        type_name = self.object_type.__name__.replace("World", "")
+        return f"{type_name} {self.name}: (not loaded)"
@@ -10,6 +10,21 @@ class SCWorldObject(WorldObject, ABC):
     Classe para objetos cujo algoritmo de clipping pode ser alterado.
     """
 
+    # Algoritmos de cada modo de clipping: o que recorta um segmento e o que recorta vários
+    # segmentos de uma vez (ver WorldWireframe). Tabela única, compartilhada pelos objetos
+    clipping_modes = {
+        "cohen_sutherland": (
+            ClippingAlgorithms.cohen_sutherland_clipping,
+            ClippingAlgorithms.cohen_sutherland_batch_clipping,
+        ),
+        "liang_barsky": (
+            ClippingAlgorithms.liang_barsky_clipping,
+            ClippingAlgorithms.liang_barsky_batch_clipping,
+        ),
+    }
+
+    __slots__ = ("clipping_mode", "batch_clipping_mode")
+
     def __init__(
         self,
         points: list,
@@ -18,21 +33,19 @@ class SCWorldObject(WorldObject, ABC):
         viewport_bounds: object,
     ) -> None:
         super().__init__(points, name, color, viewport_bounds)
-
-        self.clipping_modes = {
-            "cohen_sutherland": ClippingAlgorithms.cohen_sutherland_clipping,
-            "liang_barsky": ClippingAlgorithms.liang_barsky_clipping,
-        }
-        self.clipping_mode = ClippingAlgorithms.cohen_sutherland_clipping
+        self.clipping_mode, self.batch_clipping_mode = self.clipping_modes[
+            "cohen_sutherland"
+        ]
 
     def change_clipping_mode(self, mode: str) -> None:
         """
-        Muda o modo de clipping. O atributo self.clipping_modes é um dicionário que mapeia
-        nomes de modos de clipping para funções de clipping, e self.clipping_mode é a função de clipping atual.
+        Muda o modo de clipping. O atributo de classe clipping_modes mapeia nomes de modos de
+        clipping para as funções de clipping, e self.clipping_mode e self.batch_clipping_mode
+        são as funções atuais.
         @param mode: Modo de clipping.
         """
 
         try:
-            self.clipping_mode = self.clipping_modes[mode]
+            self.clipping_mode, self.batch_clipping_mode = self.clipping_modes[mode]
         except KeyError as e:
             raise ValueError(f"Modo de clipping inválido: {mode}") from e
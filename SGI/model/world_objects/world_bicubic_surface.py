@@ -1,11 +1,29 @@
 import numpy as np
-from model.world_objects.sc_world_object import SCWorldObject
-from view.graphical_objects.graphical_line import GraphicalLine
+from model.world_objects.world_surface import WorldSurface
 
 
-class WorldBicubicSurface(SCWorldObject):
+class WorldBicubicSurface(WorldSurface):
     """Classe referente a superfícies bicúbicas B-Spline no mundo."""
 
+    __slots__ = (
+        "control_points_matrix_nxm",
+        "Gx",
+        "Gy",
+        "Gz",
+        "projection_points_matrix",
+    )
+
+    obj_vertex_format = "%.4f"
+
+    num_steps_s = 10
+    num_steps_t = 10
+
+    # Matriz de base B-Spline e sua transposta, comuns a todas as instâncias
+    M_bspline = (1 / 6) * np.array(
+        [[-1, 3, -3, 1], [3, -6, 3, 0], [-3, 0, 3, 0], [1, 4, 1, 0]], dtype=float
+    )
+    M_bspline_T = M_bspline.T
+
     def __init__(
         self,
         points: list[list[list[float]]],  # Matriz NxMx3 de pontos de controle
@@ -44,21 +62,10 @@ class WorldBicubicSurface(SCWorldObject):
 
         self.obj_type = "bicubic_surface"
 
-        self.num_steps_s = 10
-        self.num_steps_t = 10
-
-        self.M_bspline = (1 / 6) * np.array(
-            [[-1, 3, -3, 1], [3, -6, 3, 0], [-3, 0, 3, 0], [1, 4, 1, 0]], dtype=float
-        )
-        self.M_bspline_T = self.M_bspline.T
-
         self.Gx = np.zeros((4, 4), dtype=float)
         self.Gy = np.zeros((4, 4), dtype=float)
         self.Gz = np.zeros((4, 4), dtype=float)
 
-        self.normalized_surface_patches_grids: list[
-            list[list[tuple[float, float] | None]]
-        ] = []
         self.projection_points_matrix: np.ndarray | None = None
 
     def _populate_patch_geometry_matrices(self, control_patch_4x4: np.ndarray) -> None:
@@ -172,63 +179,47 @@ class WorldBicubicSurface(SCWorldObject):
 
         return patch_grid_3d
 
-    def _generate_project_and_transform_grid(self) -> None:
+    def _get_projected_surface_grid(self) -> np.ndarray | None:
         """
-        Gera a grade de pontos 3D da superfície completa (todos os retalhos),
-        projeta-os para coordenadas normalizadas (NDC) e armazena os resultados
-        em self.normalized_surface_patches_grids.
+        Gera a grade de pontos 3D da superfície completa e a projeta (ver WorldSurface). Os
+        retalhos vizinhos compartilham a curva da borda, então suas grades são montadas numa
+        única grade contínua, e as polilinhas atravessam a superfície inteira.
+        @return: Array (S, T, 4) com os pontos projetados, ou None sem matriz de projeção.
         """
-        if self.projection_points_matrix is None:
-            self.normalized_surface_patches_grids = []
-            return
 
-        self.normalized_surface_patches_grids = []
-        num_patches_s = self.control_points_matrix_nxm.shape[0] - 3
-        num_patches_t = self.control_points_matrix_nxm.shape[1] - 3
+        num_rows, num_columns = self.control_points_matrix_nxm.shape[:2]
+        if (
+            self.projection_points_matrix is None
+            or len(self.world_points) != num_rows * num_columns
+        ):
+            return None
 
-        if num_patches_s < 1 or num_patches_t < 1:
-            return
+        num_patches_s = num_rows - 3
+        num_patches_t = num_columns - 3
+        control_points = self.world_points[:, :3].reshape(num_rows, num_columns, 3)
 
+        surface_grid = np.ones(
+            (
+                num_patches_s * self.num_steps_s + 1,
+                num_patches_t * self.num_steps_t + 1,
+                4,
+            )
+        )
         for patch_i in range(num_patches_s):
             for patch_j in range(num_patches_t):
-                world_control_points_4x4_patch = np.zeros((4, 4, 3))
-                for r_idx in range(4):
-                    for c_idx in range(4):
-                        flat_idx = (
-                            patch_i + r_idx
-                        ) * self.control_points_matrix_nxm.shape[1] + (patch_j + c_idx)
-                        if flat_idx >= len(self.world_points):
-                            return
-                        world_control_points_4x4_patch[r_idx, c_idx, :] = (
-                            self.world_points[flat_idx][:3]
-                        )
-
                 patch_world_grid = self._calculate_patch_points_3d_fwd_diff(
-                    world_control_points_4x4_patch
+                    control_points[patch_i : patch_i + 4, patch_j : patch_j + 4]
                 )
 
-                normalized_patch_grid: list[list[tuple[float, float] | None]] = []
-                for s_row in patch_world_grid:
-                    normalized_s_row: list[tuple[float, float] | None] = []
-                    for xw, yw, zw in s_row:
-                        point_wc_h = np.array([xw, yw, zw, 1.0])
-                        projected_h = point_wc_h @ self.projection_points_matrix
-
-                        w_clip = projected_h[3]
-                        if abs(w_clip) < 1e-9:
-                            normalized_s_row.append(None)
-                            continue
-
-                        xn = projected_h[0] / w_clip
-                        yn = projected_h[1] / w_clip
-
-                        is_perspective = self.projection_points_matrix[3, 2] != 0
-                        if is_perspective and w_clip < 0:
-                            normalized_s_row.append(None)
-                        else:
-                            normalized_s_row.append((xn, yn))
-                    normalized_patch_grid.append(normalized_s_row)
-                self.normalized_surface_patches_grids.append(normalized_patch_grid)
+                row = patch_i * self.num_steps_s
+                column = patch_j * self.num_steps_t
+                surface_grid[
+                    row : row + self.num_steps_s + 1,
+                    column : column + self.num_steps_t + 1,
+                    :3,
+                ] = patch_world_grid
+
+        return surface_grid @ self.projection_points_matrix
 
     def update_projection_points(self, projection_matrix: np.ndarray) -> None:
         """
@@ -241,110 +232,37 @@ class WorldBicubicSurface(SCWorldObject):
         self.projection_points_matrix = projection_matrix
         self.dirty = True
 
-    def get_clipped_representation(self) -> list[GraphicalLine]:
-        """
-        Gera a representação gráfica da superfície bicúbica após aplicar a projeção,
-        o recorte (clipping) e a transformação para coordenadas de viewport.
-
-        @return: Uma lista de objetos GraphicalLine representando os segmentos
-                 visíveis da superfície na viewport. Retorna uma lista vazia se
-                 não houver grades de patches normalizados ou se nenhum segmento
-                 for visível após o recorte.
-        """
-        self._generate_project_and_transform_grid()
-
-        clipped_graphical_lines: list[GraphicalLine] = []
-
-        if not self.normalized_surface_patches_grids:
-            return []
-
-        for normalized_patch_grid in self.normalized_surface_patches_grids:
-            num_rows_in_patch = len(normalized_patch_grid)
-            num_cols_in_patch = (
-                len(normalized_patch_grid[0]) if num_rows_in_patch > 0 else 0
-            )
-
-            for t_idx in range(num_cols_in_patch):
-                for s_idx in range(num_rows_in_patch - 1):
-                    p1_ndc = normalized_patch_grid[s_idx][t_idx]
-                    p2_ndc = normalized_patch_grid[s_idx + 1][t_idx]
-
-                    if p1_ndc and p2_ndc:
-                        clipped_segment = self.clipping_mode(p1_ndc, p2_ndc)
-                        if clipped_segment:
-                            vp_points = self.transform_projection_points_to_viewport(
-                                clipped_segment
-                            )
-                            clipped_graphical_lines.append(
-                                GraphicalLine(vp_points, self.color)
-                            )
-
-            for s_idx in range(num_rows_in_patch):
-                for t_idx in range(num_cols_in_patch - 1):
-                    p1_ndc = normalized_patch_grid[s_idx][t_idx]
-                    p2_ndc = normalized_patch_grid[s_idx][t_idx + 1]
-
-                    if p1_ndc and p2_ndc:
-                        clipped_segment = self.clipping_mode(p1_ndc, p2_ndc)
-                        if clipped_segment:
-                            vp_points = self.transform_projection_points_to_viewport(
-                                clipped_segment
-                            )
-                            clipped_graphical_lines.append(
-                                GraphicalLine(vp_points, self.color)
-                            )
-
-        return clipped_graphical_lines
-
     def get_center(self) -> tuple[float, float, float]:
         """
         Calcula o centro geométrico da superfície bicúbica com base em seus pontos de controle.
 
         O centro é determinado pela média das coordenadas x, y e z de todos os
-        pontos de controle percebidos (perceived_points) da superfície.
+        pontos de controle percebidos (perceived_points) da superfície, mantida a cada
+        transformação (ver WorldObject.update_bounds).
 
         @return: Uma tupla (x, y, z) representando as coordenadas do centro.
                  Retorna (0.0, 0.0, 0.0) se não houver pontos de controle.
         """
-        if not self.perceived_points:
+        if self.centroid is None:
             return 0.0, 0.0, 0.0
 
-        all_x = [p[0] for p in self.perceived_points]
-        all_y = [p[1] for p in self.perceived_points]
-        all_z = [p[2] for p in self.perceived_points]
-
-        center_x = np.mean(all_x) if all_x else 0.0
-        center_y = np.mean(all_y) if all_y else 0.0
-        center_z = np.mean(all_z) if all_z else 0.0
-        return center_x, center_y, center_z
+        return super().get_center()
 
-    def get_obj_description(self, last_index: int) -> tuple[str, int]:
+    def get_obj_elements(self, first_index: int, num_vertices: int) -> str:
         """
-        Gera uma descrição da superfície bicúbica no formato Wavefront OBJ.
+        Gera a linha de elementos da superfície bicúbica no formato Wavefront OBJ.
 
-        A descrição inclui os vértices (pontos de controle) da superfície e uma
-        linha especificando o tipo de objeto ('bicubic_surface'), suas dimensões N e M,
+        A linha especifica o tipo de objeto ('bicubic_surface'), suas dimensões N e M,
         e os índices dos seus pontos de controle.
 
-        @param last_index: O último índice de vértice utilizado no arquivo OBJ,
-                           para garantir que os novos índices sejam únicos.
-        @return: Uma tupla contendo:
-                 - A string da descrição do objeto no formato OBJ.
-                 - O novo último índice de vértice após adicionar os pontos desta superfície.
+        @param first_index: Índice, no arquivo OBJ, do primeiro ponto de controle.
+        @param num_vertices: Quantidade de pontos de controle escritos.
+        @return: A string com a linha de elementos da superfície.
         """
-        obj_description = f"o {self.name}\n"
-
-        num_total_control_points = len(self.perceived_points)
-
-        for point_h in self.perceived_points:
-            obj_description += f"v {point_h[0]:.4f} {point_h[1]:.4f} {point_h[2]:.4f}\n"
-
         N = self.control_points_matrix_nxm.shape[0]
         M = self.control_points_matrix_nxm.shape[1]
 
         obj_points_indices = " ".join(
-            str(i) for i in range(last_index, last_index + num_total_control_points)
+            map(str, range(first_index, first_index + num_vertices))
         )
-        obj_description += f"{self.obj_type} {N} {M} {obj_points_indices}\n\n"
-
-        return obj_description, last_index + num_total_control_points
+        return f"{self.obj_type} {N} {M} {obj_points_indices}\n\n"
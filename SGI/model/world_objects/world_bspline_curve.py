@@ -7,6 +7,8 @@ class WorldBSplineCurve(WorldCurve):
     Classe pertinente a curvas B-spline no mundo.
     """
 
+    __slots__ = ()
+
     def __init__(self, points, name, color, viewport_bounds):
         super().__init__(points, name, color, viewport_bounds)
         self.obj_type = "bspline"
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
 from model.clipping_algorithms import ClippingAlgorithms
 from model.world_objects.sc_world_object import SCWorldObject
 from view.graphical_objects.graphical_curve import GraphicalCurve
@@ -8,20 +9,18 @@ from view.graphical_objects.graphical_curve import GraphicalCurve
 class WorldCurve(SCWorldObject, ABC):
     """Classe pertinente a curvas no mundo."""
 
+    __slots__ = ("curve_points", "viewport_points")
+
     def __init__(self, points, name, color, viewport_bounds):
         super().__init__(points, name, color, viewport_bounds)
+        self.curve_points: list[tuple[float, float]] = []
+        self.viewport_points: np.ndarray = np.empty((0, 2))
 
-        self.clipping_mode = ClippingAlgorithms.cohen_sutherland_clipping
-        self.clipping_modes = {
-            "cohen_sutherland": ClippingAlgorithms.cohen_sutherland_clipping,
-            "liang_barsky": ClippingAlgorithms.liang_barsky_clipping,
-        }
-
-    def update_projection_points(self, projection_points: list[tuple[float, float]]):
+    def update_projection_points(self, projection_points: np.ndarray):
         """
         Atualiza as coordenadas projetadas dos pontos de controle da curva
         e recalcula os pontos da curva para o viewport.
-        @param projection_points: Lista de pontos de controle projetados em coordenadas normalizadas.
+        @param projection_points: Array (N, 2) de pontos de controle projetados em coordenadas normalizadas.
         """
 
         self.projection_points = projection_points
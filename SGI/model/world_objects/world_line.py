@@ -1,4 +1,7 @@
+import numpy as np
+from model.clipping_algorithms import ClippingAlgorithms
 from model.world_objects.sc_world_object import SCWorldObject
+from model.world_objects.world_object import EMPTY_PROJECTION_POINTS
 from view.graphical_objects.graphical_line import GraphicalLine
 from view.viewport.viewport_bounds import ViewportBounds
 
@@ -6,6 +9,8 @@ from view.viewport.viewport_bounds import ViewportBounds
 class WorldLine(SCWorldObject):
     """Classe pertinente a linhas no mundo."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         points: list,
@@ -16,9 +21,25 @@ class WorldLine(SCWorldObject):
         super().__init__(points, name, color, viewport_bounds)
         self.obj_type = "l"
 
+    def update_near_clipped_projection(self, projected_points: np.ndarray) -> None:
+        """
+        Recorta a linha contra o plano próximo antes da divisão por w.
+        @param projected_points: Array (2, 4) com as extremidades projetadas.
+        """
+
+        starts, ends, _ = ClippingAlgorithms.near_plane_segment_clipping(
+            projected_points[:1], projected_points[1:2]
+        )
+        if not len(starts):
+            self.update_projection_points(EMPTY_PROJECTION_POINTS)
+            return
+
+        self.update_projection_points(
+            self.normalize_projected_points(np.concatenate([starts, ends]))
+        )
+
     def get_clipped_representation(self) -> list:
-        p1 = self.projection_points[0]
-        p2 = self.projection_points[1]
+        p1, p2 = self.projection_points.tolist()
         clipped_points = self.clipping_mode(p1, p2)
 
         if clipped_points is None:
@@ -1,13 +1,55 @@
+import sys
 from abc import ABC, abstractmethod
+from typing import TextIO
 
 import numpy as np
 from view.graphical_objects.graphical_object import GraphicalObject
+from view.graphical_objects.render_batch import RenderBatch
 from view.viewport.viewport_bounds import ViewportBounds
 
+# Quantidade de vértices formatados por vez na exportação .obj
+OBJ_VERTEX_BLOCK_SIZE = 4096
+
+# Seleção dos cantos mínimo (0) e máximo (1) de cada eixo para os 8 cantos de uma caixa
+BOX_CORNER_SELECTORS = np.array(
+    [(i, j, k) for i in (0, 1) for j in (0, 1) for k in (0, 1)], dtype=int
+)
+
+# Pontos projetados de um objeto sem projeção, compartilhados por todos (somente leitura)
+EMPTY_PROJECTION_POINTS = np.empty((0, 2))
+EMPTY_PROJECTION_POINTS.flags.writeable = False
+
 
 class WorldObject(ABC):
     """Classe pertinente a objetos pertencentes ao modelo interno (mundo)."""
 
+    # Atributos de instância, sem __dict__: cenas grandes têm centenas de milhares de objetos.
+    # Subclasses declaram apenas os atributos que acrescentam
+    __slots__ = (
+        "perceived_points",
+        "world_points",
+        "projection_points",
+        "viewport_bounds",
+        "name",
+        "color",
+        "obj_type",
+        "object_id",
+        "geometry_key",
+        "dirty",
+        "bounds",
+        "centroid",
+        "world_box_corners",
+    )
+
+    # Formato de cada coordenada dos vértices no arquivo .obj
+    obj_vertex_format = "%.1f"
+
+    # Tipo dos arrays de pontos (percebidos, do mundo e projetados). Em cenas muito grandes,
+    # float32 usa metade da memória (ver DisplayFileManager.change_points_precision); as
+    # matrizes continuam sendo compostas em float64 e só são convertidas ao serem aplicadas. O
+    # erro resultante no viewport é medido por benchmarks/bench_float32_accuracy.py
+    points_dtype: type = np.float64
+
     def __init__(
         self,
         points: list,
@@ -16,76 +58,283 @@ class WorldObject(ABC):
         viewport_bounds: ViewportBounds,
     ):
 
-        self.perceived_points: list[np.array] = []  # Lista de pontos percebidos
-        self.world_points: list[np.array] = []  # Lista de pontos reais
+        # Pontos percebidos e reais, em coordenadas homogêneas: arrays (N, 4), um ponto por linha
+        self.perceived_points: np.ndarray = np.empty((0, 4))
+        self.world_points: np.ndarray = np.empty((0, 4))
 
-        if points and isinstance(points[0], list) and isinstance(points[0][0], list):
+        if (
+            len(points)
+            and isinstance(points[0], list)
+            and isinstance(points[0][0], list)
+        ):
             pass
-        else:
-            for point in points:  # Converte os pontos para coordenadas homogêneas
-                x, y, z = point
-                self.perceived_points.append(np.array([x, y, z, 1]))
+        elif len(points):
+            # Converte os pontos (x, y, z) para coordenadas homogêneas, em bloco
+            self.perceived_points = np.ones((len(points), 4), dtype=self.points_dtype)
+            self.perceived_points[:, :3] = points
 
-        self.projection_points: list[tuple[float, float]] = (
-            []
-        )  # Lista de pontos projetados no plano da window em coordenadas normalizadas
+        # Array (N, 2) de pontos projetados no plano da window em coordenadas normalizadas
+        self.projection_points: np.ndarray = EMPTY_PROJECTION_POINTS
         self.viewport_bounds: ViewportBounds = viewport_bounds
 
         self.name = name
         self.color = color
+        self.object_id: int | None = (
+            None  # Identificador estável, dado pelo display file
+        )
+        self.geometry_key: tuple | None = None  # Chave no índice de objetos repetidos
         self.dirty = True  # Booleano para indicar se o objeto precisa ser atualizado
 
-    def update_projection_points(
-        self, projection_points: list[tuple[float, float]]
-    ) -> None:
+        # Volumes envolventes, mantidos de forma incremental a cada transformação (ver
+        # update_bounds): caixa alinhada aos eixos, como array (2, 3) com os cantos mínimo e
+        # máximo, e média dos pontos em coordenadas homogêneas
+        self.bounds: np.ndarray | None = None
+        self.centroid: np.ndarray | None = None
+        # Cantos da caixa convertidos pela última matriz de conversão recebida
+        self.world_box_corners: np.ndarray | None = None
+        self._compute_bounds()
+
+    def update_projection_points(self, projection_points: np.ndarray) -> None:
         """
         Atualiza as coordenadas projetadas do objeto.
-        @param projection_points: Lista de pontos projetados em coordenadas normalizadas.
+        @param projection_points: Array (N, 2) de pontos projetados em coordenadas normalizadas.
         """
 
         self.projection_points = projection_points
 
-    def transform_projection_points_to_viewport(
-        self, points: tuple[float, float]
-    ) -> list[tuple[float, float]]:
+    def update_near_clipped_projection(self, projected_points: np.ndarray) -> None:
         """
-        Converte as coordenadas da projeção para as coordenadas do viewport.
-        @param points: Lista de pontos projetados.
-        @return: Lista de pontos transformados para o viewport.
+        Atualiza as coordenadas projetadas de um objeto que cruza o plano próximo (ver
+        ClippingAlgorithms.NEAR_PLANE_W). Por padrão, o objeto não é desenhado; objetos formados
+        por segmentos sobrescrevem este método para recortá-los contra o plano.
+        @param projected_points: Array (N, 4) com os pontos projetados, antes da divisão por w.
         """
 
-        transformed_points = []
-        for point in points:
-            normalized_x, normalized_y = point
+        self.update_projection_points(EMPTY_PROJECTION_POINTS)
 
-            vp_width = (
-                self.viewport_bounds.x_lower_right - self.viewport_bounds.x_upper_left
-            )
-            vp_height = (
-                self.viewport_bounds.y_lower_right - self.viewport_bounds.y_upper_left
-            )
+    @staticmethod
+    def normalize_projected_points(
+        projected_points: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Divide os pontos projetados por w e descarta z e w.
+        @param projected_points: Array (N, 4) com os pontos projetados.
+        @return: Array (N, 2) de pontos (x, y) em coordenadas normalizadas.
+        """
 
-            vx = (normalized_x + 1) / 2 * vp_width + self.viewport_bounds.x_upper_left
-            vy = (1 - normalized_y) / 2 * vp_height + self.viewport_bounds.y_upper_left
-            transformed_points.append((vx, vy))
+        return projected_points[:, :2] / projected_points[:, 3:]
 
-        return transformed_points
+    def transform_projection_points_to_viewport(
+        self, points: np.ndarray | list[tuple[float, float]]
+    ) -> np.ndarray:
+        """
+        Converte as coordenadas da projeção para as coordenadas do viewport, para todos os
+        pontos de uma vez (ver ViewportBounds.get_normalized_to_viewport_transform).
+        @param points: Array (N, 2) ou lista de pontos projetados.
+        @return: Array (N, 2) com os pontos transformados para o viewport.
+        """
+
+        transform = self.viewport_bounds.get_normalized_to_viewport_transform()
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        return points @ transform[:2] + transform[2]
 
     def update_perceived_coordinates(self, composite_matrix: np.ndarray) -> None:
         """
         Atualiza as coordenadas percebidas do objeto aplicando uma matriz de transformação composta.
         @param composite_matrix: Matriz de transformação composta.
         """
-        self.perceived_points = [
-            point @ composite_matrix for point in self.perceived_points
-        ]
+        self.perceived_points = self.apply_homogeneous_transformation(
+            self.perceived_points, composite_matrix
+        )
+        self.update_bounds(composite_matrix)
+
+    def _compute_bounds(self) -> None:
+        """
+        Calcula os volumes envolventes a partir de todos os pontos percebidos.
+        """
+
+        if not len(self.perceived_points):
+            self.bounds = None
+            self.centroid = None
+            return
+
+        coordinates = self.perceived_points[:, :3]
+        self.bounds = np.array([coordinates.min(axis=0), coordinates.max(axis=0)])
+        self.centroid = self.perceived_points.mean(axis=0)
+
+    def update_bounds(self, composite_matrix: np.ndarray) -> None:
+        """
+        Atualiza os volumes envolventes após os pontos percebidos serem transformados pela
+        matriz dada, sem percorrer os pontos: a média é levada pela própria matriz e a nova
+        caixa envolve os 8 cantos transformados (podendo ficar um pouco mais folgada que a
+        caixa exata). Matrizes não afins não preservam a média nem a caixa, então nesse caso os
+        volumes são recalculados.
+        @param composite_matrix: Matriz aplicada aos pontos percebidos.
+        """
+
+        if self.bounds is None or not np.array_equal(
+            composite_matrix[:, 3], (0.0, 0.0, 0.0, 1.0)
+        ):
+            self._compute_bounds()
+            return
+
+        transformed_corners = self.get_bounding_box_corners() @ composite_matrix
+        self.bounds = np.array(
+            [
+                transformed_corners[:, :3].min(axis=0),
+                transformed_corners[:, :3].max(axis=0),
+            ]
+        )
+        self.centroid = self.centroid @ composite_matrix
+
+    def get_bounding_box(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna a caixa envolvente alinhada aos eixos, nas coordenadas percebidas.
+        @return: Cantos mínimo e máximo da caixa, como arrays (x, y, z).
+        """
+        return self.bounds[0], self.bounds[1]
+
+    def get_bounding_box_corners(self) -> np.ndarray:
+        """
+        Retorna os 8 cantos da caixa envolvente, nas coordenadas percebidas.
+        @return: Array (8, 4) com os cantos em coordenadas homogêneas.
+        """
+
+        corners = np.ones((8, 4))
+        corners[:, :3] = self.bounds[BOX_CORNER_SELECTORS, (0, 1, 2)]
+        return corners
+
+    def get_bounding_sphere(self) -> tuple[np.ndarray, float]:
+        """
+        Retorna a esfera envolvente (a que circunscreve a caixa), nas coordenadas percebidas.
+        @return: Centro (x, y, z) e raio da esfera.
+        """
+
+        box_min, box_max = self.get_bounding_box()
+        return (box_min + box_max) / 2, float(np.linalg.norm(box_max - box_min) / 2)
+
+    def get_world_bounding_box(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna a caixa envolvente alinhada aos eixos nas coordenadas do mundo, obtida dos
+        cantos convertidos na última chamada a update_world_coordinates.
+        @return: Cantos mínimo e máximo da caixa, como arrays (x, y, z).
+        """
+
+        world_coordinates = self.world_box_corners[:, :3]
+        return world_coordinates.min(axis=0), world_coordinates.max(axis=0)
+
+    def get_world_bounding_sphere(self) -> tuple[np.ndarray, float]:
+        """
+        Retorna a esfera envolvente nas coordenadas do mundo (ver get_world_bounding_box).
+        @return: Centro (x, y, z) e raio da esfera.
+        """
+
+        box_min, box_max = self.get_world_bounding_box()
+        return (box_min + box_max) / 2, float(np.linalg.norm(box_max - box_min) / 2)
+
+    def is_visible(
+        self, projection_mtx: np.ndarray, conversion_mtx: np.ndarray | None = None
+    ) -> bool:
+        """
+        Verifica, de forma conservadora, se a caixa envolvente pode aparecer na window.
+        @param projection_mtx: Matriz de projeção atual.
+        @param conversion_mtx: Matriz de conversão da window, quando ela não é aplicada às
+        coordenadas do mundo (ver Window.fold_conversion). Nesse caso, a caixa é convertida a
+        partir das coordenadas percebidas.
+        @return: False apenas se a caixa estiver com certeza fora do volume de visualização.
+        """
+
+        if self.bounds is None:
+            return True
+
+        if conversion_mtx is not None:
+            box_corners = self.get_bounding_box_corners() @ conversion_mtx
+        elif self.world_box_corners is not None:
+            box_corners = self.world_box_corners
+        else:
+            return True
+
+        return self.is_projected_box_visible(box_corners @ projection_mtx)
+
+    @staticmethod
+    def is_projected_box_visible(projected_corners: np.ndarray) -> bool:
+        """
+        Verifica se os cantos projetados de uma caixa podem cobrir parte da window.
+        @param projected_corners: Array (8, 4) com os cantos projetados, antes da divisão por w.
+        @return: False apenas se a caixa estiver com certeza fora do volume de visualização.
+        """
+
+        distance_factors = projected_corners[:, 3]
+
+        if np.any(distance_factors <= 0):
+            # A caixa cruza o plano do COP: não dá para delimitar sua projeção pelos cantos
+            return bool(np.any(distance_factors > 0))
+
+        normalized_corners = projected_corners[:, :2] / distance_factors[:, None]
+        return bool(
+            np.all(normalized_corners.min(axis=0) <= 1)
+            and np.all(normalized_corners.max(axis=0) >= -1)
+        )
+
+    @staticmethod
+    def apply_homogeneous_transformation(
+        points: np.ndarray, composite_matrix: np.ndarray
+    ) -> np.ndarray:
+        """
+        Aplica uma matriz de transformação a todos os pontos de uma vez e normaliza as
+        coordenadas homogêneas (divide por w) dos pontos em que w deixou de ser 1.
+        @param points: Array (N, 4) de pontos em coordenadas homogêneas.
+        @param composite_matrix: Matriz de transformação composta.
+        @return: Novo array (N, 4) com os pontos transformados.
+        """
+
+        return WorldObject.normalize_homogeneous_points(
+            WorldObject.transform_points(points, composite_matrix)
+        )
+
+    @staticmethod
+    def transform_points(points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """
+        Multiplica os pontos pela matriz mantendo o tipo dos pontos: a matriz, composta em
+        float64, só é convertida para o tipo dos pontos na multiplicação.
+        @param points: Array (N, 4) de pontos em coordenadas homogêneas.
+        @param matrix: Matriz 4x4.
+        @return: Novo array (N, 4), do mesmo tipo de points, com os pontos transformados.
+        """
 
-    def update_world_coordinates(self, conversion_mtx: np.ndarray) -> None:
+        return points @ matrix.astype(points.dtype, copy=False)
+
+    @staticmethod
+    def normalize_homogeneous_points(points: np.ndarray) -> np.ndarray:
+        """
+        Divide por w, no próprio array, as linhas em que w deixou de ser 1 (e não é nulo).
+        @param points: Array (N, 4) de pontos em coordenadas homogêneas.
+        @return: O mesmo array, normalizado.
+        """
+
+        w = points[:, 3]
+        needs_division = (w != 1.0) & (np.abs(w) >= 1e-9)
+        if np.any(needs_division):
+            points[needs_division] /= w[needs_division, None]
+
+        return points
+
+    def update_world_coordinates(
+        self, conversion_mtx: np.ndarray, world_points: np.ndarray | None = None
+    ) -> None:
         """
         Atualiza as coordenadas do mundo aplicando a matriz de conversão.
         @param conversion_mtx: Matriz de conversão para coordenadas do mundo.
+        @param world_points: Pontos já convertidos, quando a window converte toda a cena de uma
+        vez (ver Window.notify_perception_change). Se None, são calculados aqui.
         """
-        self.world_points = [point @ conversion_mtx for point in self.perceived_points]
+
+        if world_points is None:
+            world_points = self.transform_points(self.perceived_points, conversion_mtx)
+        self.world_points = world_points
+
+        if self.bounds is not None:
+            self.world_box_corners = self.get_bounding_box_corners() @ conversion_mtx
 
     @abstractmethod
     def get_clipped_representation(self) -> list[GraphicalObject]:
@@ -95,45 +344,98 @@ class WorldObject(ABC):
         objeto estiver fora, ou conter um ou mais objetos gráficos (dependendo da clipagem)
         """
 
+    def add_to_render_batch(self, render_batch: RenderBatch) -> None:
+        """
+        Adiciona ao lote de desenho as primitivas do objeto recortado. Por padrão, usa os
+        objetos gráficos de get_clipped_representation; objetos com muitas primitivas
+        sobrescrevem este método para adicioná-las direto como arrays.
+        @param render_batch: Lote de desenho do quadro.
+        """
+        render_batch.add_graphical_objects(self.get_clipped_representation())
+
     def get_center(self) -> tuple[float, float]:
         """
-        Retorna o centro geométrico do objeto no mundo.
+        Retorna o centro geométrico do objeto no mundo, mantido a cada transformação (ver
+        update_bounds).
         @return: Coordenadas (x, y) do centro geométrico.
         """
 
-        x_sum = sum(point[0] for point in self.perceived_points)
-        y_sum = sum(point[1] for point in self.perceived_points)
-        z_sum = sum(point[2] for point in self.perceived_points)
-        x_center = x_sum / len(self.perceived_points)
-        y_center = y_sum / len(self.perceived_points)
-        z_center = z_sum / len(self.perceived_points)
-
+        if self.centroid is None:
+            x_center, y_center, z_center = self.perceived_points[:, :3].mean(axis=0)
+        else:
+            x_center, y_center, z_center = self.centroid[:3]
         return x_center, y_center, z_center
 
-    def get_obj_description(self, last_index: int) -> tuple[str, int]:
+    def get_obj_vertices(self) -> np.ndarray:
+        """
+        Retorna os vértices do objeto a serem escritos no arquivo .obj.
+        @return: Array (N, 3) com as coordenadas x, y e z de cada vértice.
+        """
+        return self.perceived_points[:, :3]
+
+    def get_obj_elements(self, first_index: int, num_vertices: int) -> str:
+        """
+        Retorna a(s) linha(s) de elementos (p, l, f, ...) do objeto no arquivo .obj.
+        @param first_index: Índice, no arquivo .obj, do primeiro vértice do objeto.
+        @param num_vertices: Quantidade de vértices escritos para o objeto.
+        @return: String com os elementos do objeto.
+        """
+
+        obj_points = " ".join(map(str, range(first_index, first_index + num_vertices)))
+        return f"{self.obj_type} {obj_points}\n\n"
+
+    def write_obj_description(self, stream: TextIO, last_index: int) -> int:
         """
-        Retorna a descrição do objeto em formato .obj
+        Escreve a descrição do objeto em formato .obj diretamente no stream, sem montar uma
+        string única com todo o conteúdo.
+        @param stream: Arquivo (ou buffer) de texto onde a descrição será escrita.
         @param last_index: Índice do último ponto adicionado ao arquivo .obj.
-        @return: Tupla contendo a descrição do objeto e o índice do último ponto adicionado.
+        @return: Índice do último ponto adicionado após escrever este objeto.
         """
 
-        obj_description = f"o {self.name}\n"
+        vertices = self.get_obj_vertices()
+        stream.write(f"o {self.name}\n")
 
-        for point in self.perceived_points:
-            obj_description += f"v {point[0]:.1f} {point[1]:.1f} {point[2]:.1f}\n"
+        # Formata os vértices em blocos: uma única operação de formatação por bloco em vez de
+        # uma f-string por vértice
+        vertex_line = "v " + " ".join([self.obj_vertex_format] * 3) + "\n"
+        for start in range(0, len(vertices), OBJ_VERTEX_BLOCK_SIZE):
+            block = vertices[start : start + OBJ_VERTEX_BLOCK_SIZE]
+            stream.write(vertex_line * len(block) % tuple(block.ravel().tolist()))
 
-        obj_points = " ".join(
-            str(i) for i in range(last_index, last_index + len(self.perceived_points))
-        )
+        stream.write(self.get_obj_elements(last_index, len(vertices)))
+        return last_index + len(vertices)
 
-        if self.__class__.__name__ == "WorldWireframe":
-            for edge in self.get_edges_obj_file(last_index):
-                obj_description += edge + "\n"
-            obj_description += "\n"
-        else:
-            obj_description += f"{self.obj_type} {obj_points}\n\n"
+    def get_memory_size(self) -> int:
+        """
+        Estima a memória ocupada pelo objeto: a instância e os arrays, contêineres e strings
+        referenciados pelos seus atributos, cada um contado uma única vez. Objetos
+        compartilhados entre instâncias (limites do viewport, funções de clipping) não são
+        contados.
+        @return: Tamanho estimado, em bytes.
+        """
+
+        size = sys.getsizeof(self)
+        counted_ids = {id(EMPTY_PROJECTION_POINTS)}
+        for cls in type(self).__mro__:
+            for attribute in getattr(cls, "__slots__", ()):
+                value = getattr(self, attribute, None)
+                if id(value) in counted_ids or not isinstance(
+                    value, (np.ndarray, list, tuple, dict, str)
+                ):
+                    continue
+
+                counted_ids.add(id(value))
+                size += sys.getsizeof(value)
+                if isinstance(value, (list, tuple)):
+                    # Classes (como a da chave de geometria) são compartilhadas
+                    size += sum(
+                        sys.getsizeof(item)
+                        for item in value
+                        if not isinstance(item, type)
+                    )
 
-        return obj_description, last_index + len(self.perceived_points)
+        return size
 
     def __str__(self):
         """
@@ -1,16 +1,28 @@
-import re
+import os
+from functools import partial
+from typing import Callable
 
 import numpy as np
+from model.scene_file import SCENE_FILE_EXTENSION, SceneFile
+from model.world_objects.lazy_world_object import LazyWorldObject
 from model.world_objects.world_bezier_curve import WorldBezierCurve
 from model.world_objects.world_bezier_surface import WorldBezierSurface
 from model.world_objects.world_bicubic_surface import WorldBicubicSurface
 from model.world_objects.world_bspline_curve import WorldBSplineCurve
 from model.world_objects.world_line import WorldLine
 from model.world_objects.world_point import WorldPoint
+from model.world_objects.world_point_cloud import WorldPointCloud
 from model.world_objects.world_polygon import WorldPolygon
 from model.world_objects.world_wireframe import WorldWireframe
 from view.viewport.viewport_bounds import ViewportBounds
 
+# Quantidade de linhas do .obj processadas entre dois relatórios de progresso
+PROGRESS_REPORT_INTERVAL = 10000
+
+
+class ImportCancelledError(Exception):
+    """Exceção lançada pelo callback de progresso para interromper uma importação."""
+
 
 class WorldObjectFactory:
     """
@@ -25,26 +37,16 @@ class WorldObjectFactory:
         points: list,
         name: str,
         color: tuple,
-        display_file: list,
         is_filled: bool,
         object_type: type,
         edges: list,
     ):
         """
-        Cria um novo objeto do mundo a partir de uma lista de pontos.
+        Cria um novo objeto do mundo a partir de uma lista de pontos. O nome deve vir resolvido
+        pelo chamador (ver DisplayFileManager.get_next_default_name), assim como a verificação
+        de objetos repetidos (ver DisplayFileManager.objects_by_geometry).
         """
 
-        if not isinstance(object_type, (WorldBezierSurface, WorldBicubicSurface)):
-            if any(
-                all(isinstance(p, tuple) and len(p) == 3 for p in points)
-                and points == [(x, y, z) for x, y, z, _ in objs.perceived_points]
-                for objs in display_file
-                if objs.perceived_points and objs.__class__ == object_type
-            ):
-                return None
-        else:
-            pass
-
         kwargs = {
             "points": points,
             "color": color,
@@ -56,31 +58,21 @@ class WorldObjectFactory:
         elif object_type == WorldPolygon:
             kwargs["is_filled"] = is_filled
 
-        if not name:
-            obj_type_name = object_type.__name__.replace("World", "")
-
-            highest_index = 0
-            pattern = re.compile(rf"^{obj_type_name} (\d+)$")
-
-            for obj in display_file:
-                if obj.__class__.__name__.replace("World", "") == obj_type_name:
-                    match = pattern.match(obj.name)
-                    if match:
-                        index = int(match.group(1))
-                        highest_index = max(highest_index, index)
-
-            name = f"{obj_type_name} {highest_index + 1}"
-
         kwargs["name"] = name
 
         return object_type(**kwargs)
 
     @classmethod
-    def read_obj_file(cls, filepath: str) -> list:
+    def read_obj_file(
+        cls, filepath: str, progress_callback: Callable | None = None
+    ) -> list:
         """
         Realiza o parsing de um arquivo Wavefront OBJ, extraindo informações sobre objetos.
         @param filepath: Caminho do arquivo OBJ a ser lido.
-        @return: Lista de objetos lidos do arquivo OBJ. Formato: [nome: str, pontos: list, preenchimento: bool].
+        @param progress_callback: Função chamada periodicamente com (bytes lidos, total de bytes,
+        objetos lidos). Pode lançar ImportCancelledError para interromper a leitura.
+        @return: Lista de objetos lidos do arquivo OBJ. Formato: [nome: str, pontos: list, preenchimento: bool,
+        tipo: type, arestas: list, cor: tuple]. O formato OBJ não guarda cores, então todos são pretos.
         """
 
         def add_object():
@@ -92,7 +84,10 @@ class WorldObjectFactory:
                 obj_points = current_object_points
 
                 if current_command == "p":
-                    obj_type = WorldPoint
+                    if tam == 1:
+                        obj_type = WorldPoint
+                    else:
+                        obj_type = WorldPointCloud
                 elif current_command == "l":
                     if tam == 2:
                         obj_type = WorldLine
@@ -127,6 +122,7 @@ class WorldObjectFactory:
                         current_fill_state,
                         obj_type,
                         edges_list,
+                        (0, 0, 0),
                     ]
                 )
 
@@ -134,6 +130,9 @@ class WorldObjectFactory:
         objects_list = []  # Lista final [nome, [(x,y), ...]]
         current_object_name = "Object 0"  # Nome padrão se nenhum 'o' for encontrado
         current_object_points = []  # Pontos (x,y) do objeto atual
+        # Os mesmos pontos, como conjunto, para descartar repetidos sem percorrer a lista (nuvens
+        # de pontos podem ter milhões de pontos)
+        current_object_point_set = set()
         current_fill_state = False  # Estado de preenchimento
         current_command = None
         current_index = 0
@@ -141,12 +140,19 @@ class WorldObjectFactory:
         wireframe = False
         current_surface_dims = []
 
+        bytes_read = 0
+
         try:
+            total_bytes = os.path.getsize(filepath)
             with open(filepath, "r") as f:
                 all_lines = f.readlines()  # Ler todas as linhas aqui
                 for line_num, line_content in enumerate(
                     all_lines, 1
                 ):  # Iterar sobre all_lines
+                    bytes_read += len(line_content)
+                    if progress_callback and line_num % PROGRESS_REPORT_INTERVAL == 0:
+                        progress_callback(bytes_read, total_bytes, len(objects_list))
+
                     line = line_content.strip()  # Usar line_content
                     if not line or line.startswith("#"):
                         continue
@@ -174,6 +180,7 @@ class WorldObjectFactory:
                         current_index = len(vertices) + 1
                         current_fill_state = False
                         current_object_points = []
+                        current_object_point_set = set()
                         wireframe = False
                         edges_list = []
 
@@ -238,9 +245,11 @@ class WorldObjectFactory:
 
                             if (
                                 command != "bicubic_surface"
-                                and not vertices[vertex_index] in current_object_points
+                                and not vertices[vertex_index]
+                                in current_object_point_set
                             ):
                                 current_object_points.append(vertices[vertex_index])
+                                current_object_point_set.add(vertices[vertex_index])
                             elif command == "bicubic_surface":
                                 current_object_points.append(vertices[vertex_index])
 
@@ -253,46 +262,113 @@ class WorldObjectFactory:
 
         except FileNotFoundError:
             raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
+        except ImportCancelledError:
+            raise
         except Exception as e:
             raise Exception(f"Erro ao processar o arquivo {filepath}: {e}")
 
         return objects_list
 
     @classmethod
-    def new_objects_from_file(cls, filepath: str, display_file: list) -> list:
+    def new_objects_from_file(
+        cls,
+        filepath: str,
+        progress_callback: Callable | None = None,
+    ) -> list:
         """
-        Lê um arquivo OBJ e cria novos objetos do mundo a partir dele.
+        Lê um arquivo OBJ (ou de cena binária, pela extensão .sgi) e cria novos objetos do mundo a partir dele.
 
-        @param filepath: Caminho do arquivo OBJ a ser lido.
-        @param display_file: Lista de objetos do mundo já existentes.
-        @returns: Uma lista de objetos do mundo criados e uma lista de objetos que foram pulados
-        (porque já existem no display_file).
+        @param filepath: Caminho do arquivo a ser lido.
+        @param progress_callback: Função chamada periodicamente com (bytes lidos, total de bytes,
+        objetos construídos). Pode lançar ImportCancelledError para interromper a importação.
+        @returns: Lista de objetos do mundo criados. Os repetidos são descartados depois, ao
+        serem adicionados ao display file (ver DisplayFileManager.add_objects).
         """
 
-        objects_list = cls.read_obj_file(filepath)
+        if filepath.lower().endswith(SCENE_FILE_EXTENSION):
+            objects_list = SceneFile.read(filepath)
+        else:
+            objects_list = cls.read_obj_file(filepath, progress_callback)
+
+        total_bytes = os.path.getsize(filepath)
         world_objects = []
-        skipped_objects = []
 
         for obj_data in objects_list:
+            if progress_callback:
+                progress_callback(total_bytes, total_bytes, len(world_objects))
+
             obj_name = obj_data[0]
             obj_points = obj_data[1]
             obj_is_filled = obj_data[2]
             obj_type = obj_data[3]
             edges_list = obj_data[4]
+            obj_color = obj_data[5]
+
+            world_objects.append(
+                cls.new_world_object(
+                    points=obj_points,
+                    name=obj_name,
+                    color=obj_color,
+                    is_filled=obj_is_filled,
+                    object_type=obj_type,
+                    edges=edges_list,
+                )
+            )
+
+        return world_objects
+
+    @classmethod
+    def new_lazy_objects_from_file(cls, filepath: str) -> list[LazyWorldObject]:
+        """
+        Lê apenas os metadados de um arquivo de cena (.sgi) e cria, para cada objeto, um
+        representante que carrega a geometria sob demanda.
+
+        @param filepath: Caminho do arquivo de cena a ser lido.
+        @returns: Lista de representantes, um por objeto do arquivo. Como a geometria não é
+        lida, os repetidos só são descartados quando cada um é carregado.
+        """
+
+        sections = SceneFile.open(filepath)
 
-            world_object = cls.new_world_object(
-                points=obj_points,
+        return [
+            LazyWorldObject(
                 name=obj_name,
-                color=(0, 0, 0),
-                display_file=display_file,
-                is_filled=obj_is_filled,
+                color=obj_color,
+                viewport_bounds=cls.viewport_bounds,
                 object_type=obj_type,
-                edges=edges_list,
+                bounds_min=obj_min,
+                bounds_max=obj_max,
+                center=obj_center,
+                loader=partial(cls._load_scene_object, sections, index),
             )
+            for index, (
+                obj_name,
+                obj_type,
+                obj_color,
+                obj_min,
+                obj_max,
+                obj_center,
+            ) in enumerate(SceneFile.read_index(sections))
+        ]
 
-            if world_object is None:
-                skipped_objects.append(obj_name)
-            else:
-                world_objects.append(world_object)
+    @classmethod
+    def _load_scene_object(cls, sections: tuple, index: int):
+        """
+        Constrói um objeto do mundo a partir de um objeto de um arquivo de cena já aberto.
+        @param sections: Seções do arquivo, como retornadas por SceneFile.open.
+        @param index: Posição do objeto no arquivo.
+        @return: Objeto do mundo construído.
+        """
 
-        return world_objects, skipped_objects
+        obj_name, obj_points, obj_is_filled, obj_type, edges_list, obj_color = (
+            SceneFile.read_object(sections, index)
+        )
+
+        return cls.new_world_object(
+            points=obj_points,
+            name=obj_name,
+            color=obj_color,
+            is_filled=obj_is_filled,
+            object_type=obj_type,
+            edges=edges_list,
+        )
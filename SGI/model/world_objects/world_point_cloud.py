@@ -0,0 +1,147 @@
+import numpy as np
+from model.point_octree import PointOctree
+from model.world_objects.world_object import WorldObject
+from view.graphical_objects.graphical_point_cloud import GraphicalPointCloud
+from view.graphical_objects.render_batch import RenderBatch
+from view.viewport.viewport_bounds import ViewportBounds
+
+# Lado, em pixels, da célula da tela que comporta um único ponto visível (a largura da caneta
+# usada para desenhar pontos, ver GraphicalObject.get_pen)
+POINT_CLOUD_CELL_SIZE = 3
+
+
+class WorldPointCloud(WorldObject):
+    """
+    Classe pertinente a nuvens de pontos no mundo (por exemplo, a saída de um scanner). Todos os
+    pontos ficam em um único array, indexado por uma octree, e são desenhados por um único
+    objeto gráfico. A cada projeção, a octree descarta os nós fora da window e limita a
+    quantidade de pontos de cada nó à área que ele ocupa na tela.
+    """
+
+    __slots__ = ("octree", "octree_mtx", "viewport_points", "render_stats")
+
+    def __init__(
+        self,
+        points: list,
+        name: str,
+        color: tuple[int, int, int],
+        viewport_bounds: ViewportBounds,
+    ):
+        super().__init__(points, name, color, viewport_bounds)
+        self.obj_type = "p"
+
+        # A octree é construída uma única vez, sobre os pontos iniciais; octree_mtx acumula as
+        # transformações (afins) aplicadas desde então e leva as caixas dos nós aos pontos atuais
+        self.octree = PointOctree(self.perceived_points)
+        self.octree_mtx = np.eye(4)
+
+        self.viewport_points = np.empty((0, 2))
+        self.render_stats: dict[str, int] = {}
+
+    def update_bounds(self, composite_matrix: np.ndarray) -> None:
+        """
+        Atualiza os volumes envolventes (ver WorldObject) e a transformação da octree. Matrizes
+        não afins deformam as caixas dos nós, então nesse caso a octree é reconstruída.
+        @param composite_matrix: Matriz aplicada aos pontos percebidos.
+        """
+
+        super().update_bounds(composite_matrix)
+
+        if np.array_equal(composite_matrix[:, 3], (0.0, 0.0, 0.0, 1.0)):
+            self.octree_mtx = self.octree_mtx @ composite_matrix
+        else:
+            self.octree = PointOctree(self.perceived_points)
+            self.octree_mtx = np.eye(4)
+
+    def update_projection(
+        self, projection_mtx: np.ndarray, conversion_mtx: np.ndarray | None
+    ) -> None:
+        """
+        Projeta os pontos escolhidos pela octree, descarta os que ficam fora da window e mantém
+        um único ponto por célula da tela.
+        @param projection_mtx: Matriz de projeção atual.
+        @param conversion_mtx: Matriz de conversão da window. Se None, as coordenadas do mundo
+        estão atualizadas e todos os pontos são projetados a partir delas, sem a octree.
+        """
+
+        vp_width = (
+            self.viewport_bounds.x_lower_right - self.viewport_bounds.x_upper_left
+        )
+        vp_height = (
+            self.viewport_bounds.y_lower_right - self.viewport_bounds.y_upper_left
+        )
+
+        if conversion_mtx is None:
+            selected_points = self.world_points
+            nodes_tested = 0
+            view_projection_mtx = projection_mtx
+        else:
+            view_projection_mtx = conversion_mtx @ projection_mtx
+            positions, nodes_tested = self.octree.select_points(
+                self.octree_mtx @ view_projection_mtx,
+                (vp_width, vp_height),
+                POINT_CLOUD_CELL_SIZE,
+            )
+            selected_points = self.perceived_points[positions]
+
+        projected_points = self.transform_points(selected_points, view_projection_mtx)
+        distance_factors = projected_points[:, 3]
+        in_front = distance_factors > 0
+
+        # Clipping de pontos, para todos de uma vez
+        normalized_points = (
+            projected_points[in_front, :2] / distance_factors[in_front, None]
+        )
+        normalized_points = normalized_points[
+            np.all(np.abs(normalized_points) <= 1, axis=1)
+        ]
+
+        viewport_points = self.transform_projection_points_to_viewport(
+            normalized_points
+        )
+
+        # Limita a densidade na tela: pontos que caem na mesma célula seriam desenhados um
+        # sobre o outro, então apenas o primeiro de cada célula é mantido
+        viewport_origin = (
+            self.viewport_bounds.x_upper_left,
+            self.viewport_bounds.y_upper_left,
+        )
+        cells = np.floor(
+            (viewport_points - viewport_origin) / POINT_CLOUD_CELL_SIZE
+        ).astype(np.int64)
+        cell_keys = (
+            cells[:, 0] * (int(vp_height) // POINT_CLOUD_CELL_SIZE + 2) + cells[:, 1]
+        )
+        _, first_in_cell = np.unique(cell_keys, return_index=True)
+        self.viewport_points = viewport_points[np.sort(first_in_cell)]
+
+        self.projection_points = normalized_points
+        self.render_stats = {
+            "points": len(self.perceived_points),
+            "selected": len(selected_points),
+            "drawn": len(self.viewport_points),
+            "nodes_tested": nodes_tested,
+        }
+
+    def get_clipped_representation(self) -> list:
+        """
+        Retorna a nuvem como um único objeto gráfico, com os pontos já recortados em
+        update_projection.
+        """
+
+        if not len(self.viewport_points):
+            return []
+        return [GraphicalPointCloud(self.viewport_points, self.color)]
+
+    def add_to_render_batch(self, render_batch: RenderBatch) -> None:
+        """
+        Adiciona ao lote os pontos já recortados como primitivas POINTS.
+        @param render_batch: Lote de desenho do quadro.
+        """
+
+        render_batch.add_primitives(
+            RenderBatch.POINTS, self.viewport_points, self.color
+        )
+
+    def __str__(self):
+        return f"PointCloud {self.name}: {len(self.perceived_points)} points"
@@ -1,11 +1,15 @@
+import numpy as np
 from model.clipping_algorithms import ClippingAlgorithms
 from model.world_objects.world_object import WorldObject
 from view.graphical_objects.graphical_wireframe import GraphicalWireframe
+from view.graphical_objects.render_batch import RenderBatch
 
 
 class WorldPolygon(WorldObject):
     """Classe pertinente a polígonos no mundo."""
 
+    __slots__ = ("is_filled",)
+
     def __init__(
         self, points: list, name: str, color: tuple, viewport_bounds, is_filled: bool
     ):
@@ -17,6 +21,17 @@ class WorldPolygon(WorldObject):
         else:
             self.obj_type = "y"
 
+    def update_near_clipped_projection(self, projected_points: np.ndarray) -> None:
+        """
+        Recorta o polígono contra o plano próximo antes da divisão por w.
+        @param projected_points: Array (N, 4) com os vértices projetados.
+        """
+
+        clipped_vertices = ClippingAlgorithms.near_plane_polygon_clipping(
+            projected_points
+        )
+        self.update_projection_points(self.normalize_projected_points(clipped_vertices))
+
     def get_clipped_representation(self) -> list:
         clipped_points = ClippingAlgorithms.sutherland_hodgman_clipping(
             self.projection_points
@@ -24,6 +39,75 @@ class WorldPolygon(WorldObject):
         if clipped_points is None:
             return []
 
+        return self._get_graphical_representation(clipped_points)
+
+    @staticmethod
+    def get_batch_clipped_viewport_points(
+        polygons: list["WorldPolygon"],
+    ) -> list[np.ndarray]:
+        """
+        Recorta vários polígonos de uma vez (ver
+        ClippingAlgorithms.sutherland_hodgman_batch_clipping) e transforma os vértices
+        recortados para o viewport.
+        @param polygons: Polígonos com pontos projetados.
+        @return: Lista com um array (N, 2) por polígono, com os vértices recortados no viewport;
+        o array é vazio se o polígono não for visível.
+        """
+
+        if not polygons:
+            return []
+
+        vertices = np.concatenate([polygon.projection_points for polygon in polygons])
+        offsets = np.concatenate(
+            [[0], np.cumsum([len(polygon.projection_points) for polygon in polygons])]
+        )
+        clipped_vertices, clipped_offsets = (
+            ClippingAlgorithms.sutherland_hodgman_batch_clipping(vertices, offsets)
+        )
+
+        # Todos os polígonos compartilham a transformação para o viewport
+        viewport_vertices = polygons[0].transform_projection_points_to_viewport(
+            clipped_vertices
+        )
+        return [
+            viewport_vertices[start:end]
+            for start, end in zip(clipped_offsets[:-1], clipped_offsets[1:])
+        ]
+
+    def add_to_render_batch(
+        self, render_batch: RenderBatch, viewport_points: np.ndarray | None = None
+    ) -> None:
+        """
+        Adiciona ao lote o polígono recortado como uma primitiva POLYGON.
+        @param render_batch: Lote de desenho do quadro.
+        @param viewport_points: Vértices já recortados e no viewport (ver
+        get_batch_clipped_viewport_points). Se None, o polígono é recortado aqui.
+        """
+
+        if viewport_points is None:
+            clipped_points = ClippingAlgorithms.sutherland_hodgman_clipping(
+                self.projection_points
+            )
+            if clipped_points is None:
+                return
+            viewport_points = self.transform_projection_points_to_viewport(
+                clipped_points
+            )
+
+        render_batch.add_primitives(
+            RenderBatch.POLYGON, viewport_points, self.color, is_filled=self.is_filled
+        )
+
+    def _get_graphical_representation(
+        self, clipped_points: np.ndarray | list[tuple[float, float]]
+    ) -> list:
+        """
+        Monta a representação gráfica a partir dos pontos já recortados.
+        @param clipped_points: Pontos recortados (array (N, 2) ou lista), em coordenadas
+        normalizadas.
+        @return: Lista com o objeto gráfico do polígono.
+        """
+
         viewport_points = self.transform_projection_points_to_viewport(clipped_points)
         graphical_representation = GraphicalWireframe(
             viewport_points, self.color, self.is_filled
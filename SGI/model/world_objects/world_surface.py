@@ -0,0 +1,84 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+from model.clipping_algorithms import ClippingAlgorithms
+from model.world_objects.sc_world_object import SCWorldObject
+from view.graphical_objects.graphical_curve import GraphicalCurve
+from view.graphical_objects.render_batch import RenderBatch
+
+
+class WorldSurface(SCWorldObject, ABC):
+    """
+    Classe base para superfícies no mundo. A superfície é discretizada numa grade de pontos e
+    desenhada como polilinhas isoparamétricas: uma por linha e uma por coluna da grade. Assim,
+    cada ponto da grade é projetado e recortado uma única vez, e a superfície gera O(S + T)
+    objetos gráficos em vez de um por segmento da grade.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def _get_projected_surface_grid(self) -> np.ndarray | None:
+        """
+        Gera a grade de pontos da superfície e a projeta, sem a divisão por w.
+        @return: Array (S, T, 4) com os pontos projetados da grade, ou None se a matriz de
+        projeção ainda não foi definida.
+        """
+
+    def _get_clipped_polylines(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Recorta, de uma vez, todas as polilinhas isoparamétricas da grade (ver
+        ClippingAlgorithms.polyline_batch_clipping) e transforma os pedaços visíveis para o
+        viewport.
+        @return: Array (M, 2) com os vértices dos pedaços visíveis, no viewport, e array
+        (P + 1,) com o início de cada pedaço.
+        """
+
+        projected_grid = self._get_projected_surface_grid()
+        if projected_grid is None or not projected_grid.size:
+            return np.empty((0, 2)), np.zeros(1, dtype=np.intp)
+
+        rows, columns = projected_grid.shape[:2]
+
+        # Polilinhas: as linhas da grade, em sequência, seguidas das colunas
+        vertices = np.concatenate(
+            [
+                projected_grid.reshape(-1, 4),
+                projected_grid.transpose(1, 0, 2).reshape(-1, 4),
+            ]
+        )
+        offsets = np.concatenate(
+            [np.arange(rows) * columns, rows * columns + np.arange(columns + 1) * rows]
+        )
+
+        clipped_vertices, clipped_offsets = ClippingAlgorithms.polyline_batch_clipping(
+            vertices, offsets, self.batch_clipping_mode
+        )
+        return (
+            self.transform_projection_points_to_viewport(clipped_vertices),
+            clipped_offsets,
+        )
+
+    def get_clipped_representation(self) -> list[GraphicalCurve]:
+        """
+        Retorna os pedaços visíveis das polilinhas isoparamétricas da grade.
+        @return: Lista com um GraphicalCurve por pedaço visível de cada polilinha.
+        """
+
+        viewport_vertices, offsets = self._get_clipped_polylines()
+        return [
+            GraphicalCurve(viewport_vertices[start:end], self.color)
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+    def add_to_render_batch(self, render_batch: RenderBatch) -> None:
+        """
+        Adiciona ao lote os pedaços visíveis das polilinhas como primitivas POLYLINE, sem criar
+        objetos gráficos.
+        @param render_batch: Lote de desenho do quadro.
+        """
+
+        viewport_vertices, offsets = self._get_clipped_polylines()
+        render_batch.add_primitives(
+            RenderBatch.POLYLINE, viewport_vertices, self.color, offsets
+        )
@@ -1,10 +1,15 @@
+import numpy as np
+from model.clipping_algorithms import ClippingAlgorithms
 from model.world_objects.sc_world_object import SCWorldObject
-from view.graphical_objects.graphical_line import GraphicalLine
+from view.graphical_objects.graphical_line_segments import GraphicalLineSegments
+from view.graphical_objects.render_batch import RenderBatch
 
 
 class WorldWireframe(SCWorldObject):
     """Classe pertinente a Wireframes no mundo."""
 
+    __slots__ = ("edges", "projected_edges")
+
     def __init__(
         self,
         points: list,
@@ -15,24 +20,85 @@ class WorldWireframe(SCWorldObject):
     ):
         super().__init__(points, name, color, viewport_bounds)
         self.obj_type = "l"
-        self.edges = edges
+        # Arestas como array (E, 2) de índices dos pontos
+        self.edges = np.asarray(edges, dtype=int).reshape(-1, 2)
+        # Arestas sobre os pontos projetados; diferem de edges quando a projeção foi recortada
+        # contra o plano próximo, o que cria novas extremidades
+        self.projected_edges = self.edges
+
+    def update_projection_points(self, projection_points: np.ndarray) -> None:
+        """
+        Atualiza as coordenadas projetadas, que correspondem um a um aos pontos do wireframe.
+        @param projection_points: Array (N, 2) de pontos projetados em coordenadas normalizadas.
+        """
+
+        super().update_projection_points(projection_points)
+        self.projected_edges = self.edges
+
+    def update_near_clipped_projection(self, projected_points: np.ndarray) -> None:
+        """
+        Recorta todas as arestas contra o plano próximo, de uma vez, antes da divisão por w.
+        As arestas mantidas passam a ter extremidades próprias nos pontos projetados.
+        @param projected_points: Array (N, 4) com os pontos projetados.
+        """
+
+        starts, ends, _ = ClippingAlgorithms.near_plane_segment_clipping(
+            projected_points[self.edges[:, 0]], projected_points[self.edges[:, 1]]
+        )
+
+        # Extremidades intercaladas: a aresta k liga os pontos 2k e 2k + 1
+        endpoints = np.stack([starts, ends], axis=1).reshape(-1, 4)
+        self.projection_points = self.normalize_projected_points(endpoints)
+        self.projected_edges = np.arange(2 * len(starts)).reshape(-1, 2)
+
+    def _get_clipped_segment_points(self) -> np.ndarray:
+        """
+        Recorta todas as arestas de uma vez: as extremidades são obtidas por indexação dos
+        pontos projetados e passadas juntas ao algoritmo de recorte em lote.
+        @return: Array (2K, 2) com as extremidades das K arestas visíveis, no viewport; o
+        segmento k liga os pontos 2k e 2k + 1.
+        """
+
+        if not len(self.projected_edges) or not len(self.projection_points):
+            return np.empty((0, 2))
+
+        starts, ends, _ = self.batch_clipping_mode(
+            self.projection_points[self.projected_edges[:, 0]],
+            self.projection_points[self.projected_edges[:, 1]],
+        )
+
+        segment_points = np.stack([starts, ends], axis=1).reshape(-1, 2)
+        return self.transform_projection_points_to_viewport(segment_points)
 
     def get_clipped_representation(self) -> list:
-        clipped_representations = []
+        """
+        Retorna as arestas visíveis como um único objeto gráfico.
+        @return: Lista com um único GraphicalLineSegments contendo as arestas visíveis, ou
+        vazia se nenhuma aresta for visível.
+        """
 
-        for index_1, index_2 in self.edges:
-            p1 = self.projection_points[index_1]
-            p2 = self.projection_points[index_2]
-            clipped_points = self.clipping_mode(p1, p2)
-
-            if clipped_points is not None:
-                viewport_points = self.transform_projection_points_to_viewport(
-                    clipped_points
-                )
-                graphical_representation = GraphicalLine(viewport_points, self.color)
-                clipped_representations.append(graphical_representation)
-
-        return clipped_representations
+        viewport_points = self._get_clipped_segment_points()
+        if not len(viewport_points):
+            return []
+        return [GraphicalLineSegments(viewport_points, self.color)]
+
+    def add_to_render_batch(self, render_batch: RenderBatch) -> None:
+        """
+        Adiciona ao lote as arestas visíveis como uma única sequência de primitivas LINES.
+        @param render_batch: Lote de desenho do quadro.
+        """
+
+        render_batch.add_primitives(
+            RenderBatch.LINES, self._get_clipped_segment_points(), self.color
+        )
+
+    def get_obj_elements(self, first_index: int, num_vertices: int) -> str:
+        """
+        Sobrescreve o método da classe base: wireframes são descritos aresta a aresta.
+        """
+        return (
+            "".join(edge + "\n" for edge in self.get_edges_obj_file(first_index)) + "\n"
+        )
 
     def get_edges_obj_file(self, last_index) -> list:
         """
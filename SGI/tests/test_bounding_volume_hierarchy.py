@@ -0,0 +1,181 @@
+"""
+Testes da hierarquia de caixas envolventes: a consulta não descarta nenhum objeto visível, e
+todo objeto descartado está, de fato, fora do volume de visualização. Os resultados são
+comparados com a classificação, uma a uma, das caixas de todos os objetos.
+
+Pode ser executado com pytest (de dentro de SGI) ou diretamente:
+python tests/test_bounding_volume_hierarchy.py
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.bounding_volume_hierarchy import BoundingVolumeHierarchy
+from model.display_file_manager import DisplayFileManager
+from model.transformation_generator import TransformationGenerator
+from model.window import Window
+from model.world_objects.world_line import WorldLine
+from model.world_objects.world_point import WorldPoint
+from model.world_objects.world_polygon import WorldPolygon
+from view.viewport.viewport_bounds import ViewportBounds
+
+VIEWPORT_BOUNDS = ViewportBounds(0, 0, 800, 600)
+NUM_OBJECTS = 3000
+
+
+def new_scene() -> DisplayFileManager:
+    """
+    Display file com pontos, retas e polígonos espalhados à frente, atrás e dos lados da
+    window, em escalas diferentes.
+    """
+
+    display_file_manager = DisplayFileManager(VIEWPORT_BOUNDS)
+    rng = np.random.default_rng(0)
+    object_types = [(WorldPoint, 1), (WorldLine, 2), (WorldPolygon, 4)]
+
+    for i in range(NUM_OBJECTS):
+        object_type, num_points = object_types[i % 3]
+        center = rng.uniform(-60, 60, 3)
+        points = center + rng.normal(size=(num_points, 3)) * rng.choice([0.1, 1, 10])
+        display_file_manager.add_object(
+            points=[tuple(point) for point in points],
+            name=f"object {i}",
+            color=(0, 0, 0),
+            is_filled=False,
+            object_type=object_type,
+        )
+
+    return display_file_manager
+
+
+def get_view_projection_matrix(window: Window) -> np.ndarray:
+    """Matriz que leva as coordenadas percebidas à projeção perspectiva da window."""
+
+    return window.conversion_mtx @ (
+        TransformationGenerator.get_perspective_projection_points(
+            center_of_projection=window.center_of_projection,
+            window_width=window.get_width(),
+            window_height=window.get_height(),
+        )
+    )
+
+
+def get_windows() -> list[Window]:
+    """Windows na posição inicial e giradas em cada direção."""
+
+    windows = [Window(VIEWPORT_BOUNDS)]
+    for angle, rotation_type in [(50, "horizontal"), (-120, "vertical"), (30, "spin")]:
+        window = Window(VIEWPORT_BOUNDS)
+        window.apply_rotation(angle, rotation_type)
+        windows.append(window)
+    return windows
+
+
+def is_outside_view_volume(points: np.ndarray, view_projection_mtx: np.ndarray) -> bool:
+    """
+    Verifica se os pontos estão todos fora do volume de visualização, pelo mesmo lado: todos
+    atrás do COP, ou todos à frente e além da mesma borda da window.
+    """
+
+    projected_points = points @ view_projection_mtx
+    distance_factors = projected_points[:, 3]
+    if np.all(distance_factors <= 0):
+        return True
+    if not np.all(distance_factors > 0):
+        return False
+
+    normalized_points = projected_points[:, :2] / distance_factors[:, None]
+    return bool(
+        np.any(np.all(normalized_points > 1, axis=0))
+        or np.any(np.all(normalized_points < -1, axis=0))
+    )
+
+
+def has_point_in_view_volume(
+    points: np.ndarray, view_projection_mtx: np.ndarray
+) -> bool:
+    """Verifica se algum dos pontos, projetado, cai dentro da window."""
+
+    projected_points = points @ view_projection_mtx
+    in_front = projected_points[:, 3] > 0
+    normalized_points = projected_points[in_front, :2] / projected_points[in_front, 3:]
+    return bool(np.any(np.all(np.abs(normalized_points) <= 1, axis=1)))
+
+
+def assert_query_is_exact(
+    display_file_manager: DisplayFileManager, view_projection_mtx: np.ndarray
+) -> None:
+    """
+    Verifica a consulta contra a classificação das caixas de todos os objetos e contra os
+    próprios pontos dos objetos.
+    """
+
+    hierarchy = display_file_manager.bounding_volume_hierarchy
+    hierarchy.update(display_file_manager.display_file)
+    visible_ids, stats = hierarchy.query(view_projection_mtx)
+
+    objects = list(display_file_manager.display_file.values())
+    outside, *_ = BoundingVolumeHierarchy.classify_boxes(
+        np.array([obj.bounds for obj in objects]), view_projection_mtx
+    )
+    expected_ids = sorted(
+        obj.object_id for obj, is_outside in zip(objects, outside) if not is_outside
+    )
+    assert visible_ids == expected_ids
+    assert stats["visible"] + stats["culled"] == len(objects)
+    # A cena precisa ter objetos dos dois lados para que o teste signifique algo
+    assert 0 < stats["culled"] < len(objects)
+
+    visible_id_set = set(visible_ids)
+    for obj in objects:
+        if obj.object_id in visible_id_set:
+            continue
+        assert not has_point_in_view_volume(obj.perceived_points, view_projection_mtx)
+        assert is_outside_view_volume(obj.perceived_points, view_projection_mtx)
+
+
+def test_query_keeps_visible_objects_and_culls_only_outside_ones() -> None:
+    display_file_manager = new_scene()
+
+    for window in get_windows():
+        assert_query_is_exact(display_file_manager, get_view_projection_matrix(window))
+
+
+def test_query_after_transformations_and_removals() -> None:
+    display_file_manager = new_scene()
+    window = Window(VIEWPORT_BOUNDS)
+    view_projection_mtx = get_view_projection_matrix(window)
+    hierarchy = display_file_manager.bounding_volume_hierarchy
+    hierarchy.update(display_file_manager.display_file)
+
+    # Poucos objetos transformados: a hierarquia é apenas reajustada
+    object_ids = list(display_file_manager.display_file)
+    display_file_manager.apply_group_transformation(
+        object_ids[:100],
+        [{"type": "translation", "dx": 0, "dy": 0, "dz": 80}],
+        window.conversion_mtx,
+    )
+    hierarchy.update(display_file_manager.display_file)
+    assert not hierarchy.needs_rebuild
+    assert_query_is_exact(display_file_manager, view_projection_mtx)
+
+    # A maior parte dos objetos transformados: a hierarquia é reconstruída
+    display_file_manager.apply_group_transformation(
+        object_ids[: NUM_OBJECTS * 2 // 3],
+        [{"type": "translation", "dx": -40, "dy": 0, "dz": 0}],
+        window.conversion_mtx,
+    )
+    assert_query_is_exact(display_file_manager, view_projection_mtx)
+
+    display_file_manager.remove_objects(object_ids[::2])
+    assert_query_is_exact(display_file_manager, view_projection_mtx)
+
+
+if __name__ == "__main__":
+    test_query_keeps_visible_objects_and_culls_only_outside_ones()
+    test_query_after_transformations_and_removals()
+    print("OK")
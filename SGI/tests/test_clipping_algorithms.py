@@ -0,0 +1,214 @@
+"""
+Testes dos algoritmos de recorte em lote: cada polígono recortado pelo Sutherland-Hodgman em
+lote é comparado com o recorte da versão escalar original, polígono a polígono, e cada segmento
+recortado pelo Cohen-Sutherland e pelo Liang-Barsky em lote, com a versão escalar do mesmo
+algoritmo.
+
+Pode ser executado com pytest (de dentro de SGI) ou diretamente:
+python tests/test_clipping_algorithms.py
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.clipping_algorithms import ClippingAlgorithms
+
+
+def get_scalar_sutherland_hodgman_clipping(points: list) -> list | None:
+    """
+    Sutherland-Hodgman escalar original: cada borda da window é uma reta qualquer, e as
+    interseções são calculadas pela fórmula da interseção de duas retas.
+    @param points: Lista de pontos (x, y) do polígono.
+    @return: Lista com os pontos recortados ou None se o polígono estiver fora da window.
+    """
+
+    if all(-1 <= x <= 1 and -1 <= y <= 1 for x, y in points):
+        return points
+
+    clip_window = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
+    clip_edges = list(zip(clip_window, clip_window[1:] + [clip_window[0]]))
+
+    clipped_polygon = points[:]
+
+    for (x3, y3), (x4, y4) in clip_edges:
+        input_polygon = clipped_polygon
+        clipped_polygon = []
+
+        if not input_polygon:
+            break
+
+        def is_inside(point: tuple[float, float]) -> bool:
+            px, py = point
+            return (x4 - x3) * (py - y3) > (y4 - y3) * (px - x3)
+
+        previous_point = input_polygon[-1]
+        for current_point in input_polygon:
+            current_inside = is_inside(current_point)
+
+            if current_inside != is_inside(previous_point):
+                x1, y1 = previous_point
+                x2, y2 = current_point
+                denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+                if denom != 0:
+                    clipped_polygon.append(
+                        (
+                            (
+                                (x1 * y2 - y1 * x2) * (x3 - x4)
+                                - (x1 - x2) * (x3 * y4 - y3 * x4)
+                            )
+                            / denom,
+                            (
+                                (x1 * y2 - y1 * x2) * (y3 - y4)
+                                - (y1 - y2) * (x3 * y4 - y3 * x4)
+                            )
+                            / denom,
+                        )
+                    )
+
+            if current_inside:
+                clipped_polygon.append(current_point)
+
+            previous_point = current_point
+
+    if clipped_polygon:
+        return clipped_polygon
+    return None
+
+
+def get_random_polygons(rng: np.random.Generator, num_polygons: int) -> list[list]:
+    """
+    Polígonos aleatórios: dentro, fora, cruzando a window e envolvendo-a. Parte deles tem
+    vértices numa grade de meio em meio, que cai exatamente sobre as bordas.
+    """
+
+    polygons = []
+    for i in range(num_polygons):
+        num_vertices = rng.integers(3, 10)
+        center = rng.uniform(-2.5, 2.5, 2)
+        radius = rng.choice([0.1, 0.5, 1.5, 4])
+        vertices = center + rng.uniform(-radius, radius, (num_vertices, 2))
+        if i % 4 == 0:
+            vertices = np.round(vertices * 2) / 2
+        polygons.append(list(map(tuple, vertices.tolist())))
+    return polygons
+
+
+def test_sutherland_hodgman_batch_matches_scalar() -> None:
+    polygons = get_random_polygons(np.random.default_rng(0), 3000)
+    # Polígonos sem vértices não interferem nos vizinhos
+    polygons[10] = []
+    polygons[-1] = []
+
+    counts = [len(polygon) for polygon in polygons]
+    vertices = np.array([point for polygon in polygons for point in polygon])
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    clipped_vertices, clipped_offsets = (
+        ClippingAlgorithms.sutherland_hodgman_batch_clipping(vertices, offsets)
+    )
+
+    assert len(clipped_offsets) == len(polygons) + 1
+    for i, polygon in enumerate(polygons):
+        clipped_polygon = clipped_vertices[clipped_offsets[i] : clipped_offsets[i + 1]]
+        expected = get_scalar_sutherland_hodgman_clipping(polygon) if polygon else None
+
+        if expected is None:
+            assert len(clipped_polygon) == 0, f"polígono {i}: {polygon}"
+        else:
+            np.testing.assert_allclose(
+                clipped_polygon, expected, atol=1e-12, err_msg=f"polígono {i}"
+            )
+
+
+def test_sutherland_hodgman_clipping_matches_scalar() -> None:
+    for polygon in get_random_polygons(np.random.default_rng(1), 1000):
+        clipped_polygon = ClippingAlgorithms.sutherland_hodgman_clipping(polygon)
+        expected = get_scalar_sutherland_hodgman_clipping(polygon)
+
+        if expected is None:
+            assert clipped_polygon is None
+        else:
+            np.testing.assert_allclose(clipped_polygon, expected, atol=1e-12)
+
+
+def get_random_segments(
+    rng: np.random.Generator, num_segments: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Segmentos aleatórios, com extremidades dentro e fora da window. Parte deles tem as
+    extremidades numa grade de meio em meio (sobre as bordas, paralelos a elas ou com
+    comprimento nulo).
+    @return: Arrays (E, 2) com as extremidades iniciais e finais.
+    """
+
+    starts = rng.uniform(-3, 3, (num_segments, 2))
+    ends = rng.uniform(-3, 3, (num_segments, 2))
+    on_grid = np.arange(num_segments) % 3 == 0
+    starts[on_grid] = np.round(starts[on_grid] * 2) / 2
+    ends[on_grid] = np.round(ends[on_grid] * 2) / 2
+    return starts, ends
+
+
+def assert_batch_matches_scalar(batch_clipper, scalar_clipper) -> None:
+    """
+    Verifica se o recorte em lote mantém os mesmos segmentos que a versão escalar, com as
+    mesmas extremidades recortadas.
+    """
+
+    starts, ends = get_random_segments(np.random.default_rng(2), 5000)
+
+    clipped_starts, clipped_ends, kept = batch_clipper(starts, ends)
+
+    expected = [
+        scalar_clipper(tuple(start), tuple(end)) for start, end in zip(starts, ends)
+    ]
+    expected_kept = np.array([segment is not None for segment in expected])
+    mismatches = np.flatnonzero(kept != expected_kept)
+    assert not len(mismatches), [
+        (starts[i].tolist(), ends[i].tolist()) for i in mismatches[:5]
+    ]
+
+    expected_segments = np.array(
+        [segment for segment in expected if segment is not None]
+    )
+    np.testing.assert_allclose(clipped_starts, expected_segments[:, 0], atol=1e-12)
+    np.testing.assert_allclose(clipped_ends, expected_segments[:, 1], atol=1e-12)
+
+
+def test_cohen_sutherland_batch_matches_scalar() -> None:
+    assert_batch_matches_scalar(
+        ClippingAlgorithms.cohen_sutherland_batch_clipping,
+        ClippingAlgorithms.cohen_sutherland_clipping,
+    )
+
+
+def test_liang_barsky_batch_matches_scalar() -> None:
+    assert_batch_matches_scalar(
+        ClippingAlgorithms.liang_barsky_batch_clipping,
+        ClippingAlgorithms.liang_barsky_clipping,
+    )
+
+
+def test_batch_clipping_of_no_segments() -> None:
+    for batch_clipper in (
+        ClippingAlgorithms.cohen_sutherland_batch_clipping,
+        ClippingAlgorithms.liang_barsky_batch_clipping,
+    ):
+        clipped_starts, clipped_ends, kept = batch_clipper(
+            np.empty((0, 2)), np.empty((0, 2))
+        )
+        assert clipped_starts.shape == clipped_ends.shape == (0, 2)
+        assert len(kept) == 0
+
+
+if __name__ == "__main__":
+    test_sutherland_hodgman_batch_matches_scalar()
+    test_sutherland_hodgman_clipping_matches_scalar()
+    test_cohen_sutherland_batch_matches_scalar()
+    test_liang_barsky_batch_matches_scalar()
+    test_batch_clipping_of_no_segments()
+    print("OK")
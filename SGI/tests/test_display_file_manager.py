@@ -0,0 +1,195 @@
+"""
+Testes do DisplayFileManager: nomeação automática dos objetos, objetos repetidos e remoção e
+transformação de objetos pelo identificador estável (object_id).
+
+Pode ser executado com pytest (de dentro de SGI) ou diretamente:
+python tests/test_display_file_manager.py
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.display_file_manager import DisplayFileManager
+from model.window import Window
+from model.world_objects.world_bezier_surface import WorldBezierSurface
+from model.world_objects.world_line import WorldLine
+from model.world_objects.world_point import WorldPoint
+from view.viewport.viewport_bounds import ViewportBounds
+
+VIEWPORT_BOUNDS = ViewportBounds(0, 0, 800, 600)
+
+
+def new_display_file_manager() -> DisplayFileManager:
+    return DisplayFileManager(VIEWPORT_BOUNDS)
+
+
+def add_point(
+    display_file_manager: DisplayFileManager,
+    x: float,
+    name: str = "",
+    object_type: type = WorldPoint,
+):
+    """
+    Adiciona um ponto (ou uma reta, a partir do ponto) com a coordenada x dada.
+    """
+
+    points = [(x, 0.0, 0.0)]
+    if object_type is WorldLine:
+        points.append((x, 1.0, 0.0))
+
+    return display_file_manager.add_object(
+        points=points,
+        name=name,
+        color=(0, 0, 0),
+        is_filled=False,
+        object_type=object_type,
+    )
+
+
+def test_default_names_are_sequential() -> None:
+    display_file_manager = new_display_file_manager()
+
+    names = [add_point(display_file_manager, x).name for x in range(3)]
+
+    assert names == ["Point 1", "Point 2", "Point 3"]
+
+
+def test_removing_the_highest_index_frees_it() -> None:
+    display_file_manager = new_display_file_manager()
+    add_point(display_file_manager, 0)
+    highest = add_point(display_file_manager, 1, name="Point 50000000")
+
+    display_file_manager.remove_object(highest.object_id)
+
+    assert display_file_manager.get_next_default_name(WorldPoint) == "Point 2"
+
+
+def test_index_shared_by_two_names_stays_in_use() -> None:
+    display_file_manager = new_display_file_manager()
+    add_point(display_file_manager, 0)
+    add_point(display_file_manager, 1)
+    add_point(display_file_manager, 2, name="Point 3")
+    repeated_index = add_point(display_file_manager, 3, name="Point 03")
+
+    display_file_manager.remove_object(repeated_index.object_id)
+
+    assert display_file_manager.get_next_default_name(WorldPoint) == "Point 4"
+
+
+def test_same_name_of_other_type_does_not_use_the_index() -> None:
+    display_file_manager = new_display_file_manager()
+    add_point(display_file_manager, 0)
+    point = add_point(display_file_manager, 1, name="Point 2")
+    add_point(display_file_manager, 2, name="Point 2", object_type=WorldLine)
+
+    display_file_manager.remove_object(point.object_id)
+
+    assert display_file_manager.get_next_default_name(WorldPoint) == "Point 2"
+
+
+def test_surfaces_are_never_repeated() -> None:
+    display_file_manager = new_display_file_manager()
+    control_points = [[[row, column, 0.0] for column in range(4)] for row in range(4)]
+    surfaces = [
+        WorldBezierSurface(
+            control_points,
+            f"surface {i}",
+            (0, 0, 0),
+            VIEWPORT_BOUNDS,
+        )
+        for i in range(2)
+    ]
+
+    skipped_objects = display_file_manager.add_objects(surfaces)
+
+    assert skipped_objects == []
+    assert len(display_file_manager.display_file) == 2
+
+
+def get_translation(dx: float) -> list[dict]:
+    return [{"type": "translation", "dx": dx, "dy": 0, "dz": 0}]
+
+
+def test_object_ids_are_stable_and_never_reused() -> None:
+    display_file_manager = new_display_file_manager()
+    points = [add_point(display_file_manager, x) for x in range(5)]
+    object_ids = [point.object_id for point in points]
+
+    display_file_manager.remove_object(object_ids[1])
+    display_file_manager.remove_objects([object_ids[3], object_ids[0]])
+    new_point = add_point(display_file_manager, 10)
+
+    assert len(set(object_ids)) == 5
+    assert new_point.object_id not in object_ids
+    # Os demais objetos mantêm o identificador e a ordem de inserção
+    assert list(display_file_manager.display_file) == [
+        object_ids[2],
+        object_ids[4],
+        new_point.object_id,
+    ]
+    assert display_file_manager.display_file[object_ids[4]] is points[4]
+    assert [
+        object_id for object_id, _ in display_file_manager.get_objs_as_strings()
+    ] == list(display_file_manager.display_file)
+
+
+def test_transformations_by_id_after_removals() -> None:
+    display_file_manager = new_display_file_manager()
+    conversion_mtx = Window(VIEWPORT_BOUNDS).conversion_mtx
+    points = [add_point(display_file_manager, x) for x in range(6)]
+
+    display_file_manager.remove_objects([points[0].object_id, points[2].object_id])
+    display_file_manager.apply_transformation(
+        points[3].object_id, get_translation(100), conversion_mtx
+    )
+    display_file_manager.apply_group_transformation(
+        [points[5].object_id, points[1].object_id],
+        get_translation(-100),
+        conversion_mtx,
+    )
+
+    x_coordinates = {
+        object_id: obj.perceived_points[0, 0]
+        for object_id, obj in display_file_manager.display_file.items()
+    }
+    np.testing.assert_allclose(
+        [
+            x_coordinates[point.object_id]
+            for point in points
+            if point.object_id in x_coordinates
+        ],
+        [-99, 103, 4, -95],
+    )
+
+
+def test_removed_and_transformed_geometries_are_freed() -> None:
+    display_file_manager = new_display_file_manager()
+    conversion_mtx = Window(VIEWPORT_BOUNDS).conversion_mtx
+    removed_point = add_point(display_file_manager, 0)
+    moved_point = add_point(display_file_manager, 1)
+
+    display_file_manager.remove_object(removed_point.object_id)
+    display_file_manager.apply_transformation(
+        moved_point.object_id, get_translation(1), conversion_mtx
+    )
+
+    # As posições antigas ficam livres, e a nova passa a estar ocupada
+    assert add_point(display_file_manager, 0) is not None
+    assert add_point(display_file_manager, 1) is not None
+    assert add_point(display_file_manager, 2) is None
+
+
+if __name__ == "__main__":
+    test_default_names_are_sequential()
+    test_removing_the_highest_index_frees_it()
+    test_index_shared_by_two_names_stays_in_use()
+    test_same_name_of_other_type_does_not_use_the_index()
+    test_surfaces_are_never_repeated()
+    test_object_ids_are_stable_and_never_reused()
+    test_transformations_by_id_after_removals()
+    test_removed_and_transformed_geometries_are_freed()
+    print("OK")
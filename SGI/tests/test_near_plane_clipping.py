@@ -0,0 +1,181 @@
+"""
+Testes do recorte contra o plano próximo (w = NEAR_PLANE_W), feito antes da divisão por w:
+segmentos e polígonos recortados em lote são comparados com um recorte escrito vértice a
+vértice, e objetos que atravessam o plano do COP têm projeções finitas.
+
+Pode ser executado com pytest (de dentro de SGI) ou diretamente:
+python tests/test_near_plane_clipping.py
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.clipping_algorithms import ClippingAlgorithms
+from model.display_file_manager import DisplayFileManager
+from model.window import Window
+from model.world_objects.world_line import WorldLine
+from model.world_objects.world_polygon import WorldPolygon
+from view.viewport.viewport_bounds import ViewportBounds
+
+NEAR_PLANE_W = ClippingAlgorithms.NEAR_PLANE_W
+
+
+def clip_segment(start: np.ndarray, end: np.ndarray) -> tuple | None:
+    """
+    Recorte de referência de um segmento contra o plano próximo.
+    @return: Tupla com as extremidades recortadas, ou None se o segmento estiver atrás do plano.
+    """
+
+    if start[3] < NEAR_PLANE_W and end[3] < NEAR_PLANE_W:
+        return None
+
+    t = (NEAR_PLANE_W - start[3]) / (end[3] - start[3]) if start[3] != end[3] else 0
+    intersection = start + t * (end - start)
+    if start[3] < NEAR_PLANE_W:
+        return intersection, end
+    if end[3] < NEAR_PLANE_W:
+        return start, intersection
+    return start, end
+
+
+def clip_polygon(vertices: np.ndarray) -> list[np.ndarray]:
+    """Recorte de referência de um polígono contra o plano próximo (Sutherland-Hodgman)."""
+
+    clipped_vertices = []
+    for i, vertex in enumerate(vertices):
+        next_vertex = vertices[(i + 1) % len(vertices)]
+        vertex_in_front = vertex[3] >= NEAR_PLANE_W
+        next_in_front = next_vertex[3] >= NEAR_PLANE_W
+
+        if vertex_in_front:
+            clipped_vertices.append(vertex)
+        if vertex_in_front != next_in_front:
+            t = (vertex[3] - NEAR_PLANE_W) / (vertex[3] - next_vertex[3])
+            clipped_vertices.append(vertex + t * (next_vertex - vertex))
+
+    return clipped_vertices
+
+
+def test_segments_match_the_reference() -> None:
+    rng = np.random.default_rng(0)
+    starts = rng.uniform(-5, 5, (5000, 4))
+    ends = rng.uniform(-5, 5, (5000, 4))
+    # Extremidades exatamente sobre o plano e segmentos paralelos a ele
+    starts[:50, 3] = NEAR_PLANE_W
+    ends[50:100, 3] = starts[50:100, 3]
+
+    clipped_starts, clipped_ends, kept = ClippingAlgorithms.near_plane_segment_clipping(
+        starts, ends
+    )
+
+    expected = [clip_segment(start, end) for start, end in zip(starts, ends)]
+    assert np.array_equal(kept, [segment is not None for segment in expected])
+    expected_kept = [segment for segment in expected if segment is not None]
+    np.testing.assert_allclose(clipped_starts, [start for start, _ in expected_kept])
+    np.testing.assert_allclose(clipped_ends, [end for _, end in expected_kept])
+    assert np.all(clipped_starts[:, 3] >= NEAR_PLANE_W - 1e-12)
+    assert np.all(clipped_ends[:, 3] >= NEAR_PLANE_W - 1e-12)
+
+
+def test_segments_in_front_are_unchanged() -> None:
+    rng = np.random.default_rng(1)
+    starts = rng.uniform(NEAR_PLANE_W, 5, (100, 4))
+    ends = rng.uniform(NEAR_PLANE_W, 5, (100, 4))
+
+    clipped_starts, clipped_ends, kept = ClippingAlgorithms.near_plane_segment_clipping(
+        starts, ends
+    )
+
+    assert np.all(kept)
+    assert np.array_equal(clipped_starts, starts)
+    assert np.array_equal(clipped_ends, ends)
+
+
+def test_polygons_match_the_reference() -> None:
+    rng = np.random.default_rng(2)
+
+    for _ in range(2000):
+        num_vertices = rng.integers(3, 9)
+        vertices = rng.uniform(-5, 5, (num_vertices, 4))
+
+        clipped_vertices = ClippingAlgorithms.near_plane_polygon_clipping(vertices)
+
+        expected = clip_polygon(vertices)
+        assert clipped_vertices.shape == (len(expected), 4)
+        if expected:
+            np.testing.assert_allclose(clipped_vertices, expected)
+            assert np.all(clipped_vertices[:, 3] >= NEAR_PLANE_W - 1e-12)
+
+
+def test_triangle_with_vertices_behind_the_plane() -> None:
+    triangle = np.array(
+        [
+            [0.0, 0.0, 0.0, 1.0],
+            [1.0, 0.0, 0.0, -1.0],
+            [0.0, 1.0, 0.0, 1.0],
+        ]
+    )
+
+    # Um vértice atrás: vira um quadrilátero
+    clipped_vertices = ClippingAlgorithms.near_plane_polygon_clipping(triangle)
+    assert len(clipped_vertices) == 4
+    np.testing.assert_allclose(clipped_vertices[[0, 3]], triangle[[0, 2]])
+    np.testing.assert_allclose(clipped_vertices[1:3, 3], NEAR_PLANE_W)
+
+    # Dois vértices atrás: continua um triângulo
+    triangle[:, 3] *= -1
+    clipped_vertices = ClippingAlgorithms.near_plane_polygon_clipping(triangle)
+    assert len(clipped_vertices) == 3
+    np.testing.assert_allclose(clipped_vertices[1], triangle[1])
+
+    # Todos atrás: nada sobra
+    triangle[:, 3] = -1
+    assert len(ClippingAlgorithms.near_plane_polygon_clipping(triangle)) == 0
+
+
+def test_objects_crossing_the_cop_plane_have_finite_projections() -> None:
+    viewport_bounds = ViewportBounds(0, 0, 800, 600)
+    display_file_manager = DisplayFileManager(viewport_bounds)
+    window = Window(viewport_bounds)
+
+    # O COP fica em z = -10: os objetos vão de trás dele até a frente da window
+    line = display_file_manager.add_object(
+        points=[(0.5, 0.5, -50.0), (0.5, 0.5, 50.0)],
+        name="",
+        color=(0, 0, 0),
+        is_filled=False,
+        object_type=WorldLine,
+    )
+    polygon = display_file_manager.add_object(
+        points=[(-1.0, -1.0, -50.0), (1.0, -1.0, -50.0), (0.0, 1.0, 50.0)],
+        name="",
+        color=(0, 0, 0),
+        is_filled=True,
+        object_type=WorldPolygon,
+    )
+
+    display_file_manager.update_projections(
+        center_of_projection=window.center_of_projection,
+        window_width=window.get_width(),
+        window_height=window.get_height(),
+        conversion_mtx=window.conversion_mtx,
+    )
+
+    for obj in (line, polygon):
+        assert len(obj.projection_points)
+        assert np.all(np.isfinite(obj.projection_points))
+    assert line.get_clipped_representation()
+    assert polygon.get_clipped_representation()
+
+
+if __name__ == "__main__":
+    test_segments_match_the_reference()
+    test_segments_in_front_are_unchanged()
+    test_polygons_match_the_reference()
+    test_triangle_with_vertices_behind_the_plane()
+    test_objects_crossing_the_cop_plane_have_finite_projections()
+    print("OK")
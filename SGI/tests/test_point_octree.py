@@ -0,0 +1,164 @@
+"""
+Testes da octree das nuvens de pontos: estrutura dos nós, descarte dos nós fora do volume de
+visualização (nenhum ponto visível é perdido) e cota de pontos proporcional à área na tela.
+
+Pode ser executado com pytest (de dentro de SGI) ou diretamente: python tests/test_point_octree.py
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.point_octree import OCTREE_LEAF_CAPACITY, PointOctree
+from model.transformation_generator import TransformationGenerator
+from model.window import Window
+from view.viewport.viewport_bounds import ViewportBounds
+
+VIEWPORT_SIZE = (800, 600)
+NUM_POINTS = 200_000
+
+
+def get_view_projection_matrix(window: Window) -> np.ndarray:
+    """Matriz que leva as coordenadas percebidas à projeção perspectiva da window."""
+
+    return window.conversion_mtx @ (
+        TransformationGenerator.get_perspective_projection_points(
+            center_of_projection=window.center_of_projection,
+            window_width=window.get_width(),
+            window_height=window.get_height(),
+        )
+    )
+
+
+def new_window() -> Window:
+    return Window(ViewportBounds(0, 0, *VIEWPORT_SIZE))
+
+
+def get_cloud_points(rng: np.random.Generator) -> np.ndarray:
+    """
+    Nuvem (N, 4) que atravessa a window: parte à frente, parte atrás do COP e parte além das
+    bordas.
+    """
+
+    coordinates = rng.uniform([-40, -30, -30], [40, 30, 60], (NUM_POINTS, 3))
+    return np.column_stack([coordinates, np.ones(NUM_POINTS)])
+
+
+def get_flat_cloud_points(rng: np.random.Generator) -> np.ndarray:
+    """Nuvem (N, 4) numa placa à frente da window, que cobre todo o viewport e vai além dele."""
+
+    coordinates = rng.uniform([-40, -30, 9.9], [40, 30, 10.1], (NUM_POINTS, 3))
+    return np.column_stack([coordinates, np.ones(NUM_POINTS)])
+
+
+def get_points_in_view(
+    points: np.ndarray, view_projection_mtx: np.ndarray
+) -> np.ndarray:
+    """Posições dos pontos que, projetados, caem dentro da window."""
+
+    projected_points = points @ view_projection_mtx
+    in_front = projected_points[:, 3] > 0
+    normalized_points = (
+        projected_points[:, :2]
+        / np.where(in_front, projected_points[:, 3], 1.0)[:, None]
+    )
+    return np.flatnonzero(in_front & np.all(np.abs(normalized_points) <= 1, axis=1))
+
+
+def test_nodes_partition_the_points() -> None:
+    points = get_cloud_points(np.random.default_rng(0))
+    octree = PointOctree(points)
+
+    assert np.array_equal(np.sort(octree.order), np.arange(NUM_POINTS))
+
+    sorted_coordinates = points[octree.order, :3]
+    for node_index, (start, end) in enumerate(octree.node_ranges):
+        node_coordinates = sorted_coordinates[start:end]
+        lowest, highest = octree.node_bounds[node_index]
+        assert np.all(node_coordinates >= lowest)
+        assert np.all(node_coordinates <= highest)
+
+        children = octree.node_children[node_index]
+        children = children[children >= 0]
+        if not len(children):
+            assert end - start <= OCTREE_LEAF_CAPACITY
+            continue
+
+        # Os filhos cobrem o intervalo do pai, em ordem e sem sobreposição
+        child_ranges = octree.node_ranges[np.sort(children)]
+        assert child_ranges[0, 0] == start
+        assert child_ranges[-1, 1] == end
+        assert np.array_equal(child_ranges[1:, 0], child_ranges[:-1, 1])
+
+
+def test_no_visible_point_is_culled() -> None:
+    points = get_cloud_points(np.random.default_rng(1))
+    octree = PointOctree(points)
+
+    windows = [new_window()]
+    for angle, rotation_type in [(40, "horizontal"), (-70, "vertical")]:
+        window = new_window()
+        window.apply_rotation(angle, rotation_type)
+        windows.append(window)
+
+    for window in windows:
+        view_projection_mtx = get_view_projection_matrix(window)
+        # Células minúsculas: a cota nunca limita, só o descarte atua
+        positions, _ = octree.select_points(
+            view_projection_mtx, VIEWPORT_SIZE, cell_size=1e-3
+        )
+
+        assert len(np.unique(positions)) == len(positions)
+        visible_positions = get_points_in_view(points, view_projection_mtx)
+        assert np.all(np.isin(visible_positions, positions))
+        # Parte da nuvem está fora e é descartada
+        assert len(positions) < NUM_POINTS
+
+
+def test_cloud_outside_the_view_volume_selects_nothing() -> None:
+    points = get_cloud_points(np.random.default_rng(2))
+    # Inteiramente atrás do COP (em z = -10)
+    points[:, 2] -= 100
+    octree = PointOctree(points)
+
+    positions, nodes_tested = octree.select_points(
+        get_view_projection_matrix(new_window()), VIEWPORT_SIZE, cell_size=1e-3
+    )
+
+    assert len(positions) == 0
+    assert nodes_tested == 1
+
+
+def test_point_budget_follows_the_cell_size() -> None:
+    points = get_flat_cloud_points(np.random.default_rng(3))
+    octree = PointOctree(points)
+    view_projection_mtx = get_view_projection_matrix(new_window())
+    visible_count = len(get_points_in_view(points, view_projection_mtx))
+
+    for cell_size in [2, 4, 8, 16]:
+        positions, nodes_tested = octree.select_points(
+            view_projection_mtx, VIEWPORT_SIZE, cell_size
+        )
+        viewport_cells = VIEWPORT_SIZE[0] * VIEWPORT_SIZE[1] / cell_size**2
+        selected_visible_count = len(
+            get_points_in_view(points[positions], view_projection_mtx)
+        )
+
+        assert len(np.unique(positions)) == len(positions)
+        # No máximo um ponto por célula do viewport, com a sobra do arredondamento da cota de
+        # cada nó; nós que cruzam a borda também escolhem pontos fora dela
+        assert selected_visible_count <= viewport_cells + nodes_tested
+        assert len(positions) <= 1.5 * viewport_cells + nodes_tested
+        # A cota é preenchida: o viewport fica coberto
+        assert selected_visible_count >= 0.8 * min(visible_count, viewport_cells)
+
+
+if __name__ == "__main__":
+    test_nodes_partition_the_points()
+    test_no_visible_point_is_culled()
+    test_cloud_outside_the_view_volume_selects_nothing()
+    test_point_budget_follows_the_cell_size()
+    print("OK")
@@ -0,0 +1,133 @@
+"""
+Testes das rotações: a matriz de rotação em torno de um eixo arbitrário, construída pela
+fórmula de Rodrigues, é comparada com a composição das 7 matrizes usada originalmente, e a
+orientação da window, composta como quatérnio, é verificada após muitas rotações seguidas.
+
+Pode ser executado com pytest (de dentro de SGI) ou diretamente: python tests/test_rotations.py
+Com a variável de ambiente SGI_SLOW_TESTS=1, o teste de acúmulo de erro aplica 1 000 000 de
+rotações à window (algumas dezenas de segundos), em vez de 10 000.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.transformation_generator import TransformationGenerator
+from model.window import Window
+from view.viewport.viewport_bounds import ViewportBounds
+
+# Quantidade de rotações aplicadas à window no teste de acúmulo de erro
+WINDOW_ROTATION_STEPS = 1_000_000 if os.environ.get("SGI_SLOW_TESTS") else 10_000
+
+
+def get_composed_rotation_matrix(
+    angle_degrees: float,
+    p1: tuple[float, float, float],
+    p2: tuple[float, float, float],
+) -> np.ndarray:
+    """
+    Obtém a matriz de rotação em torno de um eixo arbitrário como composição de 7 matrizes:
+    translação de p1 para a origem, alinhamento do eixo com y (rotações em x e em z), rotação
+    em torno de y e o desfazer do alinhamento e da translação.
+    @param angle_degrees: Ângulo de rotação em graus.
+    @param p1: Ponto 1 (x, y, z) que define o eixo de rotação.
+    @param p2: Ponto 2 (x, y, z) que define o eixo de rotação.
+    @return: Matriz de rotação em torno do eixo arbitrário.
+    """
+
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+
+    theta_x = np.arctan2(z2 - z1, y2 - y1)
+    rotate_x = TransformationGenerator.get_x_axis_rotation_matrix(-np.degrees(theta_x))
+
+    axis_after_rx = np.array([x2 - x1, y2 - y1, z2 - z1, 0]) @ rotate_x
+    theta_z = np.arctan2(axis_after_rx[0], axis_after_rx[1])
+
+    return (
+        TransformationGenerator.get_translation_matrix(dx=-x1, dy=-y1, dz=-z1)
+        @ rotate_x
+        @ TransformationGenerator.get_z_axis_rotation_matrix(np.degrees(theta_z))
+        @ TransformationGenerator.get_y_axis_rotation_matrix(angle_degrees)
+        @ TransformationGenerator.get_z_axis_rotation_matrix(-np.degrees(theta_z))
+        @ TransformationGenerator.get_x_axis_rotation_matrix(np.degrees(theta_x))
+        @ TransformationGenerator.get_translation_matrix(dx=x1, dy=y1, dz=z1)
+    )
+
+
+def assert_same_rotation(
+    angle_degrees: float,
+    p1: tuple[float, float, float],
+    p2: tuple[float, float, float],
+) -> None:
+    """
+    Verifica se as duas construções da rotação em torno de um eixo arbitrário coincidem.
+    """
+
+    np.testing.assert_allclose(
+        TransformationGenerator.get_arbitrary_rotation_matrix(angle_degrees, p1, p2),
+        get_composed_rotation_matrix(angle_degrees, p1, p2),
+        atol=1e-9,
+        err_msg=f"ângulo {angle_degrees}, eixo {p1} -> {p2}",
+    )
+
+
+def test_arbitrary_rotation_matches_composition_on_random_axes() -> None:
+    rng = np.random.default_rng(0)
+
+    for _ in range(2000):
+        angle = rng.uniform(-720, 720)
+        p1 = tuple(rng.uniform(-100, 100, 3))
+        p2 = tuple(np.array(p1) + rng.normal(size=3) * rng.choice([1e-3, 1, 100]))
+        assert_same_rotation(angle, p1, p2)
+
+
+def test_arbitrary_rotation_matches_composition_on_degenerate_cases() -> None:
+    # Eixos paralelos aos eixos coordenados, eixos sobre os planos coordenados (onde um dos
+    # arcos tangentes da composição recebe (0, 0)) e eixo nulo, tratado como paralelo a y
+    directions = [
+        (1, 0, 0),
+        (-1, 0, 0),
+        (0, 1, 0),
+        (0, -1, 0),
+        (0, 0, 1),
+        (0, 0, -1),
+        (1, 1, 0),
+        (1, 0, 1),
+        (0, 1, 1),
+        (-2, 0, 3),
+        (0, 0, 0),
+    ]
+    angles = [0, 90, -90, 180, -180, 360, 720, 1e-9, 45.5]
+
+    for p1 in [(0, 0, 0), (3, -4, 5)]:
+        for direction in directions:
+            p2 = tuple(np.add(p1, direction))
+            for angle in angles:
+                assert_same_rotation(angle, p1, p2)
+
+
+def test_window_orientation_stays_orthonormal() -> None:
+    window = Window(ViewportBounds(0, 0, 800, 600))
+    rotation_types = ("horizontal", "vertical", "spin")
+    angles = {rotation_type: 0.0 for rotation_type in rotation_types}
+    rng = np.random.default_rng(0)
+
+    for step in range(WINDOW_ROTATION_STEPS):
+        rotation_type = rotation_types[step % 3]
+        angles[rotation_type] += rng.uniform(-7, 7)
+        window.apply_rotation(angles[rotation_type], rotation_type)
+
+    rotation = window.conversion_mtx[:3, :3]
+    np.testing.assert_allclose(rotation @ rotation.T, np.identity(3), atol=1e-12)
+    assert abs(np.linalg.det(rotation) - 1) < 1e-12
+
+
+if __name__ == "__main__":
+    test_arbitrary_rotation_matches_composition_on_random_axes()
+    test_arbitrary_rotation_matches_composition_on_degenerate_cases()
+    test_window_orientation_stays_orthonormal()
+    print("OK")
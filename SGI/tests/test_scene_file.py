@@ -0,0 +1,199 @@
+"""
+Testes do arquivo de cena (.sgi): uma cena com objetos de todos os tipos, transformados, é
+salva e lida de volta (de uma vez e sob demanda), e cada objeto lido é comparado com o
+original: tipo, nome, cor, preenchimento, arestas, dimensões e pontos, sem perda de precisão.
+
+Pode ser executado com pytest (de dentro de SGI) ou diretamente: python tests/test_scene_file.py
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.display_file_manager import DisplayFileManager
+from model.scene_file import SceneFile
+from model.window import Window
+from model.world_objects.world_bezier_curve import WorldBezierCurve
+from model.world_objects.world_bezier_surface import WorldBezierSurface
+from model.world_objects.world_bicubic_surface import WorldBicubicSurface
+from model.world_objects.world_bspline_curve import WorldBSplineCurve
+from model.world_objects.world_line import WorldLine
+from model.world_objects.world_object import WorldObject
+from model.world_objects.world_point import WorldPoint
+from model.world_objects.world_point_cloud import WorldPointCloud
+from model.world_objects.world_polygon import WorldPolygon
+from model.world_objects.world_wireframe import WorldWireframe
+from view.viewport.viewport_bounds import ViewportBounds
+
+VIEWPORT_BOUNDS = ViewportBounds(0, 0, 800, 600)
+
+
+def new_scene() -> DisplayFileManager:
+    """Display file com um objeto de cada tipo, todos girados em torno de um eixo arbitrário."""
+
+    display_file_manager = DisplayFileManager(VIEWPORT_BOUNDS)
+    rng = np.random.default_rng(0)
+
+    def get_points(num_points: int) -> list[tuple]:
+        return [tuple(point) for point in rng.uniform(-10, 10, (num_points, 3))]
+
+    def get_grid(rows: int, cols: int) -> list:
+        return rng.uniform(-10, 10, (rows, cols, 3)).tolist()
+
+    object_specs = [
+        (WorldPoint, get_points(1), "ponto", (255, 0, 0), False, None),
+        (WorldLine, get_points(2), "reta", (0, 255, 0), False, None),
+        (WorldPolygon, get_points(5), "polígono vazado", (0, 0, 255), False, None),
+        (WorldPolygon, get_points(4), "polígono preenchido", (1, 2, 3), True, None),
+        (
+            WorldWireframe,
+            get_points(6),
+            "wireframe ✓",
+            (10, 20, 30),
+            False,
+            [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 0), (0, 3)],
+        ),
+        (WorldBezierCurve, get_points(7), "bezier", (40, 50, 60), False, None),
+        (WorldBSplineCurve, get_points(6), "bspline", (70, 80, 90), False, None),
+        (
+            WorldBezierSurface,
+            get_grid(4, 4),
+            "superfície bezier",
+            (0, 0, 0),
+            False,
+            None,
+        ),
+        (
+            WorldBicubicSurface,
+            get_grid(5, 7),
+            "superfície bicúbica",
+            (9, 9, 9),
+            False,
+            None,
+        ),
+        (WorldPointCloud, get_points(5000), "nuvem", (200, 100, 0), False, None),
+        (WorldPoint, get_points(1), "", (0, 0, 0), False, None),
+    ]
+
+    for object_type, points, name, color, is_filled, edges in object_specs:
+        display_file_manager.add_object(
+            points=points,
+            name=name,
+            color=color,
+            is_filled=is_filled,
+            object_type=object_type,
+            edges=edges,
+        )
+
+    display_file_manager.apply_group_transformation(
+        list(display_file_manager.display_file),
+        [
+            {
+                "type": "rotation",
+                "angle": 33.3,
+                "axis": "arbitrary",
+                "x1": 1,
+                "y1": 2,
+                "z1": 3,
+                "x2": -4,
+                "y2": 5,
+                "z2": 0.5,
+            }
+        ],
+        Window(VIEWPORT_BOUNDS).conversion_mtx,
+    )
+
+    return display_file_manager
+
+
+def assert_same_object(obj: WorldObject, original: WorldObject) -> None:
+    """Verifica se um objeto lido do arquivo é igual ao original."""
+
+    assert obj.__class__ is original.__class__
+    assert obj.name == original.name
+    assert tuple(obj.color) == tuple(original.color)
+    assert getattr(obj, "is_filled", False) == getattr(original, "is_filled", False)
+    assert np.array_equal(obj.perceived_points, original.perceived_points)
+
+    if isinstance(original, WorldWireframe):
+        assert np.array_equal(obj.edges, original.edges)
+    if isinstance(original, WorldBicubicSurface):
+        assert (
+            obj.control_points_matrix_nxm.shape
+            == original.control_points_matrix_nxm.shape
+        )
+
+
+def test_scene_round_trip() -> None:
+    display_file_manager = new_scene()
+    originals = list(display_file_manager.display_file.values())
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "cena.sgi")
+        display_file_manager.write_display_file_to_scene(filepath)
+
+        objects = DisplayFileManager(VIEWPORT_BOUNDS).load_objects_from_file(filepath)
+
+    assert len(objects) == len(originals)
+    for obj, original in zip(objects, originals):
+        assert_same_object(obj, original)
+
+
+def test_lazy_scene_round_trip() -> None:
+    display_file_manager = new_scene()
+    originals = list(display_file_manager.display_file.values())
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "cena.sgi")
+        display_file_manager.write_display_file_to_scene(filepath)
+
+        lazy_objects = DisplayFileManager(VIEWPORT_BOUNDS).load_objects_from_file(
+            filepath, lazy=True
+        )
+        assert len(lazy_objects) == len(originals)
+
+        # Os representantes já têm a caixa envolvente justa do objeto, antes de carregá-lo
+        for lazy_object, original in zip(lazy_objects, originals):
+            coordinates = original.perceived_points[:, :3]
+            assert lazy_object.name == original.name
+            np.testing.assert_allclose(
+                lazy_object.bounds, [coordinates.min(axis=0), coordinates.max(axis=0)]
+            )
+
+        # Carregados fora de ordem, como ao entrarem no volume de visualização
+        for index in reversed(range(len(lazy_objects))):
+            assert_same_object(lazy_objects[index].load(), originals[index])
+
+
+def test_empty_scene_round_trip() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "vazia.sgi")
+        SceneFile.write(filepath, [])
+
+        assert SceneFile.read(filepath) == []
+
+
+def test_invalid_file_is_rejected() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "cena.sgi")
+        with open(filepath, "wb") as f:
+            f.write(b"v 0 0 0\n" * 16)
+
+        try:
+            SceneFile.read(filepath)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("arquivo inválido aceito")
+
+
+if __name__ == "__main__":
+    test_scene_round_trip()
+    test_lazy_scene_round_trip()
+    test_empty_scene_round_trip()
+    test_invalid_file_is_rejected()
+    print("OK")
@@ -1,23 +1,22 @@
-from PyQt6 import QtCore, QtGui
+from PyQt6 import QtGui
 from view.graphical_objects.graphical_object import GraphicalObject
+from view.graphical_objects.render_batch import RenderBatch
 
 
 class GraphicalCurve(GraphicalObject):
     """Classe que representa uma curva no viewport."""
 
+    __slots__ = ()
+
+    primitive_type = RenderBatch.POLYLINE
+
     def draw(self, painter: QtGui.QPainter) -> None:
         """
         Desenha a curva como uma sequência de linhas conectando os pontos calculados.
         """
 
         path = QtGui.QPainterPath()
-
-        path.moveTo(
-            QtCore.QPointF(self.viewport_points[0][0], self.viewport_points[0][1])
-        )
-
-        for point in self.viewport_points[1:]:
-            path.lineTo(QtCore.QPointF(point[0], point[1]))
+        path.addPolygon(self.get_packed_polygon(self.viewport_points))
 
         painter.setPen(self.get_pen())
         painter.drawPath(path)
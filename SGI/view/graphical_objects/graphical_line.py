@@ -1,10 +1,15 @@
 from PyQt6 import QtCore, QtGui
 from view.graphical_objects.graphical_object import GraphicalObject
+from view.graphical_objects.render_batch import RenderBatch
 
 
 class GraphicalLine(GraphicalObject):
     """Classe que representa o segmento de reta no viewport."""
 
+    __slots__ = ()
+
+    primitive_type = RenderBatch.LINES
+
     def draw(self, painter: QtGui.QPainter) -> None:
         """Desenha o segmento de reta no viewport."""
 
@@ -0,0 +1,21 @@
+from PyQt6 import QtGui
+from view.graphical_objects.graphical_object import GraphicalObject
+from view.graphical_objects.render_batch import RenderBatch
+
+
+class GraphicalLineSegments(GraphicalObject):
+    """
+    Classe que representa um conjunto de segmentos de reta independentes no viewport (as
+    arestas visíveis de um wireframe, por exemplo). Os pontos vêm aos pares: o segmento k liga
+    os pontos 2k e 2k + 1.
+    """
+
+    __slots__ = ()
+
+    primitive_type = RenderBatch.LINES
+
+    def draw(self, painter: QtGui.QPainter) -> None:
+        """Desenha todos os segmentos com uma única chamada ao pintor."""
+
+        painter.setPen(self.get_pen())
+        painter.drawLines(self.get_packed_polygon(self.viewport_points))
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
 from PyQt6 import QtGui
 
 
@@ -11,15 +12,20 @@ class GraphicalObject(ABC):
     draw() de cada objeto gráfico).
     """
 
+    __slots__ = ("viewport_points", "color")
+
+    # Tipo de primitiva dos pontos do objeto num lote de desenho (ver RenderBatch)
+    primitive_type: int
+
     def __init__(
         self,
-        viewport_points: list[tuple[float, float, float]],
+        viewport_points: np.ndarray | list[tuple[float, float]],
         color: tuple[int, int, int],
     ):
         """
-        @param viewport_points: Lista de pontos do objeto NO VIEWPORT (e não no mundo). Pode
-        ser uma lista simples, não havendo necessidade de usarmos np.array. Isso porque
-        não faremos cálculos com esses pontos, já que isso é responsabilidade do Model.
+        @param viewport_points: Pontos do objeto NO VIEWPORT (e não no mundo), como array
+        (N, 2), que é o que o Model produz, ou como lista de tuplas. Não faremos cálculos com
+        esses pontos, já que isso é responsabilidade do Model.
         @param color: Cor do objeto gráfico. Deve ser uma tupla com três valores inteiros: (R, G, B)
         """
 
@@ -39,11 +45,44 @@ class GraphicalObject(ABC):
         @return: Caneta com a cor do objeto.
         """
 
-        pen = QtGui.QPen(QtGui.QColor(*self.color))
+        return self.get_color_pen(self.color)
+
+    @staticmethod
+    def get_color_pen(color: tuple[int, int, int]) -> QtGui.QPen:
+        """
+        Retorna a caneta usada para desenhar objetos de uma cor.
+        @param color: Cor: (R, G, B).
+        @return: Caneta com a cor dada.
+        """
+
+        pen = QtGui.QPen(QtGui.QColor(*color))
         pen.setWidth(3)
         return pen
 
-    def update_points(self, points: list[tuple[float, float]]) -> None:
+    def update_points(self, points: np.ndarray | list[tuple[float, float]]) -> None:
         """Atualiza os pontos do objeto gráfico."""
 
         self.viewport_points = points
+
+    @staticmethod
+    def get_packed_polygon(
+        points: np.ndarray | list[tuple[float, float]],
+    ) -> QtGui.QPolygonF:
+        """
+        Monta um QPolygonF a partir de um array de pontos. O QPolygonF é preenchido direto pela
+        sua memória (um par de doubles por QPointF), sem criar um QPointF por ponto.
+        @param points: Array (N, 2) (ou lista de tuplas) com os pontos no viewport.
+        @return: Polígono com os N pontos, na mesma ordem.
+        """
+
+        polygon = QtGui.QPolygonF()
+        if not len(points):
+            return polygon
+
+        polygon.resize(len(points))
+        buffer = polygon.data()
+        buffer.setsize(len(points) * 2 * np.dtype(np.float64).itemsize)
+        np.frombuffer(buffer, dtype=np.float64)[:] = np.ravel(
+            np.asarray(points, dtype=np.float64)
+        )
+        return polygon
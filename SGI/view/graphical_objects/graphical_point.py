@@ -1,10 +1,15 @@
 from PyQt6 import QtCore, QtGui
 from view.graphical_objects.graphical_object import GraphicalObject
+from view.graphical_objects.render_batch import RenderBatch
 
 
 class GraphicalPoint(GraphicalObject):
     """Classe que representa um ponto no viewport."""
 
+    __slots__ = ()
+
+    primitive_type = RenderBatch.POINTS
+
     def draw(self, painter: QtGui.QPainter) -> None:
         """Desenha o ponto no viewport."""
         x, y = self.viewport_points[0]
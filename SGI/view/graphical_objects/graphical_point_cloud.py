@@ -0,0 +1,17 @@
+from PyQt6 import QtGui
+from view.graphical_objects.graphical_object import GraphicalObject
+from view.graphical_objects.render_batch import RenderBatch
+
+
+class GraphicalPointCloud(GraphicalObject):
+    """Classe que representa uma nuvem de pontos no viewport."""
+
+    __slots__ = ()
+
+    primitive_type = RenderBatch.POINTS
+
+    def draw(self, painter: QtGui.QPainter) -> None:
+        """Desenha todos os pontos da nuvem com uma única chamada ao pintor."""
+
+        painter.setPen(self.get_pen())
+        painter.drawPoints(self.get_packed_polygon(self.viewport_points))
@@ -1,13 +1,19 @@
-from PyQt6 import QtCore, QtGui
+import numpy as np
+from PyQt6 import QtGui
 from view.graphical_objects.graphical_object import GraphicalObject
+from view.graphical_objects.render_batch import RenderBatch
 
 
 class GraphicalWireframe(GraphicalObject):
     """Classe que representa um wireframe no viewport."""
 
+    __slots__ = ("is_filled",)
+
+    primitive_type = RenderBatch.POLYGON
+
     def __init__(
         self,
-        viewport_points: list[tuple[float, float, float]],
+        viewport_points: np.ndarray | list[tuple[float, float]],
         color: tuple[int, int, int],
         is_filled: bool,
     ):
@@ -22,19 +28,10 @@ class GraphicalWireframe(GraphicalObject):
 
         path = QtGui.QPainterPath()
 
-        # Move para o primeiro ponto
-        path.moveTo(
-            QtCore.QPointF(self.viewport_points[0][0], self.viewport_points[0][1])
-        )
-
-        # Adiciona linhas para os pontos restantes
-        for point in self.viewport_points[1:]:
-            path.lineTo(QtCore.QPointF(point[0], point[1]))
-
-        # Retorna ao primeiro ponto para fechar o polígono
-        path.lineTo(
-            QtCore.QPointF(self.viewport_points[0][0], self.viewport_points[0][1])
-        )
+        # Caminho que passa por todos os pontos, em ordem, e retorna ao primeiro ponto para
+        # fechar o polígono
+        path.addPolygon(self.get_packed_polygon(self.viewport_points))
+        path.closeSubpath()
 
         painter.setPen(self.get_pen())
 
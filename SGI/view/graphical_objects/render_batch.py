@@ -0,0 +1,186 @@
+import numpy as np
+from PyQt6 import QtCore, QtGui
+from view.graphical_objects.graphical_object import GraphicalObject
+
+
+class RenderBatch:
+    """
+    Lote compacto com todas as primitivas de um quadro, montado pelo Model e desenhado pelo
+    Viewport. Em vez de um objeto gráfico (com sua própria lista de pontos) por linha, ponto ou
+    polígono, o lote guarda arrays: os vértices de todas as primitivas, em sequência (vertices),
+    o início dos vértices de cada primitiva (offsets), o tipo de cada primitiva, o índice da sua
+    cor em colors e se ela é preenchida.
+    """
+
+    # Tipos de primitiva: pontos isolados; segmentos independentes, em que o segmento k liga
+    # os vértices 2k e 2k + 1; polilinha aberta; e polígono fechado, preenchido ou não
+    POINTS = 0
+    LINES = 1
+    POLYLINE = 2
+    POLYGON = 3
+
+    def __init__(self):
+        self.vertices = np.empty((0, 2))
+        self.offsets = np.zeros(1, dtype=np.intp)
+        self.primitive_types = np.empty(0, dtype=np.uint8)
+        self.color_indices = np.empty(0, dtype=np.int32)
+        self.filled = np.empty(0, dtype=bool)
+        self.colors: list[tuple[int, int, int]] = []
+
+        self._color_indices: dict[tuple[int, int, int], int] = {}
+        # Partes adicionadas desde o último pack: (vértices, quantidade de vértices de cada
+        # primitiva, tipo, índice da cor, preenchimento)
+        self._pending_chunks: list[tuple] = []
+        # Polígono do Qt com todos os vértices, montado no primeiro desenho
+        self._packed_polygon: QtGui.QPolygonF | None = None
+
+    def __len__(self) -> int:
+        self.pack()
+        return len(self.primitive_types)
+
+    def add_primitives(
+        self,
+        primitive_type: int,
+        vertices: np.ndarray,
+        color: tuple[int, int, int],
+        offsets: np.ndarray | None = None,
+        is_filled: bool = False,
+    ) -> None:
+        """
+        Adiciona ao lote primitivas de um mesmo tipo e cor.
+        @param primitive_type: Tipo das primitivas (POINTS, LINES, POLYLINE ou POLYGON).
+        @param vertices: Array (N, 2) com os vértices, em coordenadas do viewport.
+        @param color: Cor das primitivas: (R, G, B).
+        @param offsets: Array (K + 1,) com o início dos vértices de cada primitiva, seguido de
+        N. Se None, todos os vértices formam uma única primitiva.
+        @param is_filled: Se os polígonos são preenchidos.
+        """
+
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        if not len(vertices):
+            return
+
+        if offsets is None:
+            vertex_counts = np.array([len(vertices)])
+        else:
+            vertex_counts = np.diff(offsets)
+
+        color = tuple(color)
+        color_index = self._color_indices.get(color)
+        if color_index is None:
+            color_index = self._color_indices[color] = len(self.colors)
+            self.colors.append(color)
+
+        self._pending_chunks.append(
+            (vertices, vertex_counts, primitive_type, color_index, is_filled)
+        )
+
+    def add_graphical_objects(self, graphical_objects: list[GraphicalObject]) -> None:
+        """
+        Adiciona ao lote os pontos de objetos gráficos, cada um como uma primitiva do tipo
+        dado pela sua classe (ver GraphicalObject.primitive_type).
+        @param graphical_objects: Objetos gráficos a serem adicionados.
+        """
+
+        for graphical_object in graphical_objects:
+            self.add_primitives(
+                graphical_object.primitive_type,
+                graphical_object.viewport_points,
+                graphical_object.color,
+                is_filled=getattr(graphical_object, "is_filled", False),
+            )
+
+    def pack(self) -> None:
+        """Concatena aos arrays do lote as partes adicionadas desde a última chamada."""
+
+        if not self._pending_chunks:
+            return
+
+        vertices, vertex_counts, primitive_types, color_indices, filled = zip(
+            *self._pending_chunks
+        )
+        primitive_counts = [len(counts) for counts in vertex_counts]
+        vertex_counts = np.concatenate(vertex_counts)
+
+        self.vertices = np.concatenate([self.vertices, *vertices])
+        self.offsets = np.concatenate(
+            [self.offsets, self.offsets[-1] + np.cumsum(vertex_counts)]
+        )
+        self.primitive_types = np.concatenate(
+            [self.primitive_types, np.repeat(primitive_types, primitive_counts)]
+        ).astype(np.uint8)
+        self.color_indices = np.concatenate(
+            [self.color_indices, np.repeat(color_indices, primitive_counts)]
+        ).astype(np.int32)
+        self.filled = np.concatenate(
+            [self.filled, np.repeat(filled, primitive_counts)]
+        ).astype(bool)
+
+        self._pending_chunks.clear()
+        self._packed_polygon = None
+
+    def draw(self, painter: QtGui.QPainter) -> None:
+        """
+        Desenha todas as primitivas do lote, na ordem em que foram adicionadas. Primitivas
+        consecutivas de mesmo tipo, cor e preenchimento formam uma sequência, desenhada com uma
+        única troca de caneta; sequências de pontos ou segmentos são desenhadas com uma única
+        chamada ao pintor.
+        @param painter: O pintor que desenhará as primitivas.
+        """
+
+        self.pack()
+        primitive_count = len(self.primitive_types)
+        if not primitive_count:
+            return
+
+        if self._packed_polygon is None:
+            self._packed_polygon = GraphicalObject.get_packed_polygon(self.vertices)
+        polygon = self._packed_polygon
+
+        pens = [GraphicalObject.get_color_pen(color) for color in self.colors]
+        no_brush = QtGui.QBrush(QtCore.Qt.BrushStyle.NoBrush)
+
+        # Início de cada sequência de primitivas com mesmo tipo, cor e preenchimento
+        changes = np.flatnonzero(
+            (np.diff(self.primitive_types) != 0)
+            | (np.diff(self.color_indices) != 0)
+            | (np.diff(self.filled.astype(np.int8)) != 0)
+        )
+        run_starts = np.concatenate([[0], changes + 1]).tolist()
+        run_ends = np.concatenate([changes + 1, [primitive_count]]).tolist()
+        offsets = self.offsets.tolist()
+
+        for start, end in zip(run_starts, run_ends):
+            primitive_type = self.primitive_types[start]
+            color_index = self.color_indices[start]
+            painter.setPen(pens[color_index])
+
+            if primitive_type == self.POINTS:
+                painter.drawPoints(
+                    polygon.mid(offsets[start], offsets[end] - offsets[start])
+                )
+                continue
+            if primitive_type == self.LINES:
+                painter.drawLines(
+                    polygon.mid(offsets[start], offsets[end] - offsets[start])
+                )
+                continue
+
+            if primitive_type == self.POLYGON and self.filled[start]:
+                fill_color = QtGui.QColor(*self.colors[color_index])
+                fill_color.setAlpha(100)
+                painter.setBrush(QtGui.QBrush(fill_color))
+            else:
+                painter.setBrush(no_brush)
+
+            draw_primitive = (
+                painter.drawPolyline
+                if primitive_type == self.POLYLINE
+                else painter.drawPolygon
+            )
+            for index in range(start, end):
+                draw_primitive(
+                    polygon.mid(offsets[index], offsets[index + 1] - offsets[index])
+                )
+
+        painter.setBrush(no_brush)
@@ -12,10 +12,17 @@ class TransformationDialog(QtWidgets.QDialog):
     Ao confirmar, retorna a lista de transformações a serem aplicadas sequencialmente.
     """
 
-    def __init__(self):
+    def __init__(self, objects_count: int = 1):
+        """
+        @param objects_count: Quantidade de objetos selecionados. Para mais de um, o diálogo
+        permite escolher se escalonamentos e rotações usam o centro do grupo ou o de cada objeto.
+        """
+
         super().__init__()
         uic.loadUi("view/screens/transformations.ui", self)
 
+        self.ownCenterCheckBox.setVisible(objects_count > 1)
+
         self.transformations = (
             []
         )  # Lista para armazenar os dicionários de transformação
@@ -52,6 +59,12 @@ class TransformationDialog(QtWidgets.QDialog):
 
         return self.transformations
 
+    def use_own_centers(self) -> bool:
+        """Retorna se cada objeto deve ser transformado em torno do próprio centro."""
+        return (
+            not self.ownCenterCheckBox.isHidden() and self.ownCenterCheckBox.isChecked()
+        )
+
     def add_translation(self):
         """Adiciona uma transformação de translação à lista."""
 
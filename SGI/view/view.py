@@ -2,7 +2,7 @@ import sys
 
 from PyQt6 import QtCore, QtWidgets, uic
 from view.creation_dialogs import ObjectDialog
-from view.graphical_objects.graphical_object import GraphicalObject
+from view.graphical_objects.render_batch import RenderBatch
 from view.transform_dialogs import TransformationDialog
 from view.viewport.viewport import Viewport
 
@@ -66,6 +66,7 @@ class View(QtWidgets.QMainWindow):
 
         # Botões de importação e exportação de arquivos
         self.importButton.clicked.connect(self.import_obj_file)
+        self.import_running = False
         self.exportButton.clicked.connect(self.export_obj_file)
 
         self.copDistanceSlider.setMaximum(100)
@@ -109,23 +110,35 @@ class View(QtWidgets.QMainWindow):
         sys.exit(self.app.exec())
 
     def update_view_objects(
-        self, graphical_objs: list[GraphicalObject], obj_list: list[str]
+        self, render_batch: RenderBatch, obj_list: list[tuple[int, str]]
     ) -> None:
         """
-        Atualiza a view com a lista de objetos gráficos.
-        @param graphical_objs: Lista de objetos gráficos a serem exibidos após o clipping.
-        @param obj_list: Lista de objetos a serem exibidos na lista de objetos lateral.
+        Atualiza a view com o lote de desenho do quadro.
+        @param render_batch: Lote com as primitivas a serem exibidas após o clipping.
+        @param obj_list: Lista de tuplas (identificador, texto) dos objetos a serem exibidos na
+        lista de objetos lateral. O identificador fica guardado em cada item.
         """
 
-        self.viewport.update_viewport(graphical_objs)
+        self.viewport.update_viewport(render_batch)
         self.objectsList.clear()
-        self.objectsList.addItems([str(obj) for obj in obj_list])
+        for object_id, obj_text in obj_list:
+            item = QtWidgets.QListWidgetItem(str(obj_text))
+            item.setData(QtCore.Qt.ItemDataRole.UserRole, object_id)
+            self.objectsList.addItem(item)
 
-    def add_log(self, message) -> None:
-        """Adiciona uma mensagem ao log da aplicação"""
+    def add_log(self, message, replace_last: bool = False) -> None:
+        """
+        Adiciona uma mensagem ao log da aplicação
+        @param message: Mensagem a ser adicionada.
+        @param replace_last: Se a mensagem deve substituir a última do log (usado para
+        mensagens de progresso).
+        """
 
         logbox = self.logsBox
-        logbox.addItem(message)
+        if replace_last and logbox.count() > 0:
+            logbox.item(logbox.count() - 1).setText(message)
+        else:
+            logbox.addItem(message)
         logbox.scrollToBottom()  # Faz o log rolar para baixo para mostrar a mensagem mais recente
 
     def on_create_object(self, dialog: ObjectDialog) -> None:
@@ -140,36 +153,47 @@ class View(QtWidgets.QMainWindow):
     def on_remove_object(self) -> None:
         """Trata requisições de remoção de objetos no mundo."""
 
-        selected = [item.row() for item in self.objectsList.selectedIndexes()]
-        selected.sort()
+        selected = sorted(self.objectsList.selectedItems(), key=self.objectsList.row)
 
         if selected == []:
             self.add_log("You must select an object to remove")
             return
 
-        count = 0
-        for index in selected:
-            index -= count
-            text = self.objectsList.item(index).text()
-            self.controller.handle_remove_object(index=index)
+        removed_texts = [item.text() for item in selected]
+        self.controller.handle_remove_objects(
+            object_ids=[item.data(QtCore.Qt.ItemDataRole.UserRole) for item in selected]
+        )
+        for text in removed_texts:
             self.add_log(f"{text} has been removed")
-            count += 1
 
     def on_transform_object(self) -> None:
         """Trata requisições de transformação de objetos no mundo."""
 
-        selected = self.objectsList.currentRow()
+        selected = sorted(self.objectsList.selectedItems(), key=self.objectsList.row)
+        if not selected and self.objectsList.currentItem() is not None:
+            selected = [self.objectsList.currentItem()]
 
-        if selected == -1:
+        if selected == []:
             self.add_log("You must select an object to transform")
             return
 
-        dialog = TransformationDialog()
+        object_ids = [item.data(QtCore.Qt.ItemDataRole.UserRole) for item in selected]
+
+        dialog = TransformationDialog(objects_count=len(object_ids))
         transformations_list = dialog.get_transformations()
 
-        if transformations_list:
+        if not transformations_list:
+            return
+
+        if len(object_ids) == 1:
             self.controller.handle_transformations(
-                index=selected, transformations_list=transformations_list
+                object_id=object_ids[0], transformations_list=transformations_list
+            )
+        else:
+            self.controller.handle_group_transformations(
+                object_ids=object_ids,
+                transformations_list=transformations_list,
+                use_own_centers=dialog.use_own_centers(),
             )
 
     def on_zoom(self, mode: str) -> None:
@@ -259,18 +283,36 @@ class View(QtWidgets.QMainWindow):
             "horizontal", self.horizontalRotationSlider.value()
         )
 
+    def set_import_running(self, running: bool) -> None:
+        """
+        Alterna o botão de importação entre importar e cancelar a importação em andamento.
+        @param running: Se há uma importação em andamento.
+        """
+
+        self.import_running = running
+        self.importButton.setText("Cancel Import" if running else "Import .obj")
+
     def import_obj_file(self) -> None:
-        """Importa um arquivo .obj."""
+        """Importa um arquivo .obj, ou cancela a importação em andamento."""
+
+        if self.import_running:
+            self.controller.handle_cancel_import()
+            return
 
         filepath = self.open_import_file_dialog()
         if filepath:
             self.controller.handle_import_obj_file(filepath)
 
     def export_obj_file(self) -> None:
-        """Exporta um arquivo .obj."""
+        """Exporta um arquivo .obj ou salva a cena no formato binário (.sgi)."""
 
         filepath = self.open_export_file_dialog()
-        if filepath:
+        if not filepath:
+            return
+
+        if filepath.lower().endswith(".sgi"):
+            self.controller.handle_export_scene_file(filepath)
+        else:
             self.controller.handle_export_obj_file(filepath)
 
     def open_import_file_dialog(self) -> str:
@@ -278,31 +320,31 @@ class View(QtWidgets.QMainWindow):
 
         file_dialog = QtWidgets.QFileDialog()
         file_dialog.setFileMode(QtWidgets.QFileDialog.FileMode.ExistingFile)
-        file_dialog.setNameFilter("*.obj")
+        file_dialog.setNameFilter("Scene files (*.obj *.sgi)")
 
         if file_dialog.exec():
             return file_dialog.selectedFiles()[0]
         return None
 
-    def open_export_file_dialog(self) -> tuple[str, str]:
-        """Abre um diálogo para selecionar uma pasta."""
+    def open_export_file_dialog(self) -> str | None:
+        """Abre um diálogo para selecionar o arquivo de destino."""
 
         if self.objectsList.count() == 0:
             self.add_log("You must create an object to export")
-            return None, None
+            return None
 
-        filepath, _ = QtWidgets.QFileDialog.getSaveFileName(
+        filepath, selected_filter = QtWidgets.QFileDialog.getSaveFileName(
             self,
-            "Export Object as OBJ",
+            "Export Objects",
             "export.obj",  # Sugere 'export.obj' no diretório que o diálogo abrir
-            "OBJ Files (*.obj);;All Files (*)",  # Filtros de arquivo
+            "OBJ Files (*.obj);;SGI Scene Files (*.sgi);;All Files (*)",  # Filtros de arquivo
         )
 
         if not filepath:
             return None
 
-        if not filepath.lower().endswith(".obj"):
-            filepath += ".obj"
+        if not filepath.lower().endswith((".obj", ".sgi")):
+            filepath += ".sgi" if "*.sgi" in selected_filter else ".obj"
 
         return filepath
 
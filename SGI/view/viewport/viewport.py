@@ -1,5 +1,5 @@
 from PyQt6 import QtGui, QtWidgets
-from view.graphical_objects.graphical_object import GraphicalObject
+from view.graphical_objects.render_batch import RenderBatch
 from view.viewport.viewport_bounds import ViewportBounds
 
 
@@ -19,7 +19,7 @@ class Viewport(QtWidgets.QWidget):
         self.viewport_bounds: ViewportBounds = (
             None  # Será definido automaticamente no evento resizeEvent
         )
-        self.graphical_objects = []
+        self.render_batch = RenderBatch()
 
     def setup_viewport(self):
         """Configura o viewport."""
@@ -50,9 +50,8 @@ class Viewport(QtWidgets.QWidget):
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
 
-        # Desenha cada objeto
-        for obj in self.graphical_objects:
-            obj.draw(painter)
+        # Desenha todas as primitivas do quadro
+        self.render_batch.draw(painter)
 
         def _draw_viewport_frame(
             painter: QtGui.QPainter, color: QtGui.QColor, width: int, offset: int
@@ -83,7 +82,7 @@ class Viewport(QtWidgets.QWidget):
             painter=painter, color=QtGui.QColor(0, 0, 0), width=1, offset=-1
         )
 
-    def update_viewport(self, objects: list[GraphicalObject]) -> None:
-        """Atualiza o viewport."""
-        self.graphical_objects = objects
+    def update_viewport(self, render_batch: RenderBatch) -> None:
+        """Atualiza o viewport com o lote de desenho do quadro."""
+        self.render_batch = render_batch
         self.update()  # Redesenha o viewport
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
 
 
 @dataclass
@@ -11,3 +13,41 @@ class ViewportBounds:
     y_upper_left: float
     x_lower_right: float
     y_lower_right: float
+
+    # Transformação das coordenadas normalizadas para o viewport e os limites para os quais
+    # ela foi calculada (ver get_normalized_to_viewport_transform)
+    _transform: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _transform_bounds: tuple | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_normalized_to_viewport_transform(self) -> np.ndarray:
+        """
+        Retorna a transformação afim 2D das coordenadas normalizadas ([-1, 1], y para cima)
+        para as coordenadas do viewport (y para baixo), como matriz 3x2: um array (N, 2) de
+        pontos é transformado por points @ transform[:2] + transform[2]. A matriz só é
+        recalculada quando os limites mudam.
+        @return: Matriz 3x2 da transformação.
+        """
+
+        bounds = (
+            self.x_upper_left,
+            self.y_upper_left,
+            self.x_lower_right,
+            self.y_lower_right,
+        )
+        if bounds != self._transform_bounds:
+            half_width = (self.x_lower_right - self.x_upper_left) / 2
+            half_height = (self.y_lower_right - self.y_upper_left) / 2
+            self._transform = np.array(
+                [
+                    [half_width, 0.0],
+                    [0.0, -half_height],
+                    [half_width + self.x_upper_left, half_height + self.y_upper_left],
+                ]
+            )
+            self._transform_bounds = bounds
+
+        return self._transform